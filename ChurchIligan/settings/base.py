@@ -58,7 +58,8 @@ TEMPLATES = [
     {
         'BACKEND': 'django.template.backends.django.DjangoTemplates',
         'DIRS': [BASE_DIR / 'templates'],
-        'APP_DIRS': True,
+        # APP_DIRS must stay off when 'loaders' is set; app_directories.Loader covers it
+        'APP_DIRS': False,
         'OPTIONS': {
             'context_processors': [
                 'django.template.context_processors.csrf',
@@ -67,6 +68,13 @@ TEMPLATES = [
                 'django.contrib.messages.context_processors.messages',
                 'core.views._app_context',  # Custom context processor for PayPal and Stripe
             ],
+            # Parse each template once per worker process instead of on every render
+            'loaders': [
+                ('django.template.loaders.cached.Loader', [
+                    'django.template.loaders.filesystem.Loader',
+                    'django.template.loaders.app_directories.Loader',
+                ]),
+            ],
         },
     },
 ]
@@ -37,13 +37,30 @@ except Exception:
 STATICFILES_STORAGE = 'whitenoise.storage.CompressedStaticFilesStorage'
 
 # Cache configuration for production
-# Use local memory cache for Render free tier (no Redis available)
-CACHES = {
-    'default': {
-        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
-        'LOCATION': 'unique-snowflake',
+# Cache-held invalidation tokens (the notification unread-count ETag version
+# and the per-user app context) must be shared by every gunicorn worker, so
+# use Redis whenever REDIS_URL is configured.
+REDIS_URL = env('REDIS_URL', default='')
+if REDIS_URL:
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+            'LOCATION': REDIS_URL,
+        }
+    }
+else:
+    # Fallback for Render free tier (no Redis available).
+    # KNOWN LIMITATION: LocMemCache is per process. A write handled by one
+    # worker only invalidates that worker's copy, so a notification_count poll
+    # served by another worker can return a stale 304/unread count, and the
+    # sidebar app context can stay stale, until those entries expire (60s for
+    # the unread-count version, 30s for the app context).
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+            'LOCATION': 'unique-snowflake',
+        }
     }
-}
 
 # Email configuration for production
 # NOTE: We use Brevo HTTP API instead of SMTP because Render blocks SMTP ports
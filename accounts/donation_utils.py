@@ -1,10 +1,20 @@
 """
 Utility functions for donation ranking system
 """
+import json
+from bisect import bisect_right
+
+from django.core.cache import cache
 from django.db.models import Sum
 from core.models import Donation
 
 
+# Completed-donation totals change only when a donation is saved or deleted
+# (see core.signals), so they are cached per user
+DONATION_TOTAL_CACHE_KEY = 'donation_total_{user_id}'
+DONATION_TOTAL_CACHE_TIMEOUT = 300
+
+
 # Define ranking tiers (in PHP)
 RANK_TIERS = [
     {'name': 'Bronze Supporter', 'min': 50, 'max': 999, 'color': '#CD7F32', 'icon': 'bronze'},
@@ -15,6 +25,26 @@ RANK_TIERS = [
     {'name': 'Champion of Faith', 'min': 50000, 'max': float('inf'), 'color': '#9D00FF', 'icon': 'champion'},
 ]
 
+RANK_TIERS_BY_ICON = {tier['icon']: tier for tier in RANK_TIERS}
+
+# Tier minimums in ascending order, for bisecting a total into its tier
+_TIERS_BY_MIN = sorted(RANK_TIERS, key=lambda tier: tier['min'])
+_TIER_MINS = [tier['min'] for tier in _TIERS_BY_MIN]
+
+# Tier names/colors/icons for the rankings charts; constant, so serialized once
+RANK_TIERS_JSON = json.dumps([
+    {'name': tier['name'], 'color': tier['color'], 'icon': tier['icon']}
+    for tier in RANK_TIERS
+])
+
+
+def empty_rank_distribution():
+    """Return a fresh per-tier counter dict keyed by tier icon."""
+    return {
+        tier['icon']: {'name': tier['name'], 'color': tier['color'], 'count': 0, 'total_amount': 0}
+        for tier in RANK_TIERS
+    }
+
 
 def get_user_donation_rank(user):
     """
@@ -34,20 +64,82 @@ def get_user_donation_rank(user):
         return None
     
     # Calculate total donations
-    total_donated = Donation.objects.filter(
-        donor=user,
+    total_donated = cache.get_or_set(
+        DONATION_TOTAL_CACHE_KEY.format(user_id=user.id),
+        lambda: _compute_donation_total(user.id),
+        DONATION_TOTAL_CACHE_TIMEOUT
+    )
+    
+    return get_rank_for_total(total_donated)
+
+
+def _compute_donation_total(user_id):
+    """Sum a user's completed donations."""
+    return Donation.objects.filter(
+        donor_id=user_id,
         payment_status='completed'
     ).aggregate(total=Sum('amount'))['total'] or 0
+
+
+def invalidate_donation_rank(user_id):
+    """Drop a user's cached donation total so their rank is recalculated."""
+    cache.delete(DONATION_TOTAL_CACHE_KEY.format(user_id=user_id))
+
+
+def get_rank_for_total(total_donated):
+    """
+    Get the rank tier for a completed-donation total.
+    Returns None if the total is below the lowest tier (₱50).
+    """
+    index = bisect_right(_TIER_MINS, total_donated) - 1
+    return _TIERS_BY_MIN[index] if index >= 0 else None
+
+
+def get_user_donation_ranks(users):
+    """
+    Get donation ranks for several users with a single aggregate query.
+    Applies the same rules as get_user_donation_rank (profile opt-in, ₱50
+    minimum). Load users with select_related('profile') to avoid a profile
+    query per user.
     
-    # Determine rank
-    if total_donated < 50:
-        return None
+    Returns dict mapping user id to rank dict (or None).
+    """
+    ranks = {}
+    eligible_ids = []
+    for user in users:
+        ranks[user.id] = None
+        try:
+            if user.profile.show_donation_rank:
+                eligible_ids.append(user.id)
+        except Exception:
+            continue
+    
+    if not eligible_ids:
+        return ranks
+    
+    keys = {DONATION_TOTAL_CACHE_KEY.format(user_id=user_id): user_id for user_id in eligible_ids}
+    cached = cache.get_many(keys)
+    totals = {keys[key]: total for key, total in cached.items()}
+    
+    missing_ids = [user_id for user_id in eligible_ids if user_id not in totals]
+    if missing_ids:
+        fetched = dict.fromkeys(missing_ids, 0)
+        rows = Donation.objects.filter(
+            donor_id__in=missing_ids,
+            payment_status='completed'
+        ).values('donor_id').annotate(total=Sum('amount'))
+        for row in rows:
+            fetched[row['donor_id']] = row['total'] or 0
+        cache.set_many(
+            {DONATION_TOTAL_CACHE_KEY.format(user_id=user_id): total for user_id, total in fetched.items()},
+            DONATION_TOTAL_CACHE_TIMEOUT
+        )
+        totals.update(fetched)
     
-    for tier in RANK_TIERS:
-        if tier['min'] <= total_donated <= tier['max']:
-            return tier
+    for user_id, total in totals.items():
+        ranks[user_id] = get_rank_for_total(total)
     
-    return None
+    return ranks
 
 
 def get_rank_badge_html(rank, size='small'):
@@ -1,4 +1,5 @@
 from django.contrib import admin
+from django.db.models import Count, Q
 from .models import (
     Church,
     ChurchFollow,
@@ -108,6 +109,11 @@ class ServiceCategoryAdmin(admin.ModelAdmin):
             'classes': ('collapse',)
         }),
     )
+    
+    def get_queryset(self, request):
+        return super().get_queryset(request).annotate(
+            active_services_count=Count('services', filter=Q(services__is_active=True))
+        )
 
 
 class ServiceImageInline(admin.TabularInline):
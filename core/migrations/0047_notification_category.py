@@ -0,0 +1,66 @@
+# Generated by Django 5.2.6 on 2026-10-16 19:15
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+NOTIFICATION_TYPE_CATEGORIES = {
+    "booking_requested": 1,
+    "booking_reviewed": 1,
+    "booking_approved": 1,
+    "booking_declined": 1,
+    "booking_canceled": 1,
+    "booking_completed": 1,
+    "church_approved": 2,
+    "church_declined": 2,
+    "follow_request": 3,
+    "follow_accepted": 3,
+    "message_received": 4,
+}
+
+
+def populate_notification_category(apps, schema_editor):
+    """Backfill category from notification_type with one UPDATE per bucket."""
+    Notification = apps.get_model("core", "Notification")
+    by_category = {}
+    for notification_type, category in NOTIFICATION_TYPE_CATEGORIES.items():
+        by_category.setdefault(category, []).append(notification_type)
+    for category, notification_types in by_category.items():
+        Notification.objects.filter(notification_type__in=notification_types).update(
+            category=category
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("core", "0046_message_read_at"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="notification",
+            name="category",
+            field=models.PositiveSmallIntegerField(
+                choices=[
+                    (0, "Other"),
+                    (1, "Bookings"),
+                    (2, "Church"),
+                    (3, "Follows"),
+                    (4, "Messages"),
+                ],
+                default=0,
+                editable=False,
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="notification",
+            index=models.Index(
+                fields=["user", "category"], name="core_notifi_user_id_c596c9_idx"
+            ),
+        ),
+        migrations.RunPython(
+            populate_notification_category, migrations.RunPython.noop
+        ),
+    ]
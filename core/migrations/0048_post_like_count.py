@@ -0,0 +1,38 @@
+# Generated by Django 5.2.6 on 2026-10-16 19:18
+
+from django.db import migrations, models
+from django.db.models import Count, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+
+
+def backfill_like_count(apps, schema_editor):
+    """Populate like_count from existing PostLike rows in a single UPDATE."""
+    Post = apps.get_model("core", "Post")
+    PostLike = apps.get_model("core", "PostLike")
+    likes = (
+        PostLike.objects.filter(post=OuterRef("pk"))
+        .order_by()
+        .values("post")
+        .annotate(total=Count("pk"))
+        .values("total")
+    )
+    Post.objects.update(like_count=Coalesce(Subquery(likes), 0))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("core", "0047_notification_category"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="post",
+            name="like_count",
+            field=models.PositiveIntegerField(
+                default=0,
+                help_text="Number of likes (kept in sync by toggle_post_like)",
+            ),
+        ),
+        migrations.RunPython(backfill_like_count, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,40 @@
+# Generated by Django 5.2.6 on 2026-10-16 19:24
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("core", "0048_post_like_count"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="postview",
+            name="viewed_hour",
+            field=models.DateTimeField(
+                blank=True,
+                help_text="viewed_at truncated to the hour; one counted view per viewer per hour",
+                null=True,
+            ),
+        ),
+        migrations.AddConstraint(
+            model_name="postview",
+            constraint=models.UniqueConstraint(
+                condition=models.Q(("user__isnull", False)),
+                fields=("post", "user", "viewed_hour"),
+                name="unique_post_view_per_user_hour",
+            ),
+        ),
+        migrations.AddConstraint(
+            model_name="postview",
+            constraint=models.UniqueConstraint(
+                condition=models.Q(("user__isnull", True)),
+                fields=("post", "ip_address", "viewed_hour"),
+                name="unique_post_view_per_ip_hour",
+            ),
+        ),
+    ]
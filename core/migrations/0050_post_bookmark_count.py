@@ -0,0 +1,38 @@
+# Generated by Django 5.2.6 on 2026-10-16 19:40
+
+from django.db import migrations, models
+from django.db.models import Count, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+
+
+def backfill_bookmark_count(apps, schema_editor):
+    """Populate bookmark_count from existing PostBookmark rows in a single UPDATE."""
+    Post = apps.get_model("core", "Post")
+    PostBookmark = apps.get_model("core", "PostBookmark")
+    bookmarks = (
+        PostBookmark.objects.filter(post=OuterRef("pk"))
+        .order_by()
+        .values("post")
+        .annotate(total=Count("pk"))
+        .values("total")
+    )
+    Post.objects.update(bookmark_count=Coalesce(Subquery(bookmarks), 0))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("core", "0049_postview_viewed_hour"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="post",
+            name="bookmark_count",
+            field=models.PositiveIntegerField(
+                default=0,
+                help_text="Number of bookmarks (kept in sync by toggle_post_bookmark)",
+            ),
+        ),
+        migrations.RunPython(backfill_bookmark_count, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,39 @@
+# Generated by Django 5.2.6 on 2026-10-16 20:16
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("core", "0050_post_bookmark_count"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="booking",
+            index=models.Index(
+                condition=models.Q(("status", "completed")),
+                fields=["created_at"],
+                name="booking_completed_created_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="booking",
+            index=models.Index(
+                condition=models.Q(("status", "requested")),
+                fields=["created_at"],
+                name="booking_requested_created_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="booking",
+            index=models.Index(
+                condition=models.Q(("payment_status", "paid")),
+                fields=["payment_date"],
+                name="booking_paid_payment_date_idx",
+            ),
+        ),
+    ]
@@ -0,0 +1,44 @@
+# Generated by Django 5.2.6 on 2026-10-16 21:00
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("core", "0051_booking_status_partial_indexes"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name="donation",
+            name="core_donati_post_id_740bfa_idx",
+        ),
+        migrations.AddIndex(
+            model_name="booking",
+            index=models.Index(
+                fields=["updated_at", "status"], name="core_bookin_updated_ede17d_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="commentreport",
+            index=models.Index(
+                fields=["status", "reviewed_at"], name="core_commen_status_56da91_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="donation",
+            index=models.Index(
+                fields=["post", "payment_status", "amount"],
+                name="core_donati_post_id_e34a80_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="postreport",
+            index=models.Index(
+                fields=["status", "reviewed_at"], name="core_postre_status_bd07bd_idx"
+            ),
+        ),
+    ]
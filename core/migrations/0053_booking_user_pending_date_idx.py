@@ -0,0 +1,23 @@
+# Generated by Django 5.2.6 on 2026-10-16 22:00
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("core", "0052_aggregation_composite_indexes"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="booking",
+            index=models.Index(
+                condition=models.Q(("status__in", ["pending", "requested"])),
+                fields=["user", "date"],
+                name="booking_user_pending_date_idx",
+            ),
+        ),
+    ]
@@ -2,8 +2,10 @@ from django.db import models
 from django.contrib.auth import get_user_model
 from django.contrib.contenttypes.models import ContentType
 from django.contrib.contenttypes.fields import GenericForeignKey
+from django.core.cache import cache
 from django.core.validators import RegexValidator
 from django.utils import timezone
+from django.utils.functional import cached_property
 from django.utils.text import slugify
 from .utils import optimize_image
 import os
@@ -418,6 +420,9 @@ class ServiceCategory(models.Model):
     @property
     def service_count(self):
         """Get total number of services in this category."""
+        # Use annotated value if available (optimization)
+        if hasattr(self, 'active_services_count'):
+            return self.active_services_count
         return self.services.filter(is_active=True).count()
 
 
@@ -483,11 +488,11 @@ class BookableService(models.Model):
     def __str__(self):
         return f"{self.name} - {self.church.name}"
     
-    @property
-    def duration_display(self):
-        """Return human-readable duration."""
-        hours = self.duration // 60
-        minutes = self.duration % 60
+    @staticmethod
+    def format_duration(duration):
+        """Return human-readable text for a duration in minutes."""
+        hours = duration // 60
+        minutes = duration % 60
         
         if hours > 0 and minutes > 0:
             return f"{hours}h {minutes}m"
@@ -496,16 +501,26 @@ class BookableService(models.Model):
         else:
             return f"{minutes}m"
     
-    @property
-    def price_display(self):
-        """Return formatted price with currency."""
-        if self.is_free:
+    @staticmethod
+    def format_price(is_free, price, currency):
+        """Return formatted price text for raw price/currency values."""
+        if is_free:
             return "Free"
-        elif self.price:
-            return f"{self.currency} {self.price:,.2f}"
+        elif price:
+            return f"{currency} {price:,.2f}"
         else:
             return "Price not set"
     
+    @property
+    def duration_display(self):
+        """Return human-readable duration."""
+        return self.format_duration(self.duration)
+    
+    @property
+    def price_display(self):
+        """Return formatted price with currency."""
+        return self.format_price(self.is_free, self.price, self.currency)
+    
     def get_images(self):
         """Get all images for this service."""
         return self.service_images.all().order_by('order', 'created_at')
@@ -517,28 +532,34 @@ class BookableService(models.Model):
         except:
             return None
     
+    @cached_property
+    def rating_stats(self):
+        """Review count, average and 1-5 star distribution from one aggregate."""
+        stats = self.reviews.filter(is_active=True).aggregate(
+            count=models.Count('id'),
+            avg=models.Avg('rating'),
+            **{f'r{i}': models.Count('id', filter=models.Q(rating=i)) for i in range(1, 6)}
+        )
+        return {
+            'count': stats['count'],
+            'avg': round(stats['avg'], 1) if stats['count'] else 0,
+            'distribution': {i: stats[f'r{i}'] for i in range(1, 6)},
+        }
+    
     @property
     def average_rating(self):
         """Get average rating for this service."""
-        reviews = self.reviews.filter(is_active=True)
-        if not reviews.exists():
-            return 0
-        total_rating = sum(review.rating for review in reviews)
-        return round(total_rating / reviews.count(), 1)
+        return self.rating_stats['avg']
     
     @property
     def review_count(self):
         """Get total number of reviews for this service."""
-        return self.reviews.filter(is_active=True).count()
+        return self.rating_stats['count']
     
     @property
     def rating_distribution(self):
         """Get rating distribution (1-5 stars)."""
-        reviews = self.reviews.filter(is_active=True)
-        distribution = {i: 0 for i in range(1, 6)}
-        for review in reviews:
-            distribution[review.rating] += 1
-        return distribution
+        return self.rating_stats['distribution']
     
     def has_user_reviewed(self, user):
         """Check if user has already reviewed this service."""
@@ -736,6 +757,29 @@ class Booking(models.Model):
             models.Index(fields=['service', 'date', 'status']),
             models.Index(fields=['church', 'status']),
             models.Index(fields=['user', 'status']),
+            models.Index(fields=['updated_at', 'status']),
+            # Partial indexes for the admin status/payment statistics
+            models.Index(
+                fields=['created_at'],
+                condition=models.Q(status='completed'),
+                name='booking_completed_created_idx',
+            ),
+            models.Index(
+                fields=['created_at'],
+                condition=models.Q(status='requested'),
+                name='booking_requested_created_idx',
+            ),
+            models.Index(
+                fields=['payment_date'],
+                condition=models.Q(payment_status='paid'),
+                name='booking_paid_payment_date_idx',
+            ),
+            # Covers the booking modal's pending-dates lookup
+            models.Index(
+                fields=['user', 'date'],
+                condition=models.Q(status__in=['pending', 'requested']),
+                name='booking_user_pending_date_idx',
+            ),
         ]
 
     def __str__(self):
@@ -811,6 +855,8 @@ class Post(models.Model):
     donation_goal = models.DecimalField(max_digits=10, decimal_places=2, blank=True, null=True, help_text="Optional donation goal amount")
     
     view_count = models.PositiveIntegerField(default=0, help_text="Number of times this post has been viewed")
+    like_count = models.PositiveIntegerField(default=0, help_text="Number of likes (kept in sync by toggle_post_like)")
+    bookmark_count = models.PositiveIntegerField(default=0, help_text="Number of bookmarks (kept in sync by toggle_post_bookmark)")
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
     is_active = models.BooleanField(default=True)
@@ -873,17 +919,14 @@ class Post(models.Model):
         else:
             return "Just now"
     
-    @property
-    def like_count(self):
-        """Return the number of likes for this post."""
-        # Use annotated value if available (optimization), otherwise count
-        return getattr(self, 'likes_count', self.likes.count())
-    
-    @property
+    @cached_property
     def comment_count(self):
         """Return the number of comments for this post."""
-        # Use annotated value if available (optimization), otherwise count
-        return getattr(self, 'comments_count', self.comments.filter(is_active=True).count())
+        # Use annotated value if available (optimization), otherwise count once
+        # per instance; PostComment.save() drops the cached value
+        if hasattr(self, 'comments_count'):
+            return self.comments_count
+        return self.comments.filter(is_active=True).count()
     
     def is_liked_by(self, user):
         """Check if the post is liked by a specific user."""
@@ -897,12 +940,6 @@ class Post(models.Model):
             return False
         return self.bookmarks.filter(user=user).exists()
     
-    @property
-    def bookmark_count(self):
-        """Return the number of bookmarks for this post."""
-        # Use annotated value if available (optimization), otherwise count
-        return getattr(self, 'bookmarks_count', self.bookmarks.count())
-    
     def get_donation_stats(self):
         """Get donation statistics for this post."""
         from django.db.models import Sum, Count
@@ -942,9 +979,19 @@ class PostImage(models.Model):
     def __str__(self):
         return f"Image {self.order} for {self.post.church.name}'s post"
     
+    @classmethod
+    def optimized_upload(cls, image_file):
+        """Optimize an uploaded post image (max 1080px width x 1350px height, similar to Facebook feed)."""
+        return optimize_image(
+            image_file,
+            max_size=(1080, 1350),
+            quality=85,
+            format='JPEG'
+        )
+    
     def save(self, *args, **kwargs):
         """Override save to optimize post images before saving."""
-        # Optimize image if present (max 1080px width x 1350px height, similar to Facebook feed)
+        # Optimize image if present
         if self.image:
             # Check if this is a new upload (image has changed)
             if self.pk:
@@ -952,28 +999,13 @@ class PostImage(models.Model):
                     old_instance = PostImage.objects.get(pk=self.pk)
                     # Only optimize if the image has changed
                     if old_instance.image != self.image:
-                        self.image = optimize_image(
-                            self.image,
-                            max_size=(1080, 1350),
-                            quality=85,
-                            format='JPEG'
-                        )
+                        self.image = self.optimized_upload(self.image)
                 except PostImage.DoesNotExist:
                     # New image, optimize it
-                    self.image = optimize_image(
-                        self.image,
-                        max_size=(1080, 1350),
-                        quality=85,
-                        format='JPEG'
-                    )
+                    self.image = self.optimized_upload(self.image)
             else:
                 # New image (no pk yet), optimize it
-                self.image = optimize_image(
-                    self.image,
-                    max_size=(1080, 1350),
-                    quality=85,
-                    format='JPEG'
-                )
+                self.image = self.optimized_upload(self.image)
         
         super().save(*args, **kwargs)
 
@@ -1014,6 +1046,11 @@ class PostBookmark(models.Model):
 
 class PostComment(models.Model):
     """Model for post comments."""
+    
+    # get_post_comments caches each post's serialized comment thread
+    THREAD_CACHE_KEY = 'post_comments_{post_id}'
+    THREAD_CACHE_TIMEOUT = 30
+    
     user = models.ForeignKey(User, on_delete=models.CASCADE, related_name='post_comments')
     post = models.ForeignKey(Post, on_delete=models.CASCADE, related_name='comments')
     content = models.TextField(max_length=500, help_text="Comment content")
@@ -1032,6 +1069,24 @@ class PostComment(models.Model):
     def __str__(self):
         return f"{self.user.get_full_name()} on {self.post.church.name}'s post"
     
+    def save(self, *args, **kwargs):
+        super().save(*args, **kwargs)
+        # Adding or hiding a comment changes the post's comment total and thread
+        if PostComment.post.is_cached(self):
+            self.post.__dict__.pop('comment_count', None)
+        self.clear_thread_cache(self.post_id)
+    
+    def delete(self, *args, **kwargs):
+        post_id = self.post_id
+        result = super().delete(*args, **kwargs)
+        self.clear_thread_cache(post_id)
+        return result
+    
+    @classmethod
+    def clear_thread_cache(cls, post_id):
+        """Drop the cached comment thread for a post."""
+        cache.delete(cls.THREAD_CACHE_KEY.format(post_id=post_id))
+    
     @property
     def is_reply(self):
         """Check if this comment is a reply to another comment."""
@@ -1085,6 +1140,7 @@ class PostView(models.Model):
     ip_address = models.GenericIPAddressField(help_text="IP address of the viewer")
     user_agent = models.TextField(max_length=500, help_text="User agent string")
     viewed_at = models.DateTimeField(auto_now_add=True)
+    viewed_hour = models.DateTimeField(null=True, blank=True, help_text="viewed_at truncated to the hour; one counted view per viewer per hour")
     
     class Meta:
         ordering = ['-viewed_at']
@@ -1093,6 +1149,18 @@ class PostView(models.Model):
             models.Index(fields=['user', 'viewed_at']),
             models.Index(fields=['ip_address', 'viewed_at']),
         ]
+        constraints = [
+            models.UniqueConstraint(
+                fields=['post', 'user', 'viewed_hour'],
+                condition=models.Q(user__isnull=False),
+                name='unique_post_view_per_user_hour',
+            ),
+            models.UniqueConstraint(
+                fields=['post', 'ip_address', 'viewed_hour'],
+                condition=models.Q(user__isnull=True),
+                name='unique_post_view_per_ip_hour',
+            ),
+        ]
     
     def __str__(self):
         user_info = self.user.get_full_name() if self.user else f'Anonymous ({self.ip_address})'
@@ -1134,6 +1202,7 @@ class PostReport(models.Model):
         indexes = [
             models.Index(fields=['post', 'status']),
             models.Index(fields=['user', 'created_at']),
+            models.Index(fields=['status', 'reviewed_at']),
         ]
     
     def __str__(self):
@@ -1177,6 +1246,7 @@ class CommentReport(models.Model):
             models.Index(fields=['comment', 'status']),
             models.Index(fields=['user', 'created_at']),
             models.Index(fields=['status', 'created_at']),
+            models.Index(fields=['status', 'reviewed_at']),
         ]
     
     def __str__(self):
@@ -1263,6 +1333,35 @@ class Notification(models.Model):
         (TYPE_MESSAGE_RECEIVED, 'New Message'),
     ]
     
+    # Categories (filter buckets derived from notification_type)
+    CATEGORY_OTHER = 0
+    CATEGORY_BOOKINGS = 1
+    CATEGORY_CHURCH = 2
+    CATEGORY_FOLLOWS = 3
+    CATEGORY_MESSAGES = 4
+    
+    CATEGORY_CHOICES = [
+        (CATEGORY_OTHER, 'Other'),
+        (CATEGORY_BOOKINGS, 'Bookings'),
+        (CATEGORY_CHURCH, 'Church'),
+        (CATEGORY_FOLLOWS, 'Follows'),
+        (CATEGORY_MESSAGES, 'Messages'),
+    ]
+    
+    TYPE_CATEGORIES = {
+        TYPE_BOOKING_REQUESTED: CATEGORY_BOOKINGS,
+        TYPE_BOOKING_REVIEWED: CATEGORY_BOOKINGS,
+        TYPE_BOOKING_APPROVED: CATEGORY_BOOKINGS,
+        TYPE_BOOKING_DECLINED: CATEGORY_BOOKINGS,
+        TYPE_BOOKING_CANCELED: CATEGORY_BOOKINGS,
+        TYPE_BOOKING_COMPLETED: CATEGORY_BOOKINGS,
+        TYPE_CHURCH_APPROVED: CATEGORY_CHURCH,
+        TYPE_CHURCH_DECLINED: CATEGORY_CHURCH,
+        TYPE_FOLLOW_REQUEST: CATEGORY_FOLLOWS,
+        TYPE_FOLLOW_ACCEPTED: CATEGORY_FOLLOWS,
+        TYPE_MESSAGE_RECEIVED: CATEGORY_MESSAGES,
+    }
+    
     # Priority levels
     PRIORITY_LOW = 'low'
     PRIORITY_MEDIUM = 'medium'
@@ -1278,6 +1377,7 @@ class Notification(models.Model):
     
     user = models.ForeignKey(User, on_delete=models.CASCADE, related_name='notifications')
     notification_type = models.CharField(max_length=50, choices=TYPE_CHOICES)
+    category = models.PositiveSmallIntegerField(choices=CATEGORY_CHOICES, default=CATEGORY_OTHER, editable=False)
     title = models.CharField(max_length=200)
     message = models.TextField()
     priority = models.CharField(max_length=10, choices=PRIORITY_CHOICES, default=PRIORITY_MEDIUM)
@@ -1299,12 +1399,21 @@ class Notification(models.Model):
         indexes = [
             models.Index(fields=['user', 'is_read']),
             models.Index(fields=['user', 'notification_type']),
+            models.Index(fields=['user', 'category']),
             models.Index(fields=['created_at']),
         ]
     
     def __str__(self):
         return f"{self.user.username} - {self.title}"
     
+    def save(self, *args, **kwargs):
+        """Keep category in sync with notification_type."""
+        self.category = self.TYPE_CATEGORIES.get(self.notification_type, self.CATEGORY_OTHER)
+        update_fields = kwargs.get('update_fields')
+        if update_fields is not None and 'notification_type' in update_fields:
+            kwargs['update_fields'] = {*update_fields, 'category'}
+        super().save(*args, **kwargs)
+    
     def mark_as_read(self):
         """Mark notification as read."""
         if not self.is_read:
@@ -1606,6 +1715,35 @@ class UserInteraction(models.Model):
         
         return cls.objects.create(**activity_data)
     
+    @classmethod
+    def log_bulk_activity(cls, user, activity_type, model, object_ids, request=None):
+        """
+        Log the same activity against several objects with one INSERT.
+        
+        Args:
+            user: User instance
+            activity_type: Activity type from ACTIVITY_CHOICES
+            model: Model class of the related objects
+            object_ids: Primary keys of the related objects
+            request: HTTP request for IP and user agent tracking
+        """
+        from django.contrib.contenttypes.models import ContentType
+        
+        activity_data = {
+            'user': user,
+            'activity_type': activity_type,
+            'content_type': ContentType.objects.get_for_model(model),
+        }
+        
+        # Add request info if provided
+        if request:
+            activity_data['ip_address'] = cls._get_client_ip(request)
+            activity_data['user_agent'] = request.META.get('HTTP_USER_AGENT', '')[:1000]  # Limit length
+        
+        return cls.objects.bulk_create(
+            [cls(object_id=object_id, **activity_data) for object_id in object_ids]
+        )
+    
     @staticmethod
     def _get_client_ip(request):
         """Get client IP address from request."""
@@ -1671,7 +1809,8 @@ class Donation(models.Model):
         ordering = ['-created_at']
         indexes = [
             models.Index(fields=['-created_at']),
-            models.Index(fields=['post', 'payment_status']),
+            # Covers the per-post completed donation totals
+            models.Index(fields=['post', 'payment_status', 'amount']),
         ]
         verbose_name = 'Donation'
         verbose_name_plural = 'Donations'
@@ -1,12 +1,21 @@
 """
 Notification utility functions for creating and managing notifications.
 """
+import uuid
+
 from django.contrib.auth import get_user_model
+from django.core.cache import cache
 from django.utils import timezone
 from .models import Notification, Booking, Church
 
 User = get_user_model()
 
+# Version token that changes whenever a user's notifications change; used as
+# the ETag of the polled unread-count endpoint. The timeout bounds how long a
+# worker with a per-process cache (LocMemCache) can serve a stale token.
+UNREAD_COUNT_VERSION_KEY = 'notification_count_version_{user_id}'
+UNREAD_COUNT_VERSION_TIMEOUT = 60
+
 
 def create_notification(user, notification_type, title, message, priority=Notification.PRIORITY_MEDIUM, 
                        booking=None, church=None):
@@ -170,6 +179,37 @@ def get_user_unread_count(user):
     return Notification.objects.filter(user=user, is_read=False).count()
 
 
+def bump_unread_count_version(user_id):
+    """
+    Issue a new unread-count version token for a user.
+    
+    Args:
+        user_id: ID of the user whose notifications changed
+    
+    Returns:
+        str: The new version token
+    """
+    version = uuid.uuid4().hex
+    cache.set(UNREAD_COUNT_VERSION_KEY.format(user_id=user_id), version, UNREAD_COUNT_VERSION_TIMEOUT)
+    return version
+
+
+def get_unread_count_version(user_id):
+    """
+    Get the current unread-count version token for a user, issuing one if missing.
+    
+    Args:
+        user_id: ID of the user
+    
+    Returns:
+        str: Version token
+    """
+    version = cache.get(UNREAD_COUNT_VERSION_KEY.format(user_id=user_id))
+    if version is None:
+        version = bump_unread_count_version(user_id)
+    return version
+
+
 def get_user_notifications(user, limit=20, unread_only=False):
     """
     Get notifications for a user.
@@ -225,6 +265,8 @@ def mark_all_notifications_as_read(user):
     if count > 0:
         now = timezone.now()
         unread_notifications.update(is_read=True, read_at=now)
+        # Queryset updates skip post_save, so invalidate the count ETag here
+        bump_unread_count_version(user.id)
     
     return count
 
@@ -2,8 +2,10 @@
 Database optimization utilities for ChurchIligan
 """
 
-from django.db import connection
+from django.db import connection, connections
 from django.core.cache import cache
+from django.core.paginator import Paginator
+from django.utils.functional import cached_property
 from django.db.models import Count, Q
 from django.conf import settings
 import time
@@ -150,6 +152,38 @@ class DatabaseOptimizer:
         return stats
 
 
+class FasterAdminPaginator(Paginator):
+    """
+    Paginator for large admin lists that avoids a full COUNT(*) when the
+    queryset is unfiltered.
+
+    On PostgreSQL the planner's row estimate from pg_class is used instead;
+    filtered querysets and other backends keep the exact count.
+    """
+    
+    @cached_property
+    def _is_unfiltered(self):
+        query = getattr(self.object_list, 'query', None)
+        return query is not None and not query.where and not query.distinct
+    
+    @cached_property
+    def count(self):
+        if self._is_unfiltered:
+            db_connection = connections[self.object_list.db]
+            if db_connection.vendor == 'postgresql':
+                table = self.object_list.model._meta.db_table
+                with db_connection.cursor() as cursor:
+                    cursor.execute(
+                        "SELECT reltuples::bigint FROM pg_class WHERE relname = %s",
+                        [table]
+                    )
+                    row = cursor.fetchone()
+                # reltuples is -1/0 until the table has been analyzed
+                if row and row[0] > 0:
+                    return row[0]
+        return super().count
+
+
 class QueryProfiler:
     """Context manager for profiling database queries"""
     
@@ -0,0 +1,46 @@
+"""
+HTTP response helpers for the ChurchIligan application.
+"""
+from decimal import Decimal
+
+import orjson
+from django.http import HttpResponse
+from django.utils.functional import Promise
+
+
+def _orjson_default(obj):
+    """Serialize the types orjson does not handle natively."""
+    if isinstance(obj, Decimal):
+        return float(obj)
+    if isinstance(obj, Promise):
+        return str(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def orjson_dumps(data):
+    """
+    Serialize data to a JSON string with orjson, for embedding in templates.
+
+    Uses the same type handling as ORJsonResponse.
+    """
+    return orjson.dumps(data, default=_orjson_default, option=orjson.OPT_NON_STR_KEYS).decode()
+
+
+class ORJsonResponse(HttpResponse):
+    """
+    Drop-in replacement for JsonResponse that serializes with orjson.
+
+    datetime/date/UUID values are encoded natively, Decimals become floats
+    and lazy translation strings become plain strings. Like JsonResponse,
+    only dicts are accepted unless safe=False.
+    """
+
+    def __init__(self, data, safe=True, **kwargs):
+        if safe and not isinstance(data, dict):
+            raise TypeError(
+                'In order to allow non-dict objects to be serialized set the '
+                'safe parameter to False.'
+            )
+        kwargs.setdefault('content_type', 'application/json')
+        content = orjson.dumps(data, default=_orjson_default, option=orjson.OPT_NON_STR_KEYS)
+        super().__init__(content=content, **kwargs)
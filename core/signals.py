@@ -1,12 +1,21 @@
 """
 Django signals for automatic notification creation.
 """
-from django.db.models.signals import post_save, pre_save
+from django.db.models.signals import post_save, pre_save, post_delete
 from django.dispatch import receiver
 from django.contrib.auth import get_user_model
 
-from .models import Booking, Church, ChurchVerificationRequest, Notification
-from .notifications import create_booking_notification, create_church_notification, NotificationTemplates
+from accounts.models import Profile
+
+from .models import (
+    Booking, Church, ChurchVerificationRequest, CommentReport, Donation, Notification, PostReport,
+)
+from .notifications import (
+    create_booking_notification,
+    create_church_notification,
+    NotificationTemplates,
+    bump_unread_count_version,
+)
 
 User = get_user_model()
 
@@ -214,3 +223,47 @@ def create_church_verification_notifications(sender, instance, created, **kwargs
                 priority=template['priority'],
                 church=instance.church
             )
+
+
+@receiver(post_save, sender=Notification)
+@receiver(post_delete, sender=Notification)
+def invalidate_notification_count_version(sender, instance, **kwargs):
+    """
+    Issue a new unread-count version so polling clients stop getting 304s.
+    """
+    bump_unread_count_version(instance.user_id)
+
+
+@receiver(post_save, sender=Donation)
+@receiver(post_delete, sender=Donation)
+def invalidate_donor_rank(sender, instance, **kwargs):
+    """
+    Drop the donor's cached donation total whenever one of their donations changes.
+    """
+    if instance.donor_id:
+        from accounts.donation_utils import invalidate_donation_rank
+        invalidate_donation_rank(instance.donor_id)
+
+
+@receiver(post_save, sender=Profile)
+def invalidate_profile_app_context(sender, instance, **kwargs):
+    """
+    Drop the cached sidebar/header data so name and profile badges update.
+    User saves also re-save the profile, so this covers name changes too.
+    """
+    from .views import invalidate_app_context
+    invalidate_app_context(instance.user_id)
+
+
+@receiver(post_save, sender=PostReport)
+@receiver(post_delete, sender=PostReport)
+@receiver(post_save, sender=CommentReport)
+@receiver(post_delete, sender=CommentReport)
+@receiver(post_save, sender=ChurchVerificationRequest)
+@receiver(post_delete, sender=ChurchVerificationRequest)
+def invalidate_moderation_stats_cache(sender, instance, **kwargs):
+    """
+    Drop the cached moderation statistics when a report or verification changes.
+    """
+    from .views import invalidate_moderation_stats
+    invalidate_moderation_stats()
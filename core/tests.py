@@ -1,8 +1,17 @@
-from django.test import TestCase, Client
+from django.test import TestCase, Client, override_settings
 from django.contrib.auth import get_user_model
 from django.urls import reverse
 from django.core.files.uploadedfile import SimpleUploadedFile
-from .models import Church, ChurchFollow, BookableService, ServiceImage
+from django.core.cache import cache
+import datetime
+import json
+import shutil
+import tempfile
+
+from .models import (
+    Church, ChurchFollow, BookableService, ServiceImage, Notification, Availability,
+    Post, PostComment, PostView, Donation, CommentReport,
+)
 
 User = get_user_model()
 
@@ -131,8 +140,44 @@ class ChurchTestCase(TestCase):
         self.assertEqual(response.status_code, 200)
         self.assertContains(response, 'This field is required')
 
+    def test_bulk_availability_creates_and_updates(self):
+        """Test that bulk availability inserts new dates and updates existing ones."""
+        existing = Availability.objects.create(
+            church=self.church,
+            date=datetime.date(2030, 1, 1),
+            type='special_hours',
+            is_closed=False,
+            reason='Old reason'
+        )
+        
+        response = self.client.post(reverse('core:bulk_availability'), {
+            'church_id': self.church.id,
+            'dates': '2030-01-01, 2030-01-02',
+            'action': 'close',
+            'reason': 'Holiday',
+        })
+        self.assertEqual(response.status_code, 302)
+        
+        self.assertEqual(Availability.objects.filter(church=self.church).count(), 2)
+        existing.refresh_from_db()
+        self.assertTrue(existing.is_closed)
+        self.assertEqual(existing.type, 'closed_date')
+        self.assertEqual(existing.reason, 'Holiday')
+        created = Availability.objects.get(church=self.church, date=datetime.date(2030, 1, 2))
+        self.assertTrue(created.is_closed)
+        self.assertEqual(created.reason, 'Holiday')
+
+
+TEST_MEDIA_ROOT = tempfile.mkdtemp()
+
 
+@override_settings(MEDIA_ROOT=TEST_MEDIA_ROOT)
 class ServiceImageTestCase(TestCase):
+    @classmethod
+    def tearDownClass(cls):
+        super().tearDownClass()
+        shutil.rmtree(TEST_MEDIA_ROOT, ignore_errors=True)
+
     def setUp(self):
         self.client = Client()
         self.user = User.objects.create_user(
@@ -358,4 +403,294 @@ class ServiceImageTestCase(TestCase):
         
         self.assertEqual(data['images'][1]['id'], image2.id)
         self.assertEqual(data['images'][1]['caption'], 'Second image')
-        self.assertFalse(data['images'][1]['is_primary'])
\ No newline at end of file
+        self.assertFalse(data['images'][1]['is_primary'])
+
+    def test_api_church_services_endpoint(self):
+        """Test that the church services API returns display data and the first image."""
+        service = BookableService.objects.create(
+            name='Paid Service',
+            description='',
+            church=self.church,
+            duration=90,
+            is_free=False,
+            price=1500,
+            currency='PHP',
+            max_bookings_per_day=5,
+            advance_booking_days=7
+        )
+        ServiceImage.objects.create(
+            service=service,
+            image=SimpleUploadedFile("second.jpg", b"content", "image/jpeg"),
+            order=1
+        )
+        first = ServiceImage.objects.create(
+            service=service,
+            image=SimpleUploadedFile("first.jpg", b"content", "image/jpeg"),
+            order=0
+        )
+        
+        response = self.client.get(reverse('core:api_get_church_services', kwargs={'church_id': self.church.id}))
+        self.assertEqual(response.status_code, 200)
+        
+        data = response.json()
+        self.assertTrue(data['success'])
+        self.assertEqual(data['total'], 1)
+        
+        service_data = data['services'][0]
+        self.assertEqual(service_data['id'], service.id)
+        self.assertEqual(service_data['description'], 'No description provided.')
+        self.assertEqual(service_data['duration'], '1h 30m')
+        self.assertEqual(service_data['price'], 'PHP 1,500.00')
+        self.assertFalse(service_data['is_free'])
+        self.assertEqual(service_data['image_url'], first.image.url)
+
+
+class NotificationCategoryTestCase(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(
+            username='notifyuser',
+            email='notify@example.com',
+            password='testpass123'
+        )
+
+    def test_category_follows_notification_type(self):
+        """Test that saving a notification derives its category from the type."""
+        notification = Notification.objects.create(
+            user=self.user,
+            notification_type=Notification.TYPE_BOOKING_APPROVED,
+            title='Approved',
+            message='Your booking was approved.'
+        )
+        self.assertEqual(notification.category, Notification.CATEGORY_BOOKINGS)
+        
+        notification.notification_type = Notification.TYPE_FOLLOW_ACCEPTED
+        notification.save(update_fields=['notification_type'])
+        notification.refresh_from_db()
+        self.assertEqual(notification.category, Notification.CATEGORY_FOLLOWS)
+
+    def test_notifications_view_filters_by_category(self):
+        """Test that the notifications page filters and counts by category."""
+        for notification_type in (
+            Notification.TYPE_BOOKING_REQUESTED,
+            Notification.TYPE_CHURCH_APPROVED,
+            Notification.TYPE_CHURCH_ASSIGNMENT,
+        ):
+            Notification.objects.create(
+                user=self.user,
+                notification_type=notification_type,
+                title='Title',
+                message='Message'
+            )
+        self.client.login(username='notifyuser', password='testpass123')
+        
+        response = self.client.get(reverse('core:notifications'), {'type': 'church'})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(
+            [n.notification_type for n in response.context['notifications']],
+            [Notification.TYPE_CHURCH_APPROVED]
+        )
+        self.assertEqual(response.context['counts']['all'], 3)
+        self.assertEqual(response.context['counts']['bookings'], 1)
+        self.assertEqual(response.context['counts']['church'], 1)
+        self.assertEqual(response.context['counts']['follows'], 0)
+
+    def test_notification_count_not_modified_until_notifications_change(self):
+        """Test that the polled unread count honours If-None-Match."""
+        self.client.login(username='notifyuser', password='testpass123')
+        url = reverse('core:notification_count')
+        
+        response = self.client.get(url)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()['count'], 0)
+        etag = response['ETag']
+        
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 304)
+        
+        Notification.objects.create(
+            user=self.user,
+            notification_type=Notification.TYPE_FOLLOW_REQUEST,
+            title='Title',
+            message='Message'
+        )
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()['count'], 1)
+        self.assertNotEqual(response['ETag'], etag)
+
+    def test_app_context_refreshes_after_profile_change(self):
+        """Test that the cached sidebar data is dropped when the user is renamed."""
+        cache.clear()
+        self.client.login(username='notifyuser', password='testpass123')
+        url = reverse('core:notifications')
+        self.assertEqual(self.client.get(url).context['user_display_name'], 'notifyuser')
+        
+        self.user.first_name = 'Maria'
+        self.user.last_name = 'Santos'
+        self.user.save()
+        self.assertEqual(self.client.get(url).context['user_display_name'], 'Maria Santos')
+
+
+class PostCommentsTestCase(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.owner = User.objects.create_user(username='owner', password='testpass123')
+        self.donor = User.objects.create_user(username='donor', password='testpass123', first_name='Dana')
+        self.church = Church.objects.create(
+            name='Comment Church',
+            slug='comment-church',
+            description='Church for comment tests',
+            email='comments@church.com',
+            phone='+63 123 456 7890',
+            address='123 Test Street',
+            city='Test City',
+            state='Test State',
+            country='Philippines',
+            owner=self.owner
+        )
+        self.post = Post.objects.create(church=self.church, content='Hello parish')
+        Donation.objects.create(post=self.post, donor=self.donor, amount=1500, payment_status='completed')
+        self.client.login(username='owner', password='testpass123')
+
+    def test_get_post_comments_includes_replies_and_ranks(self):
+        """Test that comments, their active replies and donor ranks are returned."""
+        comment = PostComment.objects.create(post=self.post, user=self.donor, content='First!')
+        PostComment.objects.create(post=self.post, user=self.owner, content='Welcome', parent=comment)
+        PostComment.objects.create(post=self.post, user=self.owner, content='Hidden', parent=comment, is_active=False)
+        
+        response = self.client.get(reverse('core:get_post_comments', kwargs={'post_id': self.post.id}))
+        self.assertEqual(response.status_code, 200)
+        
+        data = response.json()
+        self.assertTrue(data['success'])
+        self.assertEqual(data['comment_count'], 1)
+        comment_data = data['comments'][0]
+        self.assertEqual(comment_data['user_name'], 'Dana')
+        self.assertEqual(comment_data['donation_rank']['name'], 'Silver Supporter')
+        self.assertEqual(comment_data['reply_count'], 1)
+        self.assertEqual(comment_data['replies'][0]['content'], 'Welcome')
+        self.assertIsNone(comment_data['replies'][0]['donation_rank'])
+
+    def test_track_post_view_counts_once_per_hour(self):
+        """Test that repeated views from the same user are counted once per hour."""
+        url = reverse('core:track_post_view', kwargs={'post_id': self.post.id})
+        
+        first = self.client.post(url).json()
+        second = self.client.post(url).json()
+        
+        self.assertTrue(first['counted'])
+        self.assertEqual(first['view_count'], 1)
+        self.assertFalse(second['counted'])
+        self.assertEqual(second['view_count'], 1)
+        self.post.refresh_from_db()
+        self.assertEqual(self.post.view_count, 1)
+
+    def test_toggle_post_bookmark_keeps_count_in_sync(self):
+        """Test that bookmarking and unbookmarking update the stored bookmark count."""
+        url = reverse('core:toggle_post_bookmark', kwargs={'post_id': self.post.id})
+        
+        data = self.client.post(url).json()
+        self.assertTrue(data['is_bookmarked'])
+        self.assertEqual(data['bookmark_count'], 1)
+        self.post.refresh_from_db()
+        self.assertEqual(self.post.bookmark_count, 1)
+        
+        data = self.client.post(url).json()
+        self.assertFalse(data['is_bookmarked'])
+        self.assertEqual(data['bookmark_count'], 0)
+        self.post.refresh_from_db()
+        self.assertEqual(self.post.bookmark_count, 0)
+
+    def test_comment_count_is_cached_until_comment_saved(self):
+        """Test that comment_count is computed once and refreshed when a comment is saved."""
+        self.assertEqual(self.post.comment_count, 0)
+        with self.assertNumQueries(0):
+            self.assertEqual(self.post.comment_count, 0)
+        
+        PostComment.objects.create(post=self.post, user=self.donor, content='Amen')
+        self.assertEqual(self.post.comment_count, 1)
+
+    def test_donation_rank_cache_refreshes_on_new_donation(self):
+        """Test that a cached donation rank is recalculated after a new donation."""
+        from accounts.donation_utils import get_user_donation_rank
+        
+        self.assertEqual(get_user_donation_rank(self.donor)['name'], 'Silver Supporter')
+        with self.assertNumQueries(0):
+            get_user_donation_rank(self.donor)
+        
+        Donation.objects.create(post=self.post, donor=self.donor, amount=4000, payment_status='completed')
+        self.assertEqual(get_user_donation_rank(self.donor)['name'], 'Gold Supporter')
+
+    def test_rank_for_total_uses_tier_minimums(self):
+        """Test that totals map to the highest tier whose minimum they reach."""
+        from decimal import Decimal
+        from accounts.donation_utils import get_rank_for_total
+        
+        self.assertIsNone(get_rank_for_total(Decimal('49.99')))
+        self.assertEqual(get_rank_for_total(50)['icon'], 'bronze')
+        self.assertEqual(get_rank_for_total(Decimal('999.50'))['icon'], 'bronze')
+        self.assertEqual(get_rank_for_total(1000)['icon'], 'silver')
+        self.assertEqual(get_rank_for_total(Decimal('1000000'))['icon'], 'champion')
+
+    def test_super_admin_donations_time_filter_keeps_totals(self):
+        """Test that the donors page time filter neither inflates totals nor drops ranks."""
+        Donation.objects.create(post=self.post, donor=self.donor, amount=500, payment_status='completed')
+        User.objects.create_superuser('admin', 'admin@example.com', 'testpass123')
+        self.client.login(username='admin', password='testpass123')
+        
+        response = self.client.get(reverse('core:super_admin_donations'), {'time': '30days', 'rank': 'silver'})
+        donor_data = response.context['donor_data']
+        self.assertEqual(len(donor_data), 1)
+        self.assertEqual(donor_data[0]['total_donated'], 2000)
+        self.assertEqual(donor_data[0]['donation_count'], 2)
+        self.assertEqual(donor_data[0]['rank']['icon'], 'silver')
+
+    def test_moderation_stats_refresh_after_report_dismissed(self):
+        """Test that cached moderation stats are dropped when a report changes."""
+        User.objects.create_superuser('admin', 'admin@example.com', 'testpass123')
+        self.client.login(username='admin', password='testpass123')
+        url = reverse('core:super_admin_moderation')
+        
+        comment = PostComment.objects.create(post=self.post, user=self.donor, content='Spam')
+        report = CommentReport.objects.create(comment=comment, user=self.owner, reason='spam')
+        self.assertEqual(self.client.get(url).context['stats']['pending_reports'], 1)
+        
+        self.client.post(reverse('core:dismiss_comment_report', args=[report.id]))
+        stats = self.client.get(url).context['stats']
+        self.assertEqual(stats['pending_reports'], 0)
+        self.assertEqual(stats['resolved_this_week'], 1)
+
+    def test_track_post_views_batches_and_skips_repeat_views(self):
+        """Test that batched view tracking counts each post once per hour."""
+        other_post = Post.objects.create(church=self.church, content='Second post')
+        url = reverse('core:track_post_views')
+        payload = json.dumps({'post_ids': [self.post.id, other_post.id]})
+        
+        views = self.client.post(url, payload, content_type='application/json').json()['views']
+        self.assertTrue(views[str(self.post.id)]['counted'])
+        self.assertEqual(views[str(other_post.id)]['view_count'], 1)
+        
+        views = self.client.post(url, payload, content_type='application/json').json()['views']
+        self.assertFalse(views[str(self.post.id)]['counted'])
+        self.assertEqual(views[str(self.post.id)]['view_count'], 1)
+        self.assertEqual(PostView.objects.filter(post__in=[self.post, other_post]).count(), 2)
+
+    def test_add_post_comment_returns_updated_count(self):
+        """Test that adding a comment returns the new active comment total."""
+        PostComment.objects.create(post=self.post, user=self.donor, content='Earlier')
+        url = reverse('core:add_post_comment', kwargs={'post_id': self.post.id})
+        
+        data = self.client.post(url, {'content': 'Praise be'}).json()
+        self.assertTrue(data['success'])
+        self.assertEqual(data['comment_count'], 2)
+
+    def test_get_post_comments_cache_cleared_on_new_comment(self):
+        """Test that the cached comment thread is dropped when a comment is added."""
+        url = reverse('core:get_post_comments', kwargs={'post_id': self.post.id})
+        cache_key = PostComment.THREAD_CACHE_KEY.format(post_id=self.post.id)
+        self.assertEqual(self.client.get(url).json()['comment_count'], 0)
+        self.assertIsNotNone(cache.get(cache_key))
+        
+        PostComment.objects.create(post=self.post, user=self.donor, content='New here')
+        self.assertIsNone(cache.get(cache_key))
+        self.assertEqual(self.client.get(url).json()['comment_count'], 1)
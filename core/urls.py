@@ -124,6 +124,7 @@ urlpatterns = [
     path('posts/<int:post_id>/comments/', views.get_post_comments, name='get_post_comments'),
     path('posts/<int:post_id>/share/', views.share_post, name='share_post'),
     path('posts/<int:post_id>/view/', views.track_post_view, name='track_post_view'),
+    path('posts/views/', views.track_post_views, name='track_post_views'),
     path('comments/report/', views.report_comment, name='report_comment'),
     path('comments/<int:comment_id>/delete/', views.delete_reported_comment, name='delete_reported_comment'),
     path('comment-reports/<int:report_id>/dismiss/', views.dismiss_comment_report, name='dismiss_comment_report'),
@@ -1,20 +1,24 @@
 from django.shortcuts import render, get_object_or_404, redirect
-from django.http import HttpResponseRedirect
+from django.http import HttpResponse, HttpResponseRedirect
 from django.contrib.auth.decorators import login_required
-from django.views.decorators.http import require_POST, require_http_methods
+from django.views.decorators.http import require_POST, require_http_methods, condition
+from django.views.decorators.cache import cache_control
 from django.contrib import messages
 from django.http import JsonResponse
 from django.core.paginator import Paginator
-from django.db.models import Q, Count, F, Exists, OuterRef, Value, BooleanField, ExpressionWrapper, IntegerField, Sum, Avg
+from django.db.models import Q, Count, F, Exists, OuterRef, Prefetch, Subquery, Value, BooleanField, ExpressionWrapper, IntegerField, Sum, Avg
+from django.db.models.functions import Coalesce
 from django.urls import reverse
 from django.utils.text import slugify
 from django.core.cache import cache
-from django.db import IntegrityError
+from django.db import IntegrityError, connection, transaction
 from django.contrib.auth import get_user_model
 
 User = get_user_model()
 from django.views.decorators.csrf import csrf_exempt
 from django.utils import timezone
+from datetime import date, timedelta
+from functools import partial
 
 from .models import (
     Church,
@@ -38,6 +42,10 @@ from .models import (
     DeclineReason,
     Donation,
     ServiceReview,
+    StaffActivityLog,
+    PostImage,
+    ServiceReviewHelpful,
+    UserInteraction,
 )
 from .forms import (
     ChurchCreateForm,
@@ -55,9 +63,17 @@ from .forms import (
 from .utils import get_user_display_data, get_essential_profile_status, optimize_image
 from django.core.files.storage import default_storage
 from django.core.files.base import ContentFile
+import hashlib
+import json
+import logging
+import orjson
 import os
 from django.utils import timezone
-from .notifications import create_booking_notification, NotificationTemplates
+from .notifications import create_booking_notification, NotificationTemplates, bump_unread_count_version
+from .responses import ORJsonResponse, orjson_dumps
+from .optimization_utils import FasterAdminPaginator
+
+logger = logging.getLogger(__name__)
 
 
 # Permission Helper Functions
@@ -75,7 +91,6 @@ def log_staff_activity(user, church, action, category, description, target_id=No
         target_type: Optional type of the affected object
         request: Optional request object to get IP address
     """
-    from core.models import ChurchStaff, StaffActivityLog
     
     try:
         # Get the staff member record
@@ -103,8 +118,6 @@ def log_staff_activity(user, church, action, category, description, target_id=No
             )
     except Exception as e:
         # Silently fail - don't break the main operation if logging fails
-        import logging
-        logger = logging.getLogger(__name__)
         logger.error(f"Failed to log staff activity: {str(e)}")
 
 
@@ -155,11 +168,17 @@ def user_can_manage_church(user, church, required_permissions=None):
     return (has_permission, role)
 
 
-def _app_context(request):
-    """Common context for app pages: user display, initial, placeholder activity counts."""
-    from accounts.views import ACTIVITY_COUNTS
-    
-    user = request.user
+APP_CONTEXT_CACHE_KEY = 'app_context_{user_id}'
+APP_CONTEXT_CACHE_TIMEOUT = 30
+
+
+def invalidate_app_context(user_id):
+    """Drop a user's cached sidebar/header data (e.g. after a profile edit)."""
+    cache.delete(APP_CONTEXT_CACHE_KEY.format(user_id=user_id))
+
+
+def _app_context_user_data(user):
+    """Profile, essentials, recent activity and badge data for the app shell."""
     try:
         profile = user.profile
     except Exception:
@@ -179,51 +198,77 @@ def _app_context(request):
     # Get recent user activities for sidebar (post interactions)
     recent_activities = []
     if user.is_authenticated:
-        from core.models import UserInteraction
-        recent_activities = UserInteraction.objects.filter(
+        recent_activities = list(UserInteraction.objects.filter(
             user=user
-        ).select_related('content_type').prefetch_related('content_object').order_by('-created_at')[:3]
-
-    # PayPal configuration for donation integration
-    from django.conf import settings
-    PAYPAL_CLIENT_ID = getattr(settings, 'PAYPAL_CLIENT_ID', '')
-    PAYPAL_CURRENCY = getattr(settings, 'PAYPAL_CURRENCY', 'PHP')
-    
-    # Stripe configuration for credit card donations
-    STRIPE_PUBLISHABLE_KEY = getattr(settings, 'STRIPE_PUBLISHABLE_KEY', '')
+        ).select_related('content_type').prefetch_related('content_object').order_by('-created_at')[:3])
     
     # Get unread booking notifications count for church owners
     unread_booking_notifications = 0
     if user.is_authenticated and user.owned_churches.exists():
-        from core.models import Notification, Booking
+        from core.models import Notification
         unread_booking_notifications = Notification.objects.filter(
             user=user,
             is_read=False,
-            notification_type__in=[
-                Notification.TYPE_BOOKING_REQUESTED,
-                Notification.TYPE_BOOKING_REVIEWED,
-                Notification.TYPE_BOOKING_APPROVED,
-                Notification.TYPE_BOOKING_DECLINED,
-                Notification.TYPE_BOOKING_CANCELED,
-                Notification.TYPE_BOOKING_COMPLETED
-            ]
+            category=Notification.CATEGORY_BOOKINGS
         ).count()
     
     return {
         'user_display_name': user_display_name,
         'user_initial': user_initial,
-        'activity_counts': ACTIVITY_COUNTS,
-        'is_admin_mode': bool(request.session.get('super_admin_mode', False)) if getattr(user, 'is_superuser', False) else False,
         'profile_essentials_incomplete': essentials_incomplete,
         'profile_essentials_missing': essentials_missing,
         'essential_status': essential,
         'recent_activities': recent_activities,
-        'PAYPAL_CLIENT_ID': PAYPAL_CLIENT_ID,
-        'PAYPAL_CURRENCY': PAYPAL_CURRENCY,
-        'STRIPE_PUBLISHABLE_KEY': STRIPE_PUBLISHABLE_KEY,
         'unread_booking_notifications': unread_booking_notifications,
     }
 
+
+def _app_context(request):
+    """Common context for app pages: user display, initial, placeholder activity counts.
+
+    The result is memoized on the request, so repeated calls within one
+    request cycle reuse it instead of re-running the sidebar queries. The
+    per-user part is also cached for APP_CONTEXT_CACHE_TIMEOUT seconds; it
+    is recomputed when the user's notifications change or the profile is
+    saved, while session-bound values are always read live.
+    """
+    cached = getattr(request, '_app_context_cache', None)
+    if cached is not None:
+        return cached
+
+    from accounts.views import ACTIVITY_COUNTS
+    from django.conf import settings
+    
+    user = request.user
+    if user.is_authenticated:
+        from .notifications import get_unread_count_version
+        cache_key = APP_CONTEXT_CACHE_KEY.format(user_id=user.id)
+        notification_version = get_unread_count_version(user.id)
+        cached_data = cache.get(cache_key)
+        if cached_data is not None and cached_data['notification_version'] == notification_version:
+            user_data = cached_data['data']
+        else:
+            user_data = _app_context_user_data(user)
+            cache.set(
+                cache_key,
+                {'notification_version': notification_version, 'data': user_data},
+                APP_CONTEXT_CACHE_TIMEOUT
+            )
+    else:
+        user_data = _app_context_user_data(user)
+
+    request._app_context_cache = {
+        **user_data,
+        'activity_counts': ACTIVITY_COUNTS,
+        'is_admin_mode': bool(request.session.get('super_admin_mode', False)) if getattr(user, 'is_superuser', False) else False,
+        # PayPal configuration for donation integration
+        'PAYPAL_CLIENT_ID': getattr(settings, 'PAYPAL_CLIENT_ID', ''),
+        'PAYPAL_CURRENCY': getattr(settings, 'PAYPAL_CURRENCY', 'PHP'),
+        # Stripe configuration for credit card donations
+        'STRIPE_PUBLISHABLE_KEY': getattr(settings, 'STRIPE_PUBLISHABLE_KEY', ''),
+    }
+    return request._app_context_cache
+
 def home(request):
     context = {"title": "ChurchIligan"}
     return render(request, "home.html", context)
@@ -401,12 +446,11 @@ def church_detail(request, slug):
             is_bookmarked=Value(False, output_field=BooleanField()),
         )
     post_qs = post_qs.annotate(
-        likes_count=Count('likes', distinct=True),
         comments_count=Count('comments', filter=Q(comments__is_active=True), distinct=True),
     ).order_by('-created_at')[:10]
     posts = list(post_qs)
-    # Note: The like_count and comment_count properties will automatically use
-    # the annotated values (likes_count, comments_count) to avoid N+1 queries
+    # Note: like_count is a stored column, and the comment_count property will
+    # automatically use the annotated comments_count to avoid N+1 queries
     
     # Reviews for Reviews tab
     recent_reviews = church.service_reviews.filter(is_active=True).select_related(
@@ -611,12 +655,15 @@ def manage_church(request, church_id=None):
     # This avoids requiring a full page reload just to clear the badge
     if request.headers.get('X-Requested-With') == 'XMLHttpRequest' and request.GET.get('ajax_mark_read') == '1':
         # Only clear new booking request notifications for this church (owner-facing)
-        Notification.objects.filter(
+        marked = Notification.objects.filter(
             user=request.user,
             is_read=False,
             notification_type=Notification.TYPE_BOOKING_REQUESTED,
             church=church
         ).update(is_read=True, read_at=timezone.now())
+        # Queryset updates skip post_save, so invalidate the count ETag here
+        if marked:
+            bump_unread_count_version(request.user.id)
         return JsonResponse({'success': True})
     
     # Mark booking notifications as read when viewing appointments tab
@@ -624,12 +671,14 @@ def manage_church(request, church_id=None):
     current_tab = request.GET.get('tab', 'overview')
     if current_tab == 'appointments':
         # Clear owner-facing booking request notifications for this church
-        Notification.objects.filter(
+        marked = Notification.objects.filter(
             user=request.user,
             is_read=False,
             notification_type=Notification.TYPE_BOOKING_REQUESTED,
             church=church
         ).update(is_read=True, read_at=timezone.now())
+        if marked:
+            bump_unread_count_version(request.user.id)
     
     if request.method == 'POST' and request.POST.get('form_type') != 'verification':
         form = ChurchUpdateForm(request.POST, request.FILES, instance=church)
@@ -1228,7 +1277,7 @@ def get_church_followers_list(request, church_id):
                 'id': user.id,
                 'name': user.get_full_name() or user.username,
                 'email': user.email,
-                'avatar': profile.profile_image.url if profile and profile.profile_image else None,
+                'avatar': _profile_pic_url(profile),
                 'is_staff': user.id in existing_staff_ids
             })
         
@@ -1353,7 +1402,6 @@ def get_staff_activities(request, church_id, staff_id):
         staff_member = get_object_or_404(ChurchStaff, id=staff_id, church=church)
         
         # Get recent activities (last 50)
-        from core.models import StaffActivityLog
         activities = StaffActivityLog.objects.filter(
             staff=staff_member
         ).select_related('staff', 'church')[:50]
@@ -1434,8 +1482,7 @@ def update_church_logo(request):
     if getattr(file_obj, 'size', 0) > max_size:
         return JsonResponse({'success': False, 'message': 'File too large (max 10MB).'}, status=400)
 
-    import logging, traceback
-    logger = logging.getLogger(__name__)
+    import traceback
     try:
         # Optimize and save explicitly under churches/logos/
         try:
@@ -1479,9 +1526,6 @@ def update_church_cover(request):
     # Get church_id from POST data
     church_id = request.POST.get('church_id')
     
-    import logging
-    logger = logging.getLogger(__name__)
-    
     # Check permission: only parish managers (owners) and ministry leaders (volunteers) can change cover
     try:
         if church_id:
@@ -1530,8 +1574,7 @@ def update_church_cover(request):
     if getattr(file_obj, 'size', 0) > max_size:
         return JsonResponse({'success': False, 'message': 'File too large (max 10MB).'}, status=400)
 
-    import logging, traceback
-    logger = logging.getLogger(__name__)
+    import traceback
     try:
         # Optimize and save explicitly under churches/covers/
         try:
@@ -1584,7 +1627,6 @@ def follow_church(request, church_id):
             church.save(update_fields=['follower_count'])
             
             # Log activity
-            from .models import UserInteraction
             UserInteraction.log_activity(
                 user=request.user,
                 activity_type=UserInteraction.ACTIVITY_CHURCH_FOLLOW,
@@ -1622,7 +1664,6 @@ def unfollow_church(request, church_id):
             church.save(update_fields=['follower_count'])
             
             # Log activity
-            from .models import UserInteraction
             UserInteraction.log_activity(
                 user=request.user,
                 activity_type=UserInteraction.ACTIVITY_CHURCH_UNFOLLOW,
@@ -1857,6 +1898,19 @@ def settings_page(request):
     return render(request, 'app/page.html', ctx)
 
 
+def _service_review_summary():
+    """
+    Site-wide review average and count for the super admin cards, from one
+    aggregate query cached for a minute.
+    """
+    from .models import ServiceReview
+    return cache.get_or_set(
+        'super_admin_service_review_summary',
+        lambda: ServiceReview.objects.aggregate(avg=Avg('rating'), total=Count('id')),
+        60
+    )
+
+
 @login_required
 def super_admin_dashboard(request):
     """Super Admin dashboard for system-wide management.
@@ -1893,7 +1947,7 @@ def super_admin_dashboard(request):
     daily_labels = []
     if hasattr(User, 'last_login'):
         for i in range(13, -1, -1):  # Last 14 days
-            day = timezone.now() - timedelta(days=i)
+            day = now - timedelta(days=i)
             day_start = day.replace(hour=0, minute=0, second=0, microsecond=0)
             day_end = day_start + timedelta(days=1)
             
@@ -2007,7 +2061,7 @@ def super_admin_dashboard(request):
     }
     
     for i in range(6, -1, -1):  # Last 7 days (Mon to Sun)
-        day = timezone.now() - timedelta(days=i)
+        day = now - timedelta(days=i)
         day_start = day.replace(hour=0, minute=0, second=0, microsecond=0)
         day_end = day_start + timedelta(days=1)
         
@@ -2068,18 +2122,18 @@ def super_admin_dashboard(request):
     
     # Service Statistics (for new stat cards)
     try:
-        from .models import ServiceReview
         total_revenue = Booking.objects.filter(
             payment_status='paid'
         ).aggregate(total=Sum('service__price'))['total'] or 0
         
-        avg_rating = ServiceReview.objects.aggregate(avg=Avg('rating'))['avg']
+        review_summary = _service_review_summary()
+        avg_rating = review_summary['avg']
         if avg_rating:
             avg_rating = round(avg_rating, 1)
         else:
             avg_rating = 0
         
-        total_reviews = ServiceReview.objects.count()
+        total_reviews = review_summary['total']
     except:
         total_revenue = 0
         avg_rating = 0
@@ -3016,9 +3070,6 @@ def super_admin_create_church(request):
     """Super Admin view to create a church and assign a user as manager.
     Access is restricted to superusers.
     """
-    import logging
-    logger = logging.getLogger(__name__)
-    
     if not request.user.is_superuser:
         messages.error(request, 'You do not have permission to access Super Admin.')
         return redirect('core:home')
@@ -3153,20 +3204,24 @@ def super_admin_users(request):
     page_number = request.GET.get('page', 1)
     users_page = paginator.get_page(page_number)
     
-    # Statistics
-    total_users = User.objects.count()
-    active_users = User.objects.filter(is_active=True).count()
+    # Statistics, including new users this week, in one aggregate query
+    week_ago = timezone.now() - timedelta(days=7)
+    user_stats = User.objects.aggregate(
+        total=Count('id'),
+        active=Count('id', filter=Q(is_active=True)),
+        inactive=Count('id', filter=Q(is_active=False)),
+        joined_this_week=Count('id', filter=Q(date_joined__gte=week_ago)),
+    )
+    total_users = user_stats['total']
+    active_users = user_stats['active']
     church_admins = User.objects.filter(owned_churches__isnull=False).distinct().count()
-    inactive_users = User.objects.filter(is_active=False).count()
+    inactive_users = user_stats['inactive']
+    new_users_this_week = user_stats['joined_this_week']
     
     # Calculate percentages
     active_percentage = round((active_users / total_users * 100)) if total_users > 0 else 0
     inactive_percentage = round((inactive_users / total_users * 100)) if total_users > 0 else 0
     
-    # New users this week
-    week_ago = timezone.now() - timedelta(days=7)
-    new_users_this_week = User.objects.filter(date_joined__gte=week_ago).count()
-    
     # Total churches for church admins stat
     total_churches = Church.objects.count()
     
@@ -3524,7 +3579,6 @@ def create_service(request):
             service = form.save()
             
             # Log staff activity for service creation
-            from .models import StaffActivityLog
             log_staff_activity(
                 user=request.user,
                 church=church,
@@ -3611,7 +3665,6 @@ def edit_service(request, service_id):
             form.save()
             
             # Log staff activity for service update
-            from .models import StaffActivityLog
             log_staff_activity(
                 user=request.user,
                 church=church,
@@ -3684,7 +3737,6 @@ def delete_service(request, service_id):
         service_id = service.id
         
         # Log staff activity for service deletion
-        from .models import StaffActivityLog
         log_staff_activity(
             user=request.user,
             church=church,
@@ -3971,7 +4023,6 @@ def book_service(request, service_id):
             booking = form.save()
             
             # Log activity
-            from .models import UserInteraction
             UserInteraction.log_activity(
                 user=request.user,
                 activity_type=UserInteraction.ACTIVITY_BOOKING_CREATE,
@@ -4051,7 +4102,6 @@ def create_booking_api(request):
             booking = form.save()
             
             # Log activity
-            from .models import UserInteraction
             UserInteraction.log_activity(
                 user=request.user,
                 activity_type=UserInteraction.ACTIVITY_BOOKING_CREATE,
@@ -4121,7 +4171,6 @@ def manage_booking(request, booking_id):
             booking.save(update_fields=['status', 'status_changed_at', 'updated_at', 'cancel_reason', 'decline_reason', 'handled_by'])
             
             # Log staff activity for booking management
-            from .models import StaffActivityLog
             action_map = {
                 Booking.STATUS_APPROVED: (StaffActivityLog.ACTION_APPROVE, f"Approved booking #{booking.code} for {booking.user.get_full_name()}"),
                 Booking.STATUS_DECLINED: (StaffActivityLog.ACTION_REJECT, f"Declined booking #{booking.code} for {booking.user.get_full_name()}: {booking.decline_reason}"),
@@ -4143,7 +4192,6 @@ def manage_booking(request, booking_id):
                 )
             
             # Log activity for booking update
-            from .models import UserInteraction
             UserInteraction.log_activity(
                 user=booking.user,  # Log for the booking owner, not the church owner
                 activity_type=UserInteraction.ACTIVITY_BOOKING_UPDATE,
@@ -4440,9 +4488,7 @@ def search_users_api(request):
             display_name = user.profile.display_name
         
         # Get avatar
-        avatar = None
-        if hasattr(user, 'profile') and user.profile and user.profile.profile_image:
-            avatar = user.profile.profile_image.url
+        avatar = _profile_pic_url(getattr(user, 'profile', None))
         
         # Get phone number
         phone = None
@@ -4499,8 +4545,6 @@ def create_decline_reason(request):
             church = request.user.owned_churches.get(id=church_id)
         else:
             # Log warning when falling back to first church
-            import logging
-            logger = logging.getLogger(__name__)
             logger.warning(f"create_decline_reason: No church_id provided for user {request.user.id}, falling back to first church")
             church = request.user.owned_churches.first()
             if not church:
@@ -4792,11 +4836,12 @@ def super_admin_church_detail(request, church_id):
     
     # === CHART DATA CALCULATIONS ===
     
+    now = timezone.now()
     # 1. Booking Trends (Last 30 days)
     booking_trends_labels = []
     booking_trends_data = []
     for i in range(29, -1, -1):
-        day = timezone.now() - timedelta(days=i)
+        day = now - timedelta(days=i)
         day_start = day.replace(hour=0, minute=0, second=0, microsecond=0)
         day_end = day_start + timedelta(days=1)
         
@@ -4835,7 +4880,7 @@ def super_admin_church_detail(request, church_id):
     
     # Generate labels
     for i in range(29, -1, -1):
-        day = timezone.now() - timedelta(days=i)
+        day = now - timedelta(days=i)
         service_trend_labels.append(day.strftime('%b %d'))
     
     # Generate datasets for each category
@@ -4848,7 +4893,7 @@ def super_admin_church_detail(request, church_id):
     for idx, category in enumerate(categories):
         category_data = []
         for i in range(29, -1, -1):
-            day = timezone.now() - timedelta(days=i)
+            day = now - timedelta(days=i)
             day_start = day.replace(hour=0, minute=0, second=0, microsecond=0)
             day_end = day_start + timedelta(days=1)
             
@@ -4898,7 +4943,7 @@ def super_admin_church_detail(request, church_id):
     engagement_bookmarks = []
     
     for i in range(29, -1, -1):
-        day = timezone.now() - timedelta(days=i)
+        day = now - timedelta(days=i)
         day_start = day.replace(hour=0, minute=0, second=0, microsecond=0)
         day_end = day_start + timedelta(days=1)
         
@@ -4977,10 +5022,11 @@ def super_admin_verifications(request):
     ).count()
 
     # Church creation over time (last 30 days)
+    now = timezone.now()
     church_creation_data = []
     church_creation_labels = []
     for i in range(29, -1, -1):  # Last 30 days
-        day = timezone.now() - timedelta(days=i)
+        day = now - timedelta(days=i)
         day_start = day.replace(hour=0, minute=0, second=0, microsecond=0)
         day_end = day_start + timedelta(days=1)
         
@@ -5224,9 +5270,9 @@ def create_availability(request):
                 availability = form.save()
                 
                 # Log staff activity for availability creation
-                from .models import StaffActivityLog
                 status_desc = "closed" if availability.is_closed else "special hours"
-                log_staff_activity(
+                transaction.on_commit(partial(
+                    log_staff_activity,
                     user=request.user,
                     church=church,
                     action=StaffActivityLog.ACTION_CREATE,
@@ -5235,7 +5281,7 @@ def create_availability(request):
                     target_id=availability.id,
                     target_type='availability',
                     request=request
-                )
+                ))
                 
                 messages.success(request, f'Availability entry for {availability.date} has been created successfully!')
                 return HttpResponseRedirect(reverse('core:manage_church', kwargs={'church_id': church.id}) + '?tab=availability')
@@ -5281,7 +5327,7 @@ def create_availability(request):
 def edit_availability(request, availability_id):
     """Edit an availability entry."""
     # Get the availability first to determine its church
-    availability = get_object_or_404(Availability, id=availability_id)
+    availability = get_object_or_404(Availability.objects.select_related('church'), id=availability_id)
     church = availability.church
     
     # Check if user can manage availability (Owner or Secretary)
@@ -5296,9 +5342,9 @@ def edit_availability(request, availability_id):
             form.save()
             
             # Log staff activity for availability update
-            from .models import StaffActivityLog
             status_desc = "closed" if availability.is_closed else "special hours"
-            log_staff_activity(
+            transaction.on_commit(partial(
+                log_staff_activity,
                 user=request.user,
                 church=church,
                 action=StaffActivityLog.ACTION_UPDATE,
@@ -5307,7 +5353,7 @@ def edit_availability(request, availability_id):
                 target_id=availability.id,
                 target_type='availability',
                 request=request
-            )
+            ))
             
             messages.success(request, f'Availability entry for {availability.date} has been updated successfully!')
             return HttpResponseRedirect(reverse('core:manage_church', kwargs={'church_id': church.id}) + '?tab=availability')
@@ -5331,7 +5377,13 @@ def edit_availability(request, availability_id):
 def delete_availability(request, availability_id):
     """Delete an availability entry."""
     # Get the availability first to determine its church
-    availability = get_object_or_404(Availability, id=availability_id)
+    availability = get_object_or_404(
+        Availability.objects.select_related('church').only(
+            'id', 'date', 'is_closed', 'start_time', 'end_time', 'reason', 'notes',
+            'church__id', 'church__name', 'church__owner',
+        ),
+        id=availability_id,
+    )
     church = availability.church
     
     # Check if user can manage availability (Owner or Secretary)
@@ -5407,35 +5459,40 @@ def bulk_availability(request):
             from datetime import datetime
             dates = [datetime.strptime(d.strip(), '%Y-%m-%d').date() for d in dates_str.split(',') if d.strip()]
             
-            created_count = 0
-            for date in dates:
-                availability, created = Availability.objects.get_or_create(
-                    church=church,
-                    date=date,
-                    defaults={
-                        'type': 'closed_date' if action == 'close' else 'special_hours',
-                        'is_closed': action == 'close',
-                        'start_time': start_time if action == 'special_hours' else None,
-                        'end_time': end_time if action == 'special_hours' else None,
-                        'reason': reason,
-                        'notes': notes,
-                    }
-                )
-                if created:
-                    created_count += 1
-                else:
-                    # Update existing entry
-                    availability.type = 'closed_date' if action == 'close' else 'special_hours'
-                    availability.is_closed = action == 'close'
-                    if action == 'special_hours':
-                        availability.start_time = start_time
-                        availability.end_time = end_time
+            values = {
+                'type': 'closed_date' if action == 'close' else 'special_hours',
+                'is_closed': action == 'close',
+                'start_time': start_time if action == 'special_hours' else None,
+                'end_time': end_time if action == 'special_hours' else None,
+                'reason': reason,
+                'notes': notes,
+            }
+            
+            # Lock the church's existing entries for these dates, then write all
+            # updates and inserts in one transaction
+            with transaction.atomic():
+                existing = {
+                    availability.date: availability
+                    for availability in Availability.objects.select_for_update().filter(church=church, date__in=dates)
+                }
+                to_update = []
+                to_create = []
+                for day in dict.fromkeys(dates):
+                    availability = existing.get(day)
+                    if availability is None:
+                        to_create.append(Availability(church=church, date=day, **values))
                     else:
-                        availability.start_time = None
-                        availability.end_time = None
-                    availability.reason = reason
-                    availability.notes = notes
-                    availability.save()
+                        for field, value in values.items():
+                            setattr(availability, field, value)
+                        to_update.append(availability)
+                
+                if to_update:
+                    now = timezone.now()
+                    for availability in to_update:
+                        availability.updated_at = now
+                    Availability.objects.bulk_update(to_update, [*values, 'updated_at'])
+                Availability.objects.bulk_create(to_create)
+            created_count = len(to_create)
             
             messages.success(request, f'Successfully updated availability for {created_count} dates!')
             return HttpResponseRedirect(reverse('core:manage_church') + '?tab=availability')
@@ -5475,24 +5532,24 @@ def create_post(request, church_slug):
                 post.church = church
                 post.save()
                 
-                # Handle multiple images
+                # Handle multiple images: size-check each file once, keeping its
+                # original position as the display order
                 images = request.FILES.getlist('images')
-                if images:
-                    from .models import PostImage
-                    for index, image_file in enumerate(images):
-                        # Validate each image
-                        if image_file.size > 10 * 1024 * 1024:  # 10MB limit per image
-                            continue  # Skip large images
-                        
-                        # Create PostImage record
-                        PostImage.objects.create(
-                            post=post,
-                            image=image_file,
-                            order=index
-                        )
+                valid_images = [
+                    (index, image_file) for index, image_file in enumerate(images)
+                    if image_file.size <= 10 * 1024 * 1024  # 10MB limit per image
+                ]
+                skipped_images = len(images) - len(valid_images)
+                for index, image_file in valid_images:
+                    PostImage.objects.create(
+                        post=post,
+                        image=image_file,
+                        order=index
+                    )
                 
-                # Log activity if staff member
-                log_staff_activity(
+                # Log activity if staff member (after commit, off the critical path)
+                transaction.on_commit(partial(
+                    log_staff_activity,
                     user=request.user,
                     church=church,
                     action='create',
@@ -5501,7 +5558,7 @@ def create_post(request, church_slug):
                     target_id=post.id,
                     target_type='post',
                     request=request
-                )
+                ))
                 
                 # Return JSON for AJAX requests
                 if request.headers.get('X-Requested-With') == 'XMLHttpRequest':
@@ -5513,12 +5570,15 @@ def create_post(request, church_slug):
                             'content': post.content,
                             'post_type': post.post_type,
                             'image_url': post.image.url if post.image else None,
-                            'images_count': post.images.count(),
+                            'images_count': len(valid_images),
                             'created_at': post.created_at.strftime('%B %d, %Y at %I:%M %p')
-                        }
+                        },
+                        'skipped_images': skipped_images,
                     })
                 
                 messages.success(request, 'Post created successfully!')
+                if skipped_images:
+                    messages.warning(request, f'{skipped_images} image(s) larger than 10MB were skipped.')
                 return redirect('core:church_detail', slug=church.slug)
             except Exception as e:
                 if request.headers.get('X-Requested-With') == 'XMLHttpRequest':
@@ -5548,7 +5608,13 @@ def create_post(request, church_slug):
 @login_required
 def edit_post(request, post_id):
     """Edit an existing post."""
-    post = get_object_or_404(Post, id=post_id, is_active=True)
+    post = get_object_or_404(
+        Post.objects.select_related('church').only(
+            'id', 'content', 'image', 'created_at', 'updated_at', 'church__id', 'church__owner',
+        ),
+        id=post_id,
+        is_active=True,
+    )
     
     # Check if user can manage content (Owner or Ministry Leader)
     can_manage, role = user_can_manage_church(request.user, post.church, ['content'])
@@ -5629,24 +5695,11 @@ def notifications(request):
     # Backward compatibility: also respect unread=true query param
     unread_only = request.GET.get('unread', 'false').lower() == 'true' or filter_type == 'unread'
 
-    # Category groupings for common filters
+    # Category filters map onto the indexed Notification.category column
     category_map = {
-        'bookings': [
-            Notification.TYPE_BOOKING_REQUESTED,
-            Notification.TYPE_BOOKING_REVIEWED,
-            Notification.TYPE_BOOKING_APPROVED,
-            Notification.TYPE_BOOKING_DECLINED,
-            Notification.TYPE_BOOKING_CANCELED,
-            Notification.TYPE_BOOKING_COMPLETED,
-        ],
-        'church': [
-            Notification.TYPE_CHURCH_APPROVED,
-            Notification.TYPE_CHURCH_DECLINED,
-        ],
-        'follows': [
-            Notification.TYPE_FOLLOW_REQUEST,
-            Notification.TYPE_FOLLOW_ACCEPTED,
-        ],
+        'bookings': Notification.CATEGORY_BOOKINGS,
+        'church': Notification.CATEGORY_CHURCH,
+        'follows': Notification.CATEGORY_FOLLOWS,
     }
 
     # Base queryset
@@ -5657,7 +5710,7 @@ def notifications(request):
         base_queryset = base_queryset.filter(is_read=False)
 
     if filter_type in category_map:
-        base_queryset = base_queryset.filter(notification_type__in=category_map[filter_type])
+        base_queryset = base_queryset.filter(category=category_map[filter_type])
 
     # Get notifications with limit
     notifications_qs = base_queryset[:50]
@@ -5667,9 +5720,9 @@ def notifications(request):
     counts = {
         'all': all_notifications.count(),
         'unread': all_notifications.filter(is_read=False).count(),
-        'bookings': all_notifications.filter(notification_type__in=category_map['bookings']).count(),
-        'church': all_notifications.filter(notification_type__in=category_map['church']).count(),
-        'follows': all_notifications.filter(notification_type__in=category_map['follows']).count(),
+        'bookings': all_notifications.filter(category=Notification.CATEGORY_BOOKINGS).count(),
+        'church': all_notifications.filter(category=Notification.CATEGORY_CHURCH).count(),
+        'follows': all_notifications.filter(category=Notification.CATEGORY_FOLLOWS).count(),
     }
 
     ctx = {
@@ -5786,21 +5839,33 @@ def mark_all_notifications_read(request):
         return redirect('core:notifications')
 
 
+def _notification_count_etag(request):
+    """ETag for notification_count; changes whenever the user's notifications do."""
+    if not request.user.is_authenticated:
+        return None
+    from .notifications import get_unread_count_version
+    return f'{request.user.id}-{get_unread_count_version(request.user.id)}'
+
+
+@cache_control(private=True, no_cache=True)
+@condition(etag_func=_notification_count_etag)
 def notification_count(request):
-    """AJAX endpoint to get unread notification count."""
+    """AJAX endpoint to get unread notification count.
+
+    Polling clients send back the ETag, and get a 304 without a COUNT query
+    until one of their notifications changes.
+    """
     if not request.user.is_authenticated:
-        return JsonResponse({'count': 0, 'authenticated': False})
+        return ORJsonResponse({'count': 0, 'authenticated': False})
     
     try:
         from .notifications import get_user_unread_count
         count = get_user_unread_count(request.user)
-        return JsonResponse({'count': count, 'authenticated': True})
+        return ORJsonResponse({'count': count, 'authenticated': True})
     except Exception as e:
         # Log the error and return a safe response
-        import logging
-        logger = logging.getLogger(__name__)
         logger.error(f"Error getting notification count for user {request.user}: {str(e)}")
-        return JsonResponse({'count': 0, 'authenticated': True, 'error': 'Failed to fetch count'})
+        return ORJsonResponse({'count': 0, 'authenticated': True, 'error': 'Failed to fetch count'})
 
 
 # Service API - Test endpoint
@@ -5815,14 +5880,11 @@ def api_test(request):
 
 def api_get_service(request, service_id):
     """API endpoint to fetch service data for booking modal."""
-    # Add CORS headers for debugging
-    from django.http import JsonResponse
-    
     # Always return JSON, even for errors
     try:
         # Check if user is authenticated
         if not request.user.is_authenticated:
-            return JsonResponse({
+            return ORJsonResponse({
                 'success': False,
                 'error': 'Authentication required.'
             }, status=401)
@@ -5832,7 +5894,7 @@ def api_get_service(request, service_id):
         
         # Check if church is verified (required for bookings)
         if not church.is_verified:
-            return JsonResponse({
+            return ORJsonResponse({
                 'success': False,
                 'error': 'This church is not yet verified and cannot accept appointment requests.'
             }, status=400)
@@ -5852,7 +5914,7 @@ def api_get_service(request, service_id):
             'advance_booking_days': service.advance_booking_days,
             'is_free': service.is_free,
             'currency': service.currency,
-            'raw_price': float(service.price) if service.price else 0.0,
+            'raw_price': service.price or 0.0,
             'duration_minutes': service.duration,
             'category': {
                 'id': service.category.id,
@@ -5870,21 +5932,21 @@ def api_get_service(request, service_id):
             'is_verified': church.is_verified
         }
         
-        return JsonResponse({
+        return ORJsonResponse({
             'success': True,
             'service': service_data,
             'church': church_data
         }, status=200)
         
     except BookableService.DoesNotExist:
-        return JsonResponse({
+        return ORJsonResponse({
             'success': False,
             'error': 'Service not found or is not active.'
         }, status=404)
         
     except Exception as e:
         logger.error(f'API Service fetch error: {str(e)}')
-        return JsonResponse({
+        return ORJsonResponse({
             'success': False,
             'error': 'An error occurred while fetching service data.'
         }, status=500)
@@ -5895,28 +5957,34 @@ def api_get_church_services(request, church_id):
     try:
         church = get_object_or_404(Church, id=church_id, is_active=True)
         
-        # Get all active bookable services for this church
-        services = church.bookable_services.filter(is_active=True).prefetch_related('service_images').order_by('name')
-        
-        services_data = []
-        for service in services:
-            # Get the first image if available
-            images = service.get_images()
-            image_url = images[0].image.url if images else None
-            
-            services_data.append({
-                'id': service.id,
-                'name': service.name,
-                'description': service.description or 'No description provided.',
-                'duration': service.duration_display,
-                'price': service.price_display,
-                'is_free': service.is_free,
-                'currency': service.currency,
-                'image_url': image_url,
-                'advance_booking_days': service.advance_booking_days,
-            })
+        # Get all active bookable services for this church as plain rows,
+        # joining the first gallery image instead of loading every image
+        first_image = ServiceImage.objects.filter(
+            service=OuterRef('pk')
+        ).order_by('order', 'created_at').values('image')[:1]
+        services = church.bookable_services.filter(is_active=True).annotate(
+            first_image=Subquery(first_image)
+        ).order_by('name').values(
+            'id', 'name', 'description', 'duration', 'price', 'is_free',
+            'currency', 'advance_booking_days', 'first_image',
+        )
         
-        return JsonResponse({
+        services_data = [
+            {
+                'id': service['id'],
+                'name': service['name'],
+                'description': service['description'] or 'No description provided.',
+                'duration': BookableService.format_duration(service['duration']),
+                'price': BookableService.format_price(service['is_free'], service['price'], service['currency']),
+                'is_free': service['is_free'],
+                'currency': service['currency'],
+                'image_url': default_storage.url(service['first_image']) if service['first_image'] else None,
+                'advance_booking_days': service['advance_booking_days'],
+            }
+            for service in services
+        ]
+        
+        return ORJsonResponse({
             'success': True,
             'church_id': church.id,
             'church_name': church.name,
@@ -5925,19 +5993,24 @@ def api_get_church_services(request, church_id):
         }, status=200)
         
     except Church.DoesNotExist:
-        return JsonResponse({
+        return ORJsonResponse({
             'success': False,
             'error': 'Church not found.'
         }, status=404)
         
     except Exception as e:
         logger.error(f'API Church Services fetch error: {str(e)}')
-        return JsonResponse({
+        return ORJsonResponse({
             'success': False,
             'error': 'An error occurred while fetching church services.'
         }, status=500)
 
 
+def _profile_pic_url(profile):
+    """Return the profile picture URL for a (possibly missing) profile."""
+    return profile.profile_image.url if profile and profile.profile_image else None
+
+
 @login_required
 def toggle_post_like(request, post_id):
     """AJAX endpoint to toggle like on a post."""
@@ -5945,10 +6018,10 @@ def toggle_post_like(request, post_id):
         return JsonResponse({'success': False, 'message': 'Invalid request method'}, status=405)
     
     try:
-        post = get_object_or_404(Post, id=post_id, is_active=True)
+        post = get_object_or_404(Post.objects.only('id', 'like_count'), id=post_id, is_active=True)
         
         # Check if user already liked the post
-        like, created = PostLike.objects.get_or_create(
+        _, created = PostLike.objects.get_or_create(
             user=request.user,
             post=post
         )
@@ -5957,34 +6030,42 @@ def toggle_post_like(request, post_id):
             # User liked the post
             action = 'liked'
             message = 'Post liked'
+            Post.objects.filter(pk=post.pk).update(like_count=F('like_count') + 1)
+            like_count = post.like_count + 1
             # Log activity
-            from .models import UserInteraction
-            UserInteraction.log_activity(
+            transaction.on_commit(partial(
+                UserInteraction.log_activity,
                 user=request.user,
                 activity_type=UserInteraction.ACTIVITY_POST_LIKE,
                 content_object=post,
                 request=request
-            )
+            ))
         else:
-            # User already liked, so unlike it
-            like.delete()
+            # User already liked, so unlike it; only the request that actually
+            # removed the row decrements, so racing unlikes can't double-count
+            deleted, _ = PostLike.objects.filter(user=request.user, post=post).delete()
             action = 'unliked'
             message = 'Post unliked'
-            # Log activity
-            from .models import UserInteraction
-            UserInteraction.log_activity(
-                user=request.user,
-                activity_type=UserInteraction.ACTIVITY_POST_UNLIKE,
-                content_object=post,
-                request=request
-            )
+            if deleted:
+                Post.objects.filter(pk=post.pk, like_count__gt=0).update(like_count=F('like_count') - 1)
+                like_count = max(post.like_count - 1, 0)
+                # Log activity
+                transaction.on_commit(partial(
+                    UserInteraction.log_activity,
+                    user=request.user,
+                    activity_type=UserInteraction.ACTIVITY_POST_UNLIKE,
+                    content_object=post,
+                    request=request
+                ))
+            else:
+                like_count = post.like_count
         
         return JsonResponse({
             'success': True,
             'action': action,
             'message': message,
-            'like_count': post.like_count,
-            'is_liked': post.is_liked_by(request.user)
+            'like_count': like_count,
+            'is_liked': created
         })
         
     except Post.DoesNotExist:
@@ -5997,18 +6078,26 @@ def toggle_post_like(request, post_id):
 def add_post_comment(request, post_id):
     """AJAX endpoint to add a comment to a post."""
     if request.method != 'POST':
-        return JsonResponse({'success': False, 'message': 'Invalid request method'}, status=405)
+        return ORJsonResponse({'success': False, 'message': 'Invalid request method'}, status=405)
     
     try:
-        post = get_object_or_404(Post, id=post_id, is_active=True)
+        # Read the current comment total with the existence check so the new
+        # count can be returned without a second COUNT query
+        post = get_object_or_404(
+            Post.objects.only('id').annotate(
+                comments_count=Count('comments', filter=Q(comments__is_active=True))
+            ),
+            id=post_id,
+            is_active=True
+        )
         content = request.POST.get('content', '').strip()
         parent_id = request.POST.get('parent_id')
         
         if not content:
-            return JsonResponse({'success': False, 'message': 'Comment content is required'}, status=400)
+            return ORJsonResponse({'success': False, 'message': 'Comment content is required'}, status=400)
         
         if len(content) > 500:
-            return JsonResponse({'success': False, 'message': 'Comment is too long (max 500 characters)'}, status=400)
+            return ORJsonResponse({'success': False, 'message': 'Comment is too long (max 500 characters)'}, status=400)
         
         # Handle reply to another comment
         parent_comment = None
@@ -6016,7 +6105,7 @@ def add_post_comment(request, post_id):
             try:
                 parent_comment = PostComment.objects.get(id=parent_id, post=post, is_active=True)
             except PostComment.DoesNotExist:
-                return JsonResponse({'success': False, 'message': 'Parent comment not found'}, status=404)
+                return ORJsonResponse({'success': False, 'message': 'Parent comment not found'}, status=404)
         
         # Create the comment
         comment = PostComment.objects.create(
@@ -6027,8 +6116,8 @@ def add_post_comment(request, post_id):
         )
         
         # Log activity
-        from .models import UserInteraction
-        UserInteraction.log_activity(
+        transaction.on_commit(partial(
+            UserInteraction.log_activity,
             user=request.user,
             activity_type=UserInteraction.ACTIVITY_POST_COMMENT,
             content_object=post,
@@ -6038,26 +6127,18 @@ def add_post_comment(request, post_id):
                 'parent_comment_id': parent_comment.id if parent_comment else None
             },
             request=request
-        )
-        
-        # Get user display data
-        user_display_name, user_initial = get_user_display_data(request.user, getattr(request.user, 'profile', None))
+        ))
         
-        # Get user profile picture
+        # Get user display data and profile picture
         user_profile = getattr(request.user, 'profile', None)
-        user_profile_picture = None
-        if user_profile:
-            try:
-                if user_profile.profile_image:
-                    user_profile_picture = user_profile.profile_image.url
-            except:
-                pass
+        user_display_name, user_initial = get_user_display_data(request.user, user_profile)
+        user_profile_picture = _profile_pic_url(user_profile)
         
         # Get donation rank
         from accounts.donation_utils import get_user_donation_rank
         user_rank = get_user_donation_rank(request.user)
         
-        return JsonResponse({
+        return ORJsonResponse({
             'success': True,
             'message': 'Comment added successfully',
             'comment': {
@@ -6066,68 +6147,75 @@ def add_post_comment(request, post_id):
                 'user_name': user_display_name,
                 'user_initial': user_initial,
                 'user_profile_picture': user_profile_picture,
-                'created_at': comment.created_at.isoformat(),
+                'created_at': comment.created_at,
                 'is_reply': comment.is_reply,
                 'parent_id': parent_comment.id if parent_comment else None,
                 'donation_rank': user_rank
             },
-            'comment_count': post.comment_count
+            'comment_count': post.comments_count + 1
         })
         
     except Post.DoesNotExist:
-        return JsonResponse({'success': False, 'message': 'Post not found'}, status=404)
+        return ORJsonResponse({'success': False, 'message': 'Post not found'}, status=404)
     except Exception as e:
-        return JsonResponse({'success': False, 'message': 'An error occurred'}, status=500)
+        return ORJsonResponse({'success': False, 'message': 'An error occurred'}, status=500)
 
 
 @login_required
 def get_post_comments(request, post_id):
     """AJAX endpoint to get comments for a post."""
+    # The thread is the same for every viewer, so serve it from the cache
+    # until a comment is saved or the short timeout passes
+    cache_key = PostComment.THREAD_CACHE_KEY.format(post_id=post_id)
+    cached = cache.get(cache_key)
+    if cached is not None:
+        return HttpResponse(cached, content_type='application/json')
+    
     try:
-        post = get_object_or_404(Post, id=post_id, is_active=True)
+        post = get_object_or_404(Post.objects.only('id'), id=post_id, is_active=True)
         
-        # Get all top-level comments (not replies)
-        comments = PostComment.objects.filter(
+        # Get all top-level comments (not replies), with their active replies
+        # prefetched in a single extra query
+        comments = list(PostComment.objects.filter(
             post=post, 
             is_active=True, 
             parent__isnull=True
-        ).select_related('user', 'user__profile').order_by('created_at')
-        
-        # Import donation rank utility
-        from accounts.donation_utils import get_user_donation_rank
+        ).select_related('user', 'user__profile').prefetch_related(
+            Prefetch(
+                'replies',
+                queryset=PostComment.objects.filter(is_active=True).select_related('user', 'user__profile').order_by('created_at'),
+                to_attr='active_replies',
+            )
+        ).order_by('created_at'))
+        
+        # Resolve donation ranks for all commenters in one query, and display
+        # data once per distinct user
+        from accounts.donation_utils import get_user_donation_ranks
+        users = {comment.user_id: comment.user for comment in comments}
+        users.update({
+            reply.user_id: reply.user
+            for comment in comments
+            for reply in comment.active_replies
+        })
+        rank_map = get_user_donation_ranks(users.values())
+        display_map = {}
+        picture_map = {}
+        for user_id, user in users.items():
+            user_profile = getattr(user, 'profile', None)
+            display_map[user_id] = get_user_display_data(user, user_profile)
+            picture_map[user_id] = _profile_pic_url(user_profile)
         
         comments_data = []
         for comment in comments:
-            user_display_name, user_initial = get_user_display_data(comment.user, getattr(comment.user, 'profile', None))
-            user_rank = get_user_donation_rank(comment.user)
+            user_display_name, user_initial = display_map[comment.user_id]
+            user_rank = rank_map[comment.user_id]
+            user_profile_picture = picture_map[comment.user_id]
             
-            # Get user profile picture
-            user_profile = getattr(comment.user, 'profile', None)
-            user_profile_picture = None
-            if user_profile:
-                try:
-                    if user_profile.profile_image:
-                        user_profile_picture = user_profile.profile_image.url
-                except:
-                    pass
-            
-            # Get replies for this comment
-            replies = comment.replies.filter(is_active=True).select_related('user', 'user__profile').order_by('created_at')
             replies_data = []
-            
-            for reply in replies:
-                reply_user_display_name, reply_user_initial = get_user_display_data(reply.user, getattr(reply.user, 'profile', None))
-                reply_rank = get_user_donation_rank(reply.user)
-                
-                # Get reply user profile picture
-                reply_profile = getattr(reply.user, 'profile', None)
-                reply_profile_picture = None
-                if reply_profile:
-                    try:
-                        if reply_profile.profile_image:
-                            reply_profile_picture = reply_profile.profile_image.url
-                    except:
-                        pass
+            for reply in comment.active_replies:
+                reply_user_display_name, reply_user_initial = display_map[reply.user_id]
+                reply_rank = rank_map[reply.user_id]
+                reply_profile_picture = picture_map[reply.user_id]
                 
                 replies_data.append({
                     'id': reply.id,
@@ -6135,7 +6223,7 @@ def get_post_comments(request, post_id):
                     'user_name': reply_user_display_name,
                     'user_initial': reply_user_initial,
                     'user_profile_picture': reply_profile_picture,
-                    'created_at': reply.created_at.isoformat(),
+                    'created_at': reply.created_at,
                     'is_reply': True,
                     'parent_id': comment.id,
                     'donation_rank': reply_rank
@@ -6147,23 +6235,25 @@ def get_post_comments(request, post_id):
                 'user_name': user_display_name,
                 'user_initial': user_initial,
                 'user_profile_picture': user_profile_picture,
-                'created_at': comment.created_at.isoformat(),
+                'created_at': comment.created_at,
                 'is_reply': False,
                 'replies': replies_data,
                 'reply_count': len(replies_data),
                 'donation_rank': user_rank
             })
         
-        return JsonResponse({
+        response = ORJsonResponse({
             'success': True,
             'comments': comments_data,
             'comment_count': len(comments_data)
         })
+        cache.set(cache_key, response.content, PostComment.THREAD_CACHE_TIMEOUT)
+        return response
         
     except Post.DoesNotExist:
-        return JsonResponse({'success': False, 'message': 'Post not found'}, status=404)
+        return ORJsonResponse({'success': False, 'message': 'Post not found'}, status=404)
     except Exception as e:
-        return JsonResponse({'success': False, 'message': 'An error occurred'}, status=500)
+        return ORJsonResponse({'success': False, 'message': 'An error occurred'}, status=500)
 
 
 @login_required 
@@ -6173,7 +6263,13 @@ def share_post(request, post_id):
         return JsonResponse({'success': False, 'message': 'Invalid request method'}, status=405)
     
     try:
-        post = get_object_or_404(Post, id=post_id, is_active=True)
+        post = get_object_or_404(
+            Post.objects.select_related('church').only(
+                'id', 'post_type', 'event_title', 'content', 'church__slug', 'church__name'
+            ),
+            id=post_id,
+            is_active=True
+        )
         
         # Build share URL pointing to church detail page with post anchor
         church_url = reverse('core:church_detail', kwargs={'slug': post.church.slug})
@@ -6210,52 +6306,36 @@ def track_post_view(request, post_id):
         return JsonResponse({'success': False, 'message': 'Invalid request method'}, status=405)
     
     try:
-        post = get_object_or_404(Post, id=post_id, is_active=True)
+        post = get_object_or_404(Post.objects.only('id', 'view_count'), id=post_id, is_active=True)
         
         # Get client info
         ip_address = get_client_ip(request)
         user_agent = request.META.get('HTTP_USER_AGENT', '')[:500]
         user = request.user if request.user.is_authenticated else None
         
-        # Check if this view should be counted (prevent spam)
-        should_count = True
-        
-        # For authenticated users, check if they viewed this post in the last hour
-        if user:
-            recent_view = PostView.objects.filter(
-                post=post,
-                user=user,
-                viewed_at__gte=timezone.now() - timezone.timedelta(hours=1)
-            ).exists()
-            should_count = not recent_view
-        else:
-            # For anonymous users, check by IP in the last hour
-            recent_view = PostView.objects.filter(
-                post=post,
-                ip_address=ip_address,
-                viewed_at__gte=timezone.now() - timezone.timedelta(hours=1)
-            ).exists()
-            should_count = not recent_view
+        # Count at most one view per viewer per clock hour (prevent spam):
+        # authenticated users are keyed by user, anonymous visitors by IP.
+        # The unique constraints on PostView make get_or_create race-safe.
+        lookup = {
+            'post': post,
+            'user': user,
+            'viewed_hour': timezone.now().replace(minute=0, second=0, microsecond=0),
+        }
+        if not user:
+            lookup['ip_address'] = ip_address
+        _, should_count = PostView.objects.get_or_create(
+            **lookup,
+            defaults={'ip_address': ip_address, 'user_agent': user_agent}
+        )
         
+        view_count = post.view_count
         if should_count:
-            # Create view record
-            PostView.objects.create(
-                post=post,
-                user=user,
-                ip_address=ip_address,
-                user_agent=user_agent
-            )
-            
-            # Increment post view count
-            post.view_count = F('view_count') + 1
-            post.save(update_fields=['view_count'])
-            
-            # Refresh to get updated count
-            post.refresh_from_db()
+            # Increment post view count without re-reading the row
+            Post.objects.filter(pk=post.pk).update(view_count=F('view_count') + 1)
+            view_count += 1
             
             # Log activity for authenticated users
             if user:
-                from .models import UserInteraction
                 UserInteraction.log_activity(
                     user=user,
                     activity_type=UserInteraction.ACTIVITY_POST_VIEW,
@@ -6265,7 +6345,7 @@ def track_post_view(request, post_id):
         
         return JsonResponse({
             'success': True,
-            'view_count': post.view_count,
+            'view_count': view_count,
             'counted': should_count
         })
         
@@ -6275,6 +6355,126 @@ def track_post_view(request, post_id):
         return JsonResponse({'success': False, 'message': str(e)}, status=500)
 
 
+# Upper bound on post ids accepted by track_post_views in one request
+TRACK_POST_VIEWS_MAX_BATCH = 50
+
+
+def _insert_post_views_returning(views):
+    """
+    Insert PostView rows in one INSERT ... ON CONFLICT DO NOTHING RETURNING
+    statement (PostgreSQL) and return the post ids that were written.
+    
+    Rows the unique constraints reject, i.e. views a concurrent request
+    already recorded, are left out of the result.
+    """
+    fields = [
+        PostView._meta.get_field(name)
+        for name in ('post', 'user', 'ip_address', 'user_agent', 'viewed_at', 'viewed_hour')
+    ]
+    quote = connection.ops.quote_name
+    sql = 'INSERT INTO {table} ({columns}) VALUES {rows} ON CONFLICT DO NOTHING RETURNING {post}'.format(
+        table=quote(PostView._meta.db_table),
+        columns=', '.join(quote(field.column) for field in fields),
+        rows=', '.join(['({})'.format(', '.join(['%s'] * len(fields)))] * len(views)),
+        post=quote(PostView._meta.get_field('post').column),
+    )
+    params = [
+        field.get_db_prep_save(field.pre_save(view, add=True), connection)
+        for view in views
+        for field in fields
+    ]
+    with connection.cursor() as cursor:
+        cursor.execute(sql, params)
+        return {post_id for (post_id,) in cursor.fetchall()}
+
+
+def track_post_views(request):
+    """
+    AJAX endpoint to track views for several posts at once.
+    
+    The post view tracker batches the posts that scrolled into view and
+    sends them together, so a feed page costs one request and a fixed
+    number of queries instead of one round trip per post.
+    """
+    if request.method != 'POST':
+        return JsonResponse({'success': False, 'message': 'Invalid request method'}, status=405)
+    
+    try:
+        data = json.loads(request.body or b'{}')
+        post_ids = {int(post_id) for post_id in data.get('post_ids', [])[:TRACK_POST_VIEWS_MAX_BATCH]}
+    except (ValueError, TypeError, AttributeError):
+        return JsonResponse({'success': False, 'message': 'Invalid post ids'}, status=400)
+    
+    try:
+        # Get client info
+        ip_address = get_client_ip(request)
+        user_agent = request.META.get('HTTP_USER_AGENT', '')[:500]
+        user = request.user if request.user.is_authenticated else None
+        viewed_hour = timezone.now().replace(minute=0, second=0, microsecond=0)
+        
+        view_counts = dict(
+            Post.objects.filter(id__in=post_ids, is_active=True).values_list('id', 'view_count')
+        )
+        
+        # Same rule as track_post_view: one counted view per viewer per clock hour
+        seen = PostView.objects.filter(post_id__in=view_counts, viewed_hour=viewed_hour)
+        if user:
+            seen = seen.filter(user=user)
+        else:
+            seen = seen.filter(user__isnull=True, ip_address=ip_address)
+        candidate_ids = view_counts.keys() - set(seen.values_list('post_id', flat=True))
+        
+        counted_ids = set()
+        if candidate_ids:
+            views = [
+                PostView(
+                    post_id=post_id,
+                    user=user,
+                    ip_address=ip_address,
+                    user_agent=user_agent,
+                    viewed_hour=viewed_hour
+                )
+                for post_id in candidate_ids
+            ]
+            # The unique constraints on PostView drop rows a concurrent request
+            # already wrote; only rows this request inserted are counted
+            if connection.vendor == 'postgresql':
+                counted_ids = _insert_post_views_returning(views)
+            else:
+                # Other backends can't report which rows were ignored, so read
+                # back this viewer's rows for the hour
+                PostView.objects.bulk_create(views, ignore_conflicts=True)
+                counted_ids = set(
+                    seen.filter(post_id__in=candidate_ids).values_list('post_id', flat=True)
+                )
+        
+        if counted_ids:
+            Post.objects.filter(pk__in=counted_ids).update(view_count=F('view_count') + 1)
+            for post_id in counted_ids:
+                view_counts[post_id] += 1
+            
+            # Log activity for authenticated users
+            if user:
+                UserInteraction.log_bulk_activity(
+                    user=user,
+                    activity_type=UserInteraction.ACTIVITY_POST_VIEW,
+                    model=Post,
+                    object_ids=counted_ids,
+                    request=request
+                )
+        
+        return JsonResponse({
+            'success': True,
+            'views': {
+                str(post_id): {'view_count': view_count, 'counted': post_id in counted_ids}
+                for post_id, view_count in view_counts.items()
+            }
+        })
+        
+    except Exception as e:
+        return JsonResponse({'success': False, 'message': str(e)}, status=500)
+
+
 @login_required
 def report_comment(request):
     """AJAX endpoint to report a comment."""
@@ -6295,28 +6495,24 @@ def report_comment(request):
         # Get the comment
         comment = get_object_or_404(PostComment, id=comment_id, is_active=True)
         
-        # Check if user already reported this comment
+        # Create the report; unique_together on (user, comment) rejects a
+        # second report from the same user
         from core.models import CommentReport
-        existing_report = CommentReport.objects.filter(
-            user=request.user,
-            comment=comment
-        ).first()
-        
-        if existing_report:
+        try:
+            with transaction.atomic():
+                report = CommentReport.objects.create(
+                    user=request.user,
+                    comment=comment,
+                    reason=reason,
+                    description=description,
+                    status='pending'
+                )
+        except IntegrityError:
             return JsonResponse({
                 'success': False,
                 'message': 'You have already reported this comment'
             }, status=400)
         
-        # Create the report
-        report = CommentReport.objects.create(
-            user=request.user,
-            comment=comment,
-            reason=reason,
-            description=description,
-            status='pending'
-        )
-        
         # TODO: Send notification to admins about new report
         
         return JsonResponse({
@@ -6328,8 +6524,6 @@ def report_comment(request):
     except PostComment.DoesNotExist:
         return JsonResponse({'success': False, 'message': 'Comment not found'}, status=404)
     except Exception as e:
-        import logging
-        logger = logging.getLogger(__name__)
         logger.error(f"Error reporting comment: {str(e)}")
         return JsonResponse({'success': False, 'message': 'An error occurred while submitting your report'}, status=500)
 
@@ -6344,31 +6538,31 @@ def delete_reported_comment(request, comment_id):
         return JsonResponse({'success': False, 'message': 'Invalid request method'}, status=405)
     
     try:
-        comment = get_object_or_404(PostComment, id=comment_id)
+        now = timezone.now()
+        post_id = PostComment.objects.filter(id=comment_id).values_list('post_id', flat=True).first()
+        if post_id is None:
+            return JsonResponse({'success': False, 'message': 'Comment not found'}, status=404)
         
         # Mark comment as inactive instead of deleting
-        comment.is_active = False
-        comment.save()
+        PostComment.objects.filter(id=comment_id).update(is_active=False, updated_at=now)
+        PostComment.clear_thread_cache(post_id)
         
         # Update all reports for this comment to 'action_taken'
         from core.models import CommentReport
-        CommentReport.objects.filter(comment=comment, status='pending').update(
+        CommentReport.objects.filter(comment_id=comment_id, status='pending').update(
             status='action_taken',
-            reviewed_at=timezone.now(),
+            reviewed_at=now,
             reviewed_by=request.user,
             admin_notes='Comment deleted by admin'
         )
+        invalidate_moderation_stats()
         
         return JsonResponse({
             'success': True,
             'message': 'Comment deleted successfully'
         })
         
-    except PostComment.DoesNotExist:
-        return JsonResponse({'success': False, 'message': 'Comment not found'}, status=404)
     except Exception as e:
-        import logging
-        logger = logging.getLogger(__name__)
         logger.error(f"Error deleting comment: {str(e)}")
         return JsonResponse({'success': False, 'message': 'An error occurred'}, status=500)
 
@@ -6384,13 +6578,15 @@ def dismiss_comment_report(request, report_id):
     
     try:
         from core.models import CommentReport
-        report = get_object_or_404(CommentReport, id=report_id)
-        
-        report.status = 'dismissed'
-        report.reviewed_at = timezone.now()
-        report.reviewed_by = request.user
-        report.admin_notes = request.POST.get('notes', 'Report dismissed by admin')
-        report.save()
+        updated = CommentReport.objects.filter(id=report_id).update(
+            status='dismissed',
+            reviewed_at=timezone.now(),
+            reviewed_by=request.user,
+            admin_notes=request.POST.get('notes', 'Report dismissed by admin')
+        )
+        invalidate_moderation_stats()
+        if not updated:
+            return JsonResponse({'success': False, 'message': 'Report not found'}, status=404)
         
         return JsonResponse({
             'success': True,
@@ -6398,8 +6594,6 @@ def dismiss_comment_report(request, report_id):
         })
         
     except Exception as e:
-        import logging
-        logger = logging.getLogger(__name__)
         logger.error(f"Error dismissing report: {str(e)}")
         return JsonResponse({'success': False, 'message': 'An error occurred'}, status=500)
 
@@ -6419,47 +6613,40 @@ def get_client_ip(request):
 def toggle_post_bookmark(request, post_id):
     """Toggle bookmark status for a post via AJAX."""
     try:
-        post = get_object_or_404(Post, id=post_id)
+        post = get_object_or_404(Post.objects.only('id', 'bookmark_count'), id=post_id)
         
-        # Check if user already bookmarked this post
-        bookmark = PostBookmark.objects.filter(user=request.user, post=post).first()
+        # Remove an existing bookmark; if there was none, add one
+        deleted, _ = PostBookmark.objects.filter(user=request.user, post=post).delete()
         
-        if bookmark:
-            # Remove bookmark
-            bookmark.delete()
+        if deleted:
             is_bookmarked = False
             action = 'unbookmarked'
             message = 'Post removed from saved posts'
-            # Log activity
-            from .models import UserInteraction
-            UserInteraction.log_activity(
-                user=request.user,
-                activity_type=UserInteraction.ACTIVITY_POST_UNBOOKMARK,
-                content_object=post,
-                request=request
-            )
+            Post.objects.filter(pk=post.pk, bookmark_count__gt=0).update(bookmark_count=F('bookmark_count') - 1)
+            bookmark_count = max(post.bookmark_count - 1, 0)
+            activity_type = UserInteraction.ACTIVITY_POST_UNBOOKMARK
         else:
-            # Add bookmark
             PostBookmark.objects.create(user=request.user, post=post)
             is_bookmarked = True
             action = 'bookmarked'
             message = 'Post saved successfully!'
-            # Log activity
-            from .models import UserInteraction
-            UserInteraction.log_activity(
-                user=request.user,
-                activity_type=UserInteraction.ACTIVITY_POST_BOOKMARK,
-                content_object=post,
-                request=request
-            )
+            Post.objects.filter(pk=post.pk).update(bookmark_count=F('bookmark_count') + 1)
+            bookmark_count = post.bookmark_count + 1
+            activity_type = UserInteraction.ACTIVITY_POST_BOOKMARK
         
-        # Debug logging
-        print(f"User {request.user.username} {action} post {post.id}")
+        # Log activity
+        UserInteraction.log_activity(
+            user=request.user,
+            activity_type=activity_type,
+            content_object=post,
+            request=request
+        )
+        logger.debug("User %s %s post %s", request.user.username, action, post.id)
         
         return JsonResponse({
             'success': True,
             'is_bookmarked': is_bookmarked,
-            'bookmark_count': post.bookmark_count,
+            'bookmark_count': bookmark_count,
             'action': action,
             'message': message
         })
@@ -6467,7 +6654,7 @@ def toggle_post_bookmark(request, post_id):
     except Post.DoesNotExist:
         return JsonResponse({'success': False, 'message': 'Post not found'}, status=404)
     except Exception as e:
-        print(f"Bookmark error: {str(e)}")
+        logger.exception("Bookmark error")
         return JsonResponse({'success': False, 'message': str(e)}, status=500)
 
 
@@ -6493,13 +6680,16 @@ def super_admin_user_activities(request):
     except ValueError:
         days = 30
 
+    # Read the clock once for every cutoff and expiry comparison below
+    now = timezone.now()
+
     # Base queryset for user activities
     activities_qs = UserActivity.objects.select_related('user').all()
     
     # Apply date filter
     if days > 0:
         from datetime import timedelta
-        cutoff_date = timezone.now() - timedelta(days=days)
+        cutoff_date = now - timedelta(days=days)
         activities_qs = activities_qs.filter(created_at__gte=cutoff_date)
     
     # Apply activity type filter
@@ -6554,8 +6744,15 @@ def super_admin_user_activities(request):
             Q(ip_address__icontains=search_query)
         )
 
-    # Pagination for activities
-    activities_paginator = Paginator(activities_qs, 5)
+    # Pagination for activities; the joined user only supplies display_name
+    activities_paginator = Paginator(
+        activities_qs.only(
+            'id', 'email', 'activity_type', 'success', 'details', 'ip_address', 'user_agent',
+            'device_info', 'browser_info', 'os_info', 'country', 'city', 'verification_code',
+            'created_at', 'user__username', 'user__first_name', 'user__last_name',
+        ),
+        5
+    )
     activities_page = request.GET.get('activities_page', 1)
     try:
         activities = activities_paginator.page(activities_page)
@@ -6589,64 +6786,128 @@ def super_admin_user_activities(request):
     # Activity type choices for filter dropdown
     activity_type_choices = UserActivity.ACTIVITY_TYPE_CHOICES
 
-    # Statistics
-    total_activities = activities_qs.count()
-    total_verifications = verifications_qs.count()
-    
-    # Success/failure stats for activities
-    success_count = activities_qs.filter(success=True).count()
-    failed_count = activities_qs.filter(success=False).count()
-    
-    # Verification stats
-    used_verifications = verifications_qs.filter(is_used=True).count()
-    unused_verifications = verifications_qs.filter(is_used=False).count()
-    expired_verifications = verifications_qs.filter(expires_at__lt=timezone.now()).count()
-
-    # Password reset stats
-    total_password_resets = password_resets_qs.count()
-    used_password_resets = password_resets_qs.filter(is_used=True).count()
-    expired_password_resets = password_resets_qs.filter(expires_at__lt=timezone.now()).count()
-    unused_password_resets = max(total_password_resets - used_password_resets - expired_password_resets, 0)
-
-    # Login code stats
-    total_login_codes = login_codes_qs.count()
-    used_login_codes = login_codes_qs.filter(is_used=True).count()
-    expired_login_codes = login_codes_qs.filter(expires_at__lt=timezone.now()).count()
-    unused_login_codes = max(total_login_codes - used_login_codes - expired_login_codes, 0)
-
-    # Recent activity breakdown
-    activity_breakdown = {}
-    for activity_type, display_name in activity_type_choices:
-        count = activities_qs.filter(activity_type=activity_type).count()
-        activity_breakdown[display_name] = count
+    # Statistics and charts only summarise the filtered data, so they are
+    # cached briefly per filter combination; the paginated lists stay live
+    def compute_summary():
+        # Statistics: one conditional aggregate per queryset
+        used = Q(is_used=True)
+        expired = Q(expires_at__lt=now)
+
+        # Success/failure stats for activities
+        activity_stats = activities_qs.aggregate(
+            total=Count('id'),
+            succeeded=Count('id', filter=Q(success=True)),
+            failed=Count('id', filter=Q(success=False)),
+        )
+        total_activities = activity_stats['total']
+        success_count = activity_stats['succeeded']
+        failed_count = activity_stats['failed']
+    
+        # Verification stats
+        verification_stats = verifications_qs.aggregate(
+            total=Count('id'),
+            used_count=Count('id', filter=used),
+            unused_count=Count('id', filter=Q(is_used=False)),
+            expired_count=Count('id', filter=expired),
+        )
+        total_verifications = verification_stats['total']
+        used_verifications = verification_stats['used_count']
+        unused_verifications = verification_stats['unused_count']
+        expired_verifications = verification_stats['expired_count']
+
+        # Password reset stats
+        password_reset_stats = password_resets_qs.aggregate(
+            total=Count('id'),
+            used_count=Count('id', filter=used),
+            expired_count=Count('id', filter=expired),
+        )
+        total_password_resets = password_reset_stats['total']
+        used_password_resets = password_reset_stats['used_count']
+        expired_password_resets = password_reset_stats['expired_count']
+        unused_password_resets = max(total_password_resets - used_password_resets - expired_password_resets, 0)
+
+        # Login code stats
+        login_code_stats = login_codes_qs.aggregate(
+            total=Count('id'),
+            used_count=Count('id', filter=used),
+            expired_count=Count('id', filter=expired),
+        )
+        total_login_codes = login_code_stats['total']
+        used_login_codes = login_code_stats['used_count']
+        expired_login_codes = login_code_stats['expired_count']
+        unused_login_codes = max(total_login_codes - used_login_codes - expired_login_codes, 0)
 
-    from datetime import timedelta
-    from django.db.models.functions import TruncDate
-    today = timezone.now().date()
-    chart_days = 14
-    daily_labels = []
-    daily_activity_counts = []
-    daily_counts_qs = (
-        activities_qs
-        .annotate(day=TruncDate('created_at'))
-        .values('day')
-        .annotate(c=Count('id'))
-    )
-    daily_count_map = {row['day']: row['c'] for row in daily_counts_qs}
-    for i in range(chart_days - 1, -1, -1):
-        day = today - timedelta(days=i)
-        daily_labels.append(day.strftime('%b %d'))
-        daily_activity_counts.append(daily_count_map.get(day, 0))
+        # Recent activity breakdown (one GROUP BY query, shared with the type chart)
+        type_counts_qs = activities_qs.values('activity_type').annotate(c=Count('id'))
+        type_counts_map = {row['activity_type']: row['c'] for row in type_counts_qs}
+        activity_breakdown = {label: type_counts_map.get(code, 0) for code, label in activity_type_choices}
 
-    type_counts_qs = activities_qs.values('activity_type').annotate(c=Count('id'))
-    type_counts_map = {row['activity_type']: row['c'] for row in type_counts_qs}
-    activity_type_labels = [label for _, label in activity_type_choices]
-    activity_type_counts = [type_counts_map.get(code, 0) for code, label in activity_type_choices]
+        from datetime import timedelta
+        from django.db.models.functions import TruncDate
+        today = now.date()
+        chart_days = 14
+        daily_labels = []
+        daily_activity_counts = []
+        # Only group rows inside the charted window, not the whole filter range
+        daily_counts_qs = (
+            activities_qs
+            .filter(created_at__gte=now - timedelta(days=chart_days))
+            .annotate(day=TruncDate('created_at'))
+            .values('day')
+            .annotate(c=Count('id'))
+        )
+        daily_count_map = {row['day']: row['c'] for row in daily_counts_qs}
+        for i in range(chart_days - 1, -1, -1):
+            day = today - timedelta(days=i)
+            daily_labels.append(day.strftime('%b %d'))
+            daily_activity_counts.append(daily_count_map.get(day, 0))
+
+        activity_type_labels = [label for _, label in activity_type_choices]
+        activity_type_counts = [type_counts_map.get(code, 0) for code, label in activity_type_choices]
+
+        codes_total_all = total_verifications + total_password_resets + total_login_codes
+        codes_used_all = used_verifications + used_password_resets + used_login_codes
+        codes_expired_all = expired_verifications + expired_password_resets + expired_login_codes
+        codes_unused_all = max(codes_total_all - codes_used_all - codes_expired_all, 0)
+
+        return {
+            'stats': {
+                'total_activities': total_activities,
+                'total_verifications': total_verifications,
+                'success_count': success_count,
+                'failed_count': failed_count,
+                'used_verifications': used_verifications,
+                'unused_verifications': unused_verifications,
+                'expired_verifications': expired_verifications,
+                'total_password_resets': total_password_resets,
+                'used_password_resets': used_password_resets,
+                'unused_password_resets': unused_password_resets,
+                'expired_password_resets': expired_password_resets,
+                'total_login_codes': total_login_codes,
+                'used_login_codes': used_login_codes,
+                'unused_login_codes': unused_login_codes,
+                'expired_login_codes': expired_login_codes,
+            },
+            'activity_breakdown': activity_breakdown,
+            'charts': {
+                'daily_labels': daily_labels,
+                'daily_activity_counts': daily_activity_counts,
+                'activity_type_labels': activity_type_labels,
+                'activity_type_counts': activity_type_counts,
+                'codes_mix': {
+                    'total': codes_total_all,
+                    'used': codes_used_all,
+                    'expired': codes_expired_all,
+                    'unused': codes_unused_all,
+                },
+            },
+        }
 
-    codes_total_all = total_verifications + total_password_resets + total_login_codes
-    codes_used_all = used_verifications + used_password_resets + used_login_codes
-    codes_expired_all = expired_verifications + expired_password_resets + expired_login_codes
-    codes_unused_all = max(codes_total_all - codes_used_all - codes_expired_all, 0)
+    summary_key = 'super_admin_activities_summary_{}_{}_{}_{}'.format(
+        days, activity_type_filter, success_filter,
+        hashlib.md5(search_query.encode()).hexdigest()
+    )
+    summary = cache.get_or_set(summary_key, compute_summary, 60)
 
     ctx = {
         'active': 'super_admin_activities',
@@ -6656,43 +6917,14 @@ def super_admin_user_activities(request):
         'password_resets': password_resets,
         'login_codes': login_codes,
         'activity_type_choices': activity_type_choices,
-        'now': timezone.now(),
+        'now': now,
         'current_filters': {
             'activity_type': activity_type_filter,
             'success': success_filter,
             'days': days_filter,
             'search': search_query,
         },
-        'stats': {
-            'total_activities': total_activities,
-            'total_verifications': total_verifications,
-            'success_count': success_count,
-            'failed_count': failed_count,
-            'used_verifications': used_verifications,
-            'unused_verifications': unused_verifications,
-            'expired_verifications': expired_verifications,
-            'total_password_resets': total_password_resets,
-            'used_password_resets': used_password_resets,
-            'unused_password_resets': unused_password_resets,
-            'expired_password_resets': expired_password_resets,
-            'total_login_codes': total_login_codes,
-            'used_login_codes': used_login_codes,
-            'unused_login_codes': unused_login_codes,
-            'expired_login_codes': expired_login_codes,
-        },
-        'activity_breakdown': activity_breakdown,
-        'charts': {
-            'daily_labels': daily_labels,
-            'daily_activity_counts': daily_activity_counts,
-            'activity_type_labels': activity_type_labels,
-            'activity_type_counts': activity_type_counts,
-            'codes_mix': {
-                'total': codes_total_all,
-                'used': codes_used_all,
-                'expired': codes_expired_all,
-                'unused': codes_unused_all,
-            },
-        },
+        **summary,
     }
     ctx.update(_app_context(request))
 
@@ -6724,14 +6956,21 @@ def super_admin_posts(request):
     reported_filter = (request.GET.get('reported') or '').strip()  # pending|any|''
     order = (request.GET.get('order') or '-created_at').strip()
 
-    # Base queryset with annotations to avoid N+1 issues
+    # Base queryset with annotations to avoid N+1 issues. Counts come from the
+    # stored counters or correlated subqueries so no joins multiply the rows.
+    active_comments = (
+        PostComment.objects.filter(post=OuterRef('pk'), is_active=True)
+        .order_by().values('post').annotate(c=Count('pk')).values('c')
+    )
+    pending_post_reports = PostReport.objects.filter(post=OuterRef('pk'), status='pending')
+    pending_reports_total = pending_post_reports.order_by().values('post').annotate(c=Count('pk')).values('c')
     posts_qs = (
         Post.objects.select_related('church')
         .annotate(
-            likes_count=Count('likes', distinct=True),
-            comments_count=Count('comments', filter=Q(comments__is_active=True), distinct=True),
-            bookmarks_count=Count('bookmarks', distinct=True),
-            pending_reports_count=Count('reports', filter=Q(reports__status='pending'), distinct=True),
+            likes_count=F('like_count'),
+            comments_count=Coalesce(Subquery(active_comments), 0),
+            bookmarks_count=F('bookmark_count'),
+            pending_reports_count=Coalesce(Subquery(pending_reports_total), 0),
         )
     )
 
@@ -6744,11 +6983,9 @@ def super_admin_posts(request):
     elif status_filter == 'inactive':
         posts_qs = posts_qs.filter(is_active=False)
     if reported_filter == 'pending':
-        posts_qs = posts_qs.filter(reports__status='pending')
+        posts_qs = posts_qs.filter(Exists(pending_post_reports))
     elif reported_filter == 'any':
-        posts_qs = posts_qs.filter(reports__isnull=False)
-
-    posts_qs = posts_qs.distinct()
+        posts_qs = posts_qs.filter(Exists(PostReport.objects.filter(post=OuterRef('pk'))))
 
     allowed_orders = {
         '-created_at', 'created_at',
@@ -6765,98 +7002,172 @@ def super_admin_posts(request):
     page_number = request.GET.get('page')
     posts_page = paginator.get_page(page_number)
 
-    # Analytics
-    from datetime import timedelta
-    from django.db.models import Sum
-    today = timezone.now().date()
-    last_30_days = today - timedelta(days=30)
-    last_7_days = today - timedelta(days=7)
-
-    total_posts = Post.objects.count()
-    posts_last_30_days = Post.objects.filter(created_at__date__gte=last_30_days).count()
-    posts_last_7_days = Post.objects.filter(created_at__date__gte=last_7_days).count()
-    new_posts_this_week = Post.objects.filter(created_at__date__gte=last_7_days).count()
-
-    type_dist = Post.objects.values('post_type').annotate(count=Count('id'))
-    type_map = {row['post_type']: row['count'] for row in type_dist}
-    type_counts = {
-        'general': type_map.get('general', 0),
-        'photo': type_map.get('photo', 0),
-        'event': type_map.get('event', 0),
-        'prayer': type_map.get('prayer', 0),
-    }
-
-    total_likes = PostLike.objects.count()
-    total_comments = PostComment.objects.filter(is_active=True).count()
-    total_views = Post.objects.aggregate(total_views=Sum('view_count'))['total_views'] or 0
-    total_shares = total_views  # Using views as shares for now
-    
-    # Calculate averages
-    avg_likes_per_post = round(total_likes / total_posts) if total_posts > 0 else 0
-    avg_comments_per_post = round(total_comments / total_posts) if total_posts > 0 else 0
-    avg_shares_per_post = round(total_shares / total_posts) if total_posts > 0 else 0
-    
-    # Weekly engagement data (last 7 days)
-    import json
-    engagement_comments = []
-    engagement_likes = []
-    engagement_shares = []
-    
-    for i in range(6, -1, -1):
-        day = today - timedelta(days=i)
-        day_comments = PostComment.objects.filter(created_at__date=day, is_active=True).count()
-        day_likes = PostLike.objects.filter(created_at__date=day).count()
-        day_shares = PostView.objects.filter(viewed_at__date=day).count()
-        
-        engagement_comments.append(day_comments)
-        engagement_likes.append(day_likes)
-        engagement_shares.append(day_shares)
-    
-    # Type distribution data
-    type_data = [
-        type_counts.get('general', 0),
-        type_counts.get('event', 0),
-        type_counts.get('photo', 0),
-        type_counts.get('prayer', 0),
-    ]
-
-    likes_last_30_days = PostLike.objects.filter(created_at__date__gte=last_30_days).count()
-    comments_last_30_days = PostComment.objects.filter(is_active=True, created_at__date__gte=last_30_days).count()
-    views_last_30_days = PostView.objects.filter(viewed_at__date__gte=last_30_days).count()
-
-    # Donations summary
-    from decimal import Decimal
-    donations_qs = Donation.objects.filter(payment_status='completed')
-    donations_total_count = donations_qs.count()
-    donations_total_amount = donations_qs.aggregate(total=Sum('amount'))['total'] or Decimal('0.00')
-
-    # Reports summary
-    from .models import PostReport
-    total_reports = PostReport.objects.count()
-    pending_reports = PostReport.objects.filter(status='pending').count()
-    reviewed_reports = PostReport.objects.filter(status='reviewed').count()
-    dismissed_reports = PostReport.objects.filter(status='dismissed').count()
-    action_taken_reports = PostReport.objects.filter(status='action_taken').count()
-    top_report_reasons = list(
-        PostReport.objects.values('reason').annotate(count=Count('id')).order_by('-count')[:5]
-    )
+    # Analytics are site-wide and ignore the list filters, so they are shared
+    # by every request and cached briefly; the paginated list stays live
+    def compute_summary():
+        from datetime import timedelta
+        from django.db.models import Sum
+        today = timezone.now().date()
+        last_30_days = today - timedelta(days=30)
+        last_7_days = today - timedelta(days=7)
+
+        post_stats = Post.objects.aggregate(
+            total=Count('id'),
+            last_30=Count('id', filter=Q(created_at__date__gte=last_30_days)),
+            last_7=Count('id', filter=Q(created_at__date__gte=last_7_days)),
+            views=Sum('view_count'),
+        )
+        total_posts = post_stats['total']
+        posts_last_30_days = post_stats['last_30']
+        posts_last_7_days = post_stats['last_7']
+        new_posts_this_week = posts_last_7_days
+
+        type_dist = Post.objects.values('post_type').annotate(count=Count('id'))
+        type_map = {row['post_type']: row['count'] for row in type_dist}
+        type_counts = {
+            'general': type_map.get('general', 0),
+            'photo': type_map.get('photo', 0),
+            'event': type_map.get('event', 0),
+            'prayer': type_map.get('prayer', 0),
+        }
 
-    # Top posts by engagement
-    analytics_posts_qs = (
-        Post.objects.filter(is_active=True)
-        .annotate(
-            likes_count=Count('likes', distinct=True),
-            comments_count=Count('comments', filter=Q(comments__is_active=True), distinct=True),
+        total_likes = PostLike.objects.count()
+        total_comments = PostComment.objects.filter(is_active=True).count()
+        total_views = post_stats['views'] or 0
+        total_shares = total_views  # Using views as shares for now
+    
+        # Calculate averages
+        avg_likes_per_post = round(total_likes / total_posts) if total_posts > 0 else 0
+        avg_comments_per_post = round(total_comments / total_posts) if total_posts > 0 else 0
+        avg_shares_per_post = round(total_shares / total_posts) if total_posts > 0 else 0
+    
+        # Weekly engagement data (last 7 days)
+        from django.db.models.functions import TruncDate
+        week_start = today - timedelta(days=6)
+        week_days = [today - timedelta(days=i) for i in range(6, -1, -1)]
+    
+        def daily_counts(queryset, date_field):
+            rows = (
+                queryset.filter(**{f'{date_field}__date__gte': week_start})
+                .annotate(day=TruncDate(date_field))
+                .values('day')
+                .annotate(c=Count('id'))
+                .order_by()
+            )
+            count_map = {row['day']: row['c'] for row in rows}
+            return [count_map.get(day, 0) for day in week_days]
+    
+        engagement_comments = daily_counts(PostComment.objects.filter(is_active=True), 'created_at')
+        engagement_likes = daily_counts(PostLike.objects.all(), 'created_at')
+        engagement_shares = daily_counts(PostView.objects.all(), 'viewed_at')
+    
+        # Type distribution data
+        type_data = [
+            type_counts.get('general', 0),
+            type_counts.get('event', 0),
+            type_counts.get('photo', 0),
+            type_counts.get('prayer', 0),
+        ]
+
+        likes_last_30_days = PostLike.objects.filter(created_at__date__gte=last_30_days).count()
+        comments_last_30_days = PostComment.objects.filter(is_active=True, created_at__date__gte=last_30_days).count()
+        views_last_30_days = PostView.objects.filter(viewed_at__date__gte=last_30_days).count()
+
+        # Donations summary
+        from decimal import Decimal
+        donation_stats = Donation.objects.filter(payment_status='completed').aggregate(
+            total_count=Count('id'),
+            total_amount=Sum('amount'),
         )
-        .annotate(
-            total_engagement=ExpressionWrapper(
-                F('view_count') + F('likes_count') + F('comments_count'),
-                output_field=IntegerField(),
+        donations_total_count = donation_stats['total_count']
+        donations_total_amount = donation_stats['total_amount'] or Decimal('0.00')
+
+        # Reports summary
+        report_stats = PostReport.objects.aggregate(
+            total=Count('id'),
+            pending_count=Count('id', filter=Q(status='pending')),
+            reviewed_count=Count('id', filter=Q(status='reviewed')),
+            dismissed_count=Count('id', filter=Q(status='dismissed')),
+            action_taken_count=Count('id', filter=Q(status='action_taken')),
+        )
+        total_reports = report_stats['total']
+        pending_reports = report_stats['pending_count']
+        reviewed_reports = report_stats['reviewed_count']
+        dismissed_reports = report_stats['dismissed_count']
+        action_taken_reports = report_stats['action_taken_count']
+        top_report_reasons = list(
+            PostReport.objects.values('reason').annotate(count=Count('id')).order_by('-count')[:5]
+        )
+
+        # Top posts by engagement
+        analytics_posts_qs = (
+            Post.objects.filter(is_active=True)
+            .annotate(
+                likes_count=Count('likes', distinct=True),
+                comments_count=Count('comments', filter=Q(comments__is_active=True), distinct=True),
+            )
+            .annotate(
+                total_engagement=ExpressionWrapper(
+                    F('view_count') + F('likes_count') + F('comments_count'),
+                    output_field=IntegerField(),
+                )
             )
         )
-    )
-    top_5_posts = list(analytics_posts_qs.select_related('church').order_by('-total_engagement', '-created_at')[:5])
-    max_engagement = top_5_posts[0].total_engagement if top_5_posts else 0
+        top_5_posts = list(
+            analytics_posts_qs.select_related('church')
+            .only('id', 'content', 'post_type', 'view_count', 'created_at', 'church__id', 'church__name')
+            .order_by('-total_engagement', '-created_at')[:5]
+        )
+        max_engagement = top_5_posts[0].total_engagement if top_5_posts else 0
+
+        return {
+            'stats': {
+                'total_posts': total_posts,
+                'new_posts_this_week': new_posts_this_week,
+                'total_likes': total_likes,
+                'avg_likes_per_post': avg_likes_per_post,
+                'total_comments': total_comments,
+                'avg_comments_per_post': avg_comments_per_post,
+                'total_shares': total_shares,
+                'avg_shares_per_post': avg_shares_per_post,
+            },
+            'engagement_data': {
+                'comments': orjson.dumps(engagement_comments).decode(),
+                'likes': orjson.dumps(engagement_likes).decode(),
+                'shares': orjson.dumps(engagement_shares).decode(),
+            },
+            'type_data': orjson.dumps(type_data).decode(),
+            'analytics': {
+                'total_posts': total_posts,
+                'posts_last_30_days': posts_last_30_days,
+                'posts_last_7_days': posts_last_7_days,
+                'type_counts': type_counts,
+                'engagement': {
+                    'total_likes': total_likes,
+                    'total_comments': total_comments,
+                    'total_views': total_views,
+                    'likes_last_30_days': likes_last_30_days,
+                    'comments_last_30_days': comments_last_30_days,
+                    'views_last_30_days': views_last_30_days,
+                },
+                'donations': {
+                    'total_donations': donations_total_count,
+                    'total_amount': donations_total_amount,
+                },
+                'top_5_posts': top_5_posts,
+                'max_engagement': max_engagement,
+            },
+            'reports_stats': {
+                'total_reports': total_reports,
+                'pending': pending_reports,
+                'reviewed': reviewed_reports,
+                'dismissed': dismissed_reports,
+                'action_taken': action_taken_reports,
+                'top_reasons': top_report_reasons,
+            },
+        }
+
+    summary = cache.get_or_set('super_admin_posts_summary', compute_summary, 60)
 
     ctx = {
         'active': 'super_admin_posts',
@@ -6867,50 +7178,7 @@ def super_admin_posts(request):
         'status_filter': status_filter,
         'reported_filter': reported_filter,
         'order': order,
-        'stats': {
-            'total_posts': total_posts,
-            'new_posts_this_week': new_posts_this_week,
-            'total_likes': total_likes,
-            'avg_likes_per_post': avg_likes_per_post,
-            'total_comments': total_comments,
-            'avg_comments_per_post': avg_comments_per_post,
-            'total_shares': total_shares,
-            'avg_shares_per_post': avg_shares_per_post,
-        },
-        'engagement_data': {
-            'comments': json.dumps(engagement_comments),
-            'likes': json.dumps(engagement_likes),
-            'shares': json.dumps(engagement_shares),
-        },
-        'type_data': json.dumps(type_data),
-        'analytics': {
-            'total_posts': total_posts,
-            'posts_last_30_days': posts_last_30_days,
-            'posts_last_7_days': posts_last_7_days,
-            'type_counts': type_counts,
-            'engagement': {
-                'total_likes': total_likes,
-                'total_comments': total_comments,
-                'total_views': total_views,
-                'likes_last_30_days': likes_last_30_days,
-                'comments_last_30_days': comments_last_30_days,
-                'views_last_30_days': views_last_30_days,
-            },
-            'donations': {
-                'total_donations': donations_total_count,
-                'total_amount': donations_total_amount,
-            },
-            'top_5_posts': top_5_posts,
-            'max_engagement': max_engagement,
-        },
-        'reports_stats': {
-            'total_reports': total_reports,
-            'pending': pending_reports,
-            'reviewed': reviewed_reports,
-            'dismissed': dismissed_reports,
-            'action_taken': action_taken_reports,
-            'top_reasons': top_report_reasons,
-        },
+        **summary,
     }
     ctx.update(_app_context(request))
     return render(request, 'core/super_admin_posts.html', ctx)
@@ -6924,7 +7192,7 @@ def super_admin_services(request):
         return redirect('core:home')
 
     from datetime import timedelta
-    from django.db.models import Sum, Avg, Count, Q
+    from django.db.models import Sum, Count, Q
     import json
     
     today = timezone.now().date()
@@ -6953,25 +7221,35 @@ def super_admin_services(request):
     
     # Calculate average rating
     from .models import ServiceReview
-    avg_rating = ServiceReview.objects.aggregate(avg=Avg('rating'))['avg'] or 0
-    total_reviews = ServiceReview.objects.count()
+    review_summary = _service_review_summary()
+    avg_rating = review_summary['avg'] or 0
+    total_reviews = review_summary['total']
     
     # Booking trends (last 7 days)
+    from django.db.models.functions import TruncDate
     booking_trends_labels = []
     booking_trends_data = []
     revenue_trends_data = []
     
+    daily_rows = (
+        Booking.objects.filter(created_at__date__gte=today - timedelta(days=6))
+        .annotate(day=TruncDate('created_at'))
+        .values('day')
+        .annotate(
+            bookings_count=Count('id'),
+            revenue=Sum('service__price', filter=Q(payment_status='paid')),
+        )
+        .order_by()
+    )
+    daily_map = {row['day']: row for row in daily_rows}
+    
     for i in range(6, -1, -1):
         day = today - timedelta(days=i)
-        day_bookings = bookings.filter(created_at__date=day).count()
-        day_revenue = bookings.filter(
-            created_at__date=day,
-            payment_status='paid'
-        ).aggregate(total=Sum('service__price'))['total'] or 0
+        day_row = daily_map.get(day, {})
         
         booking_trends_labels.append(day.strftime('%a'))
-        booking_trends_data.append(day_bookings)
-        revenue_trends_data.append(float(day_revenue))
+        booking_trends_data.append(day_row.get('bookings_count', 0))
+        revenue_trends_data.append(float(day_row.get('revenue') or 0))
     
     # Services by category
     category_stats = services.values('category__name').annotate(
@@ -6990,8 +7268,7 @@ def super_admin_services(request):
     ).order_by('-created_at')[:10]
     
     # Paginate services
-    from django.core.paginator import Paginator
-    paginator = Paginator(services.order_by('-created_at'), 20)
+    paginator = FasterAdminPaginator(services.order_by('-created_at'), 20)
     page_number = request.GET.get('page')
     services_page = paginator.get_page(page_number)
 
@@ -7030,6 +7307,7 @@ def super_admin_services_booking_data(request):
         return JsonResponse({'error': 'Unauthorized'}, status=403)
     
     from datetime import timedelta
+    from django.db.models.functions import TruncDate
     
     days = int(request.GET.get('days', 7))
     today = timezone.now().date()
@@ -7038,16 +7316,24 @@ def super_admin_services_booking_data(request):
     bookings_data = []
     revenue_data = []
     
+    daily_rows = (
+        Booking.objects.filter(created_at__date__gte=today - timedelta(days=days - 1))
+        .annotate(day=TruncDate('created_at'))
+        .values('day')
+        .annotate(
+            bookings_count=Count('id'),
+            revenue=Sum('service__price', filter=Q(payment_status='paid')),
+        )
+        .order_by()
+    )
+    daily_map = {row['day']: row for row in daily_rows}
+    
     for i in range(days - 1, -1, -1):
         day = today - timedelta(days=i)
-        day_bookings = Booking.objects.filter(created_at__date=day).count()
-        day_revenue = Booking.objects.filter(
-            created_at__date=day,
-            payment_status='paid'
-        ).aggregate(total=Sum('service__price'))['total'] or 0
+        day_row = daily_map.get(day, {})
         
-        bookings_data.append(day_bookings)
-        revenue_data.append(float(day_revenue))
+        bookings_data.append(day_row.get('bookings_count', 0))
+        revenue_data.append(float(day_row.get('revenue') or 0))
         
         # Format label based on time range
         if days <= 7:
@@ -7100,14 +7386,17 @@ def super_admin_services_stats_data(request):
         bookings_qs = Booking.objects.all()
         reviews_qs = ServiceReview.objects.all()
     
-    # Calculate stats
+    # Calculate stats: one aggregate per table
     total_services = services_qs.count()
-    total_bookings = bookings_qs.count()
-    total_revenue = bookings_qs.filter(payment_status='paid').aggregate(
-        total=Sum('service__price')
-    )['total'] or 0
-    avg_rating = reviews_qs.aggregate(avg=Avg('rating'))['avg'] or 0
-    total_reviews = reviews_qs.count()
+    booking_stats = bookings_qs.aggregate(
+        total=Count('id'),
+        revenue=Sum('service__price', filter=Q(payment_status='paid')),
+    )
+    total_bookings = booking_stats['total']
+    total_revenue = booking_stats['revenue'] or 0
+    review_stats = reviews_qs.aggregate(avg=Avg('rating'), total=Count('id'))
+    avg_rating = review_stats['avg'] or 0
+    total_reviews = review_stats['total']
     
     # Subtitles
     if period == 'all':
@@ -7143,7 +7432,9 @@ def super_admin_categories(request):
     
     from .forms import ServiceCategoryForm
     
-    categories = ServiceCategory.objects.all().order_by('order', 'name')
+    categories = ServiceCategory.objects.annotate(
+        active_services_count=Count('services', filter=Q(services__is_active=True))
+    ).order_by('order', 'name')
     
     ctx = {
         'active': 'super_admin_categories',
@@ -7218,11 +7509,14 @@ def super_admin_delete_category(request, category_id):
     if not request.user.is_superuser:
         return JsonResponse({'success': False, 'message': 'Permission denied'}, status=403)
     
-    category = get_object_or_404(ServiceCategory, id=category_id)
+    category = get_object_or_404(
+        ServiceCategory.objects.annotate(total_services_count=Count('services')),
+        id=category_id
+    )
     
     if request.method == 'POST':
-        # Check if category has services
-        service_count = category.services.count()
+        # Check if category has services (active or not)
+        service_count = category.total_services_count
         if service_count > 0:
             return JsonResponse({
                 'success': False,
@@ -7274,23 +7568,25 @@ def super_admin_category_services(request, category_id):
         
         category = get_object_or_404(ServiceCategory, id=category_id)
         
-        # Get all services with this category
-        services = BookableService.objects.filter(category=category).select_related(
-            'church', 'category'
+        # Get all services with this category as plain rows
+        services = BookableService.objects.filter(category=category).values(
+            'id', 'name', 'church__name', 'church_id', 'price',
+            'duration', 'is_active', 'description'
         ).order_by('church__name', 'name')
         
-        services_data = []
-        for service in services:
-            services_data.append({
-                'id': service.id,
-                'name': service.name,
-                'church_name': service.church.name,
-                'church_id': service.church.id,
-                'price': str(service.price),
-                'duration': service.duration,
-                'is_active': service.is_active,
-                'description': service.description or '',
-            })
+        services_data = [
+            {
+                'id': service['id'],
+                'name': service['name'],
+                'church_name': service['church__name'],
+                'church_id': service['church_id'],
+                'price': str(service['price']),
+                'duration': service['duration'],
+                'is_active': service['is_active'],
+                'description': service['description'] or '',
+            }
+            for service in services.iterator(chunk_size=500)
+        ]
         
         return JsonResponse({
             'success': True,
@@ -7300,8 +7596,6 @@ def super_admin_category_services(request, category_id):
         })
         
     except Exception as e:
-        import logging
-        logger = logging.getLogger(__name__)
         logger.error(f"Error fetching category services: {str(e)}")
         return JsonResponse({
             'success': False,
@@ -7309,6 +7603,107 @@ def super_admin_category_services(request, category_id):
         }, status=500)
 
 
+def _booking_category_stats(bookings):
+    """Top 5 service categories by booking count for the service type chart."""
+    # One grouped query covers active categories and uncategorized services;
+    # rows keep the category ordering so ties sort as before. Category name
+    # and color are selected through the JOIN, so no select_related is needed
+    category_rows = (
+        bookings
+        .filter(Q(service__category__is_active=True) | Q(service__category__isnull=True))
+        .order_by(F('service__category__order').asc(nulls_last=True), 'service__category__name')
+        .values('service__category_id', 'service__category__name', 'service__category__color')
+        .annotate(count=Count('id'))
+    )
+    category_stats = []
+    for row in category_rows:
+        if row['service__category_id'] is None:
+            category_stats.append({
+                'name': 'Uncategorized',
+                'count': row['count'],
+                'color': '#9CA3AF'
+            })
+        else:
+            category_stats.append({
+                'name': row['service__category__name'],
+                'count': row['count'],
+                'color': row['service__category__color']
+            })
+    
+    # Sort by count descending
+    return sorted(category_stats, key=lambda x: x['count'], reverse=True)[:5]
+
+
+def _booking_trend_days(trend_days):
+    """Return (start, [(date, label), ...]) for the last trend_days UTC days."""
+    from datetime import timedelta
+    now = timezone.now()
+    start = (now - timedelta(days=trend_days - 1)).replace(hour=0, minute=0, second=0, microsecond=0)
+    # Format label based on days
+    if trend_days <= 7:
+        label_format = '%a'  # Mon, Tue, etc.
+    elif trend_days <= 30:
+        label_format = '%b %d'  # Jan 15
+    else:
+        label_format = '%m/%d'  # 01/15
+    days = []
+    for i in range(trend_days - 1, -1, -1):
+        day = now - timedelta(days=i)
+        days.append((day.date(), day.strftime(label_format)))
+    return start, days
+
+
+def _bookings_by_day(queryset, date_field, start, **aggregates):
+    """Group queryset rows by UTC day of date_field, keyed by date."""
+    from datetime import timezone as dt_timezone
+    from django.db.models.functions import TruncDate
+    rows = (
+        queryset.filter(**{f'{date_field}__gte': start})
+        .order_by()
+        .annotate(day=TruncDate(date_field, tzinfo=dt_timezone.utc))
+        .values('day')
+        .annotate(**aggregates)
+    )
+    return {row['day']: row for row in rows}
+
+
+def _booking_status_trends(bookings, trend_days):
+    """Daily completed/cancelled/pending counts for the bookings trend chart."""
+    start, days = _booking_trend_days(trend_days)
+    status_by_day = _bookings_by_day(
+        bookings, 'updated_at', start,
+        completed=Count('id', filter=Q(status=Booking.STATUS_COMPLETED)),
+        cancelled=Count('id', filter=Q(status=Booking.STATUS_CANCELED) | Q(status=Booking.STATUS_DECLINED)),
+    )
+    pending_by_day = _bookings_by_day(
+        bookings.filter(status=Booking.STATUS_REQUESTED), 'created_at', start,
+        pending=Count('id'),
+    )
+    trends = []
+    for day, label in days:
+        status_row = status_by_day.get(day, {})
+        trends.append({
+            'month': label,
+            'completed': status_row.get('completed', 0),
+            'cancelled': status_row.get('cancelled', 0),
+            'pending': pending_by_day.get(day, {}).get('pending', 0),
+        })
+    return trends
+
+
+def _booking_revenue_trends(bookings, trend_days):
+    """Daily paid revenue for the bookings revenue chart."""
+    start, days = _booking_trend_days(trend_days)
+    revenue_by_day = _bookings_by_day(
+        bookings.filter(payment_status='paid'), 'payment_date', start,
+        revenue=Sum('payment_amount'),
+    )
+    return [
+        {'date': label, 'revenue': float(revenue_by_day.get(day, {}).get('revenue') or 0)}
+        for day, label in days
+    ]
+
+
 # Super Admin - Bookings Management
 @login_required
 def super_admin_bookings(request):
@@ -7324,9 +7719,11 @@ def super_admin_bookings(request):
     trend_days = int(request.GET.get('trend_days', 30))
     service_days = request.GET.get('service_days', 'all')
     
-    # Get all bookings with related data
+    # Get all bookings with the related rows the bookings table renders
+    # (user, parish and service); no reverse relations are shown, so nothing
+    # needs prefetching and the unused category join is left out
     bookings = Booking.objects.select_related(
-        'user', 'church', 'service', 'service__category'
+        'user', 'church', 'service'
     ).order_by('-created_at')
     
     # Apply period filter for statistics
@@ -7337,28 +7734,33 @@ def super_admin_bookings(request):
     else:
         bookings_filtered = bookings
     
-    # Calculate statistics (use filtered bookings)
-    total_bookings = bookings_filtered.count()
-    completed_bookings = bookings_filtered.filter(status=Booking.STATUS_COMPLETED).count()
-    pending_bookings = bookings_filtered.filter(status=Booking.STATUS_REQUESTED).count()
-    reviewed_bookings = bookings_filtered.filter(status=Booking.STATUS_REVIEWED).count()
-    confirmed_bookings = bookings_filtered.filter(status=Booking.STATUS_APPROVED).count()
-    cancelled_bookings = bookings_filtered.filter(
-        Q(status=Booking.STATUS_CANCELED) | Q(status=Booking.STATUS_DECLINED)
-    ).count()
-    
-    # Calculate online paid bookings
-    online_paid_bookings = bookings_filtered.filter(payment_status='paid').count()
-    
-    # Calculate this week's bookings
+    # Calculate statistics (use filtered bookings) in one aggregate query
+    booking_stats = bookings_filtered.aggregate(
+        total=Count('id'),
+        completed=Count('id', filter=Q(status=Booking.STATUS_COMPLETED)),
+        pending=Count('id', filter=Q(status=Booking.STATUS_REQUESTED)),
+        reviewed=Count('id', filter=Q(status=Booking.STATUS_REVIEWED)),
+        confirmed=Count('id', filter=Q(status=Booking.STATUS_APPROVED)),
+        cancelled=Count('id', filter=Q(status=Booking.STATUS_CANCELED) | Q(status=Booking.STATUS_DECLINED)),
+        # Online paid bookings
+        online_paid=Count('id', filter=Q(payment_status='paid')),
+    )
+    total_bookings = booking_stats['total']
+    completed_bookings = booking_stats['completed']
+    pending_bookings = booking_stats['pending']
+    reviewed_bookings = booking_stats['reviewed']
+    confirmed_bookings = booking_stats['confirmed']
+    cancelled_bookings = booking_stats['cancelled']
+    online_paid_bookings = booking_stats['online_paid']
+    
+    # Calculate this week's bookings and online paid bookings
     week_ago = timezone.now() - timedelta(days=7)
-    this_week_bookings = bookings.filter(created_at__gte=week_ago).count()
-    
-    # Calculate this week's online paid bookings
-    this_week_paid_bookings = bookings.filter(
-        payment_status='paid',
-        payment_date__gte=week_ago
-    ).count()
+    week_stats = bookings.aggregate(
+        created=Count('id', filter=Q(created_at__gte=week_ago)),
+        paid=Count('id', filter=Q(payment_status='paid', payment_date__gte=week_ago)),
+    )
+    this_week_bookings = week_stats['created']
+    this_week_paid_bookings = week_stats['paid']
     
     # Calculate completion rate
     completion_rate = (completed_bookings / total_bookings * 100) if total_bookings > 0 else 0
@@ -7372,80 +7774,13 @@ def super_admin_bookings(request):
     # Calculate online payment rate
     online_payment_rate = (online_paid_bookings / total_bookings * 100) if total_bookings > 0 else 0
     
-    # Get booking trends (based on trend_days filter)
-    daily_trends = []
-    for i in range(trend_days - 1, -1, -1):
-        day = timezone.now() - timedelta(days=i)
-        day_start = day.replace(hour=0, minute=0, second=0, microsecond=0)
-        day_end = day_start + timedelta(days=1)
-        
-        completed = bookings.filter(
-            status=Booking.STATUS_COMPLETED,
-            updated_at__gte=day_start,
-            updated_at__lt=day_end
-        ).count()
-        
-        cancelled = bookings.filter(
-            Q(status=Booking.STATUS_CANCELED) | Q(status=Booking.STATUS_DECLINED),
-            updated_at__gte=day_start,
-            updated_at__lt=day_end
-        ).count()
-        
-        pending = bookings.filter(
-            status=Booking.STATUS_REQUESTED,
-            created_at__gte=day_start,
-            created_at__lt=day_end
-        ).count()
-        
-        # Format label based on days
-        if trend_days <= 7:
-            label = day.strftime('%a')  # Mon, Tue, etc.
-        elif trend_days <= 30:
-            label = day.strftime('%b %d')  # Jan 15
-        else:
-            label = day.strftime('%m/%d')  # 01/15
-        
-        daily_trends.append({
-            'month': label,
-            'completed': completed,
-            'cancelled': cancelled,
-            'pending': pending
-        })
+    # Get booking and revenue trends (based on trend_days filter)
+    daily_trends = _booking_status_trends(bookings, trend_days)
+    revenue_trends = _booking_revenue_trends(bookings, trend_days)
     
     monthly_trends = daily_trends
     
-    # Get revenue trend over time (based on trend_days filter)
-    from django.db.models import Sum
-    revenue_trends = []
-    for i in range(trend_days - 1, -1, -1):
-        day = timezone.now() - timedelta(days=i)
-        day_start = day.replace(hour=0, minute=0, second=0, microsecond=0)
-        day_end = day_start + timedelta(days=1)
-        
-        revenue = bookings.filter(
-            payment_status='paid',
-            payment_date__gte=day_start,
-            payment_date__lt=day_end
-        ).aggregate(total=Sum('payment_amount'))['total'] or 0
-        
-        # Format label based on days
-        if trend_days <= 7:
-            label = day.strftime('%a')  # Mon, Tue, etc.
-        elif trend_days <= 30:
-            label = day.strftime('%b %d')  # Jan 15
-        else:
-            label = day.strftime('%m/%d')  # 01/15
-        
-        revenue_trends.append({
-            'date': label,
-            'revenue': float(revenue)
-        })
-    
     # Get bookings by service category (based on service_days filter)
-    from core.models import ServiceCategory
-    category_stats = []
-    categories = ServiceCategory.objects.filter(is_active=True)
-    
     # Apply service days filter
     if service_days != 'all':
         service_period_days = int(service_days)
@@ -7454,55 +7789,28 @@ def super_admin_bookings(request):
     else:
         bookings_for_categories = bookings
     
-    for category in categories:
-        count = bookings_for_categories.filter(service__category=category).count()
-        if count > 0:
-            category_stats.append({
-                'name': category.name,
-                'count': count,
-                'color': category.color
-            })
-    
-    # Add uncategorized services
-    uncategorized_count = bookings_for_categories.filter(service__category__isnull=True).count()
-    if uncategorized_count > 0:
-        category_stats.append({
-            'name': 'Uncategorized',
-            'count': uncategorized_count,
-            'color': '#9CA3AF'
-        })
+    category_stats = _booking_category_stats(bookings_for_categories)
     
-    # Sort by count descending
-    category_stats = sorted(category_stats, key=lambda x: x['count'], reverse=True)[:5]
-    
-    # Get online paid bookings by parish (church) and revenue
-    from core.models import Church
-    from django.db.models import Sum
+    # Get online paid bookings by parish (church) and revenue in one grouped query
+    parish_rows = (
+        bookings_filtered.filter(payment_status='paid', church__is_active=True)
+        .order_by('church__name')
+        .values('church_id', 'church__name')
+        .annotate(count=Count('id'), revenue=Sum('payment_amount'))
+    )
     parish_paid_stats = []
     parish_revenue_stats = []
-    churches = Church.objects.filter(is_active=True).order_by('name')
-    
-    for church in churches:
-        paid_count = bookings_filtered.filter(
-            church=church,
-            payment_status='paid'
-        ).count()
-        if paid_count > 0:
-            parish_paid_stats.append({
-                'name': church.name,
-                'count': paid_count,
-                'color': '#3B82F6'  # Default blue color
-            })
-        
-        # Calculate revenue for this church
-        revenue = bookings_filtered.filter(
-            church=church,
-            payment_status='paid'
-        ).aggregate(total=Sum('payment_amount'))['total'] or 0
+    for row in parish_rows:
+        parish_paid_stats.append({
+            'name': row['church__name'],
+            'count': row['count'],
+            'color': '#3B82F6'  # Default blue color
+        })
         
+        revenue = row['revenue'] or 0
         if revenue > 0:
             parish_revenue_stats.append({
-                'name': church.name,
+                'name': row['church__name'],
                 'revenue': float(revenue),
                 'color': '#10B981'  # Green color for revenue
             })
@@ -7516,8 +7824,7 @@ def super_admin_bookings(request):
     parish_revenue_stats = list(reversed(parish_revenue_stats))
     
     # Paginate bookings (20 per page)
-    from django.core.paginator import Paginator
-    paginator = Paginator(bookings, 20)
+    paginator = FasterAdminPaginator(bookings, 20)
     page_number = request.GET.get('page', 1)
     page_obj = paginator.get_page(page_number)
 
@@ -7563,7 +7870,7 @@ def super_admin_bookings_chart_data(request):
     if not request.user.is_superuser:
         return JsonResponse({'error': 'Unauthorized'}, status=403)
     
-    from django.db.models import Count, Q, Sum
+    from django.db.models import Count, Q
     from datetime import datetime, timedelta
     import json
     
@@ -7579,49 +7886,10 @@ def super_admin_bookings_chart_data(request):
     
     # Booking Trends (daily aggregates)
     if chart == 'trends':
-        monthly_trends = []
-        for i in range(trend_days - 1, -1, -1):
-            day = timezone.now() - timedelta(days=i)
-            day_start = day.replace(hour=0, minute=0, second=0, microsecond=0)
-            day_end = day_start + timedelta(days=1)
-            
-            completed = bookings.filter(
-                status=Booking.STATUS_COMPLETED,
-                updated_at__gte=day_start,
-                updated_at__lt=day_end
-            ).count()
-            cancelled = bookings.filter(
-                Q(status=Booking.STATUS_CANCELED) | Q(status=Booking.STATUS_DECLINED),
-                updated_at__gte=day_start,
-                updated_at__lt=day_end
-            ).count()
-            pending = bookings.filter(
-                status=Booking.STATUS_REQUESTED,
-                created_at__gte=day_start,
-                created_at__lt=day_end
-            ).count()
-            
-            if trend_days <= 7:
-                label = day.strftime('%a')  # Mon, Tue, etc.
-            elif trend_days <= 30:
-                label = day.strftime('%b %d')  # Jan 15
-            else:
-                label = day.strftime('%m/%d')  # 01/15
-            
-            monthly_trends.append({
-                'month': label,
-                'completed': completed,
-                'cancelled': cancelled,
-                'pending': pending,
-            })
-        return JsonResponse({'monthly_trends': monthly_trends})
+        return JsonResponse({'monthly_trends': _booking_status_trends(bookings, trend_days)})
     
     # Bookings by Service Type
     if chart == 'serviceType':
-        from core.models import ServiceCategory
-        category_stats = []
-        categories = ServiceCategory.objects.filter(is_active=True)
-        
         if service_days != 'all':
             service_period_days = int(service_days)
             service_period_start = timezone.now() - timedelta(days=service_period_days)
@@ -7629,47 +7897,11 @@ def super_admin_bookings_chart_data(request):
         else:
             bookings_for_categories = bookings
         
-        for category in categories:
-            count = bookings_for_categories.filter(service__category=category).count()
-            if count > 0:
-                category_stats.append({
-                    'name': category.name,
-                    'count': count,
-                    'color': category.color,
-                })
-        # Add uncategorized services
-        uncategorized_count = bookings_for_categories.filter(service__category__isnull=True).count()
-        if uncategorized_count > 0:
-            category_stats.append({
-                'name': 'Uncategorized',
-                'count': uncategorized_count,
-                'color': '#9CA3AF',
-            })
-        category_stats = sorted(category_stats, key=lambda x: x['count'], reverse=True)[:5]
+        category_stats = _booking_category_stats(bookings_for_categories)
         return JsonResponse({'category_stats': category_stats})
     
     # Default: Revenue Trend Over Time (kept for backward compatibility)
-    revenue_trends = []
-    for i in range(trend_days - 1, -1, -1):
-        day = timezone.now() - timedelta(days=i)
-        day_start = day.replace(hour=0, minute=0, second=0, microsecond=0)
-        day_end = day_start + timedelta(days=1)
-        
-        revenue = bookings.filter(
-            payment_status='paid',
-            payment_date__gte=day_start,
-            payment_date__lt=day_end
-        ).aggregate(total=Sum('payment_amount'))['total'] or 0
-        
-        if trend_days <= 7:
-            label = day.strftime('%a')  # Mon, Tue, etc.
-        elif trend_days <= 30:
-            label = day.strftime('%b %d')  # Jan 15
-        else:
-            label = day.strftime('%m/%d')  # 01/15
-        
-        revenue_trends.append({'date': label, 'revenue': float(revenue)})
-    return JsonResponse({'revenue_trends': revenue_trends})
+    return JsonResponse({'revenue_trends': _booking_revenue_trends(bookings, trend_days)})
 
 
 # Super Admin - Export Bookings to Excel
@@ -7834,6 +8066,32 @@ def export_bookings_excel(request):
 
 
 # Super Admin - Donation Rankings
+
+# Donors fetched per chunk when building the donation rankings
+DONOR_CHUNK_SIZE = 500
+
+# User and profile columns read when building the donation rankings
+DONOR_ONLY_FIELDS = (
+    'id', 'username', 'first_name', 'last_name', 'email',
+    'profile__display_name', 'profile__show_donation_rank',
+)
+
+
+def _donor_chunks(donors):
+    """
+    Stream a donors queryset in chunks, yielding (chunk, rank_map) pairs.
+    Ranks are looked up once per chunk instead of once per donor.
+    """
+    from itertools import islice
+    from accounts.donation_utils import get_user_donation_ranks
+    donor_iter = donors.iterator(chunk_size=DONOR_CHUNK_SIZE)
+    while True:
+        chunk = list(islice(donor_iter, DONOR_CHUNK_SIZE))
+        if not chunk:
+            return
+        yield chunk, get_user_donation_ranks(chunk)
+
+
 @login_required
 def super_admin_donations(request):
     """Super Admin donations and rankings page."""
@@ -7841,9 +8099,9 @@ def super_admin_donations(request):
         messages.error(request, 'You do not have permission to access Super Admin.')
         return redirect('core:home')
     
-    from django.db.models import Sum, Count, Q
+    from django.db.models import Sum, Count, Max, Q, Case, When, Value, CharField
     from django.contrib.auth.models import User
-    from accounts.donation_utils import RANK_TIERS, get_user_donation_rank
+    from accounts.donation_utils import RANK_TIERS, RANK_TIERS_BY_ICON, RANK_TIERS_JSON, empty_rank_distribution
     from datetime import datetime, timedelta
     
     # Get filter parameters
@@ -7857,8 +8115,24 @@ def super_admin_donations(request):
         donations_made__payment_status='completed'
     ).annotate(
         total_donated=Sum('donations_made__amount', filter=Q(donations_made__payment_status='completed')),
-        donation_count=Count('donations_made', filter=Q(donations_made__payment_status='completed'))
-    ).filter(total_donated__gte=50).select_related('profile')
+        donation_count=Count('donations_made', filter=Q(donations_made__payment_status='completed')),
+        latest_donation=Max('donations_made__created_at', filter=Q(donations_made__payment_status='completed'))
+    ).filter(total_donated__gte=50).select_related('profile').only(
+        *DONOR_ONLY_FIELDS, 'profile__profile_image'
+    )
+    
+    # Rank icon from the all-time total (highest tier first), honouring the
+    # donor's show_donation_rank opt-out like get_user_donation_rank
+    donors = donors.annotate(
+        rank_icon=Case(
+            *[
+                When(profile__show_donation_rank=True, total_donated__gte=tier['min'], then=Value(tier['icon']))
+                for tier in reversed(RANK_TIERS)
+            ],
+            default=Value(''),
+            output_field=CharField(),
+        )
+    )
     
     # Apply time filter
     if time_filter != 'all':
@@ -7873,7 +8147,10 @@ def super_admin_donations(request):
             start_date = None
         
         if start_date:
-            donors = donors.filter(donations_made__created_at__gte=start_date)
+            # Subquery instead of a second join so the totals are not multiplied
+            donors = donors.filter(Exists(
+                Donation.objects.filter(donor=OuterRef('pk'), created_at__gte=start_date)
+            ))
     
     # Apply search filter
     if search_query:
@@ -7885,21 +8162,28 @@ def super_admin_donations(request):
             Q(profile__display_name__icontains=search_query)
         )
     
+    # Apply rank filter
+    if rank_filter != 'all':
+        donors = donors.filter(rank_icon=rank_filter)
+    
+    # Amount and date ordering happen in SQL; name ordering uses the display
+    # name resolved below, so it is sorted in Python
+    if sort_by == 'amount':
+        donors = donors.order_by('-total_donated')
+    elif sort_by == 'date':
+        donors = donors.order_by('-latest_donation')
+    
     # Build donor data with ranks
     donor_data = []
-    for donor in donors:
-        rank = get_user_donation_rank(donor)
-        
-        # Apply rank filter
-        if rank_filter != 'all' and (not rank or rank['icon'] != rank_filter):
-            continue
+    for donor in donors.iterator(chunk_size=DONOR_CHUNK_SIZE):
+        rank = RANK_TIERS_BY_ICON.get(donor.rank_icon)
         
         # Get user display name
-        display_name = donor.username
-        if hasattr(donor, 'profile') and donor.profile and donor.profile.display_name:
-            display_name = donor.profile.display_name
-        elif donor.get_full_name():
-            display_name = donor.get_full_name()
+        profile = getattr(donor, 'profile', None)
+        if profile and profile.display_name:
+            display_name = profile.display_name
+        else:
+            display_name = donor.get_full_name() or donor.username
         
         donor_data.append({
             'user': donor,
@@ -7907,22 +8191,12 @@ def super_admin_donations(request):
             'email': donor.email,
             'total_donated': donor.total_donated or 0,
             'donation_count': donor.donation_count or 0,
+            'latest_donation': donor.latest_donation,
             'rank': rank,
-            'show_rank': donor.profile.show_donation_rank if hasattr(donor, 'profile') and donor.profile else True
+            'show_rank': profile.show_donation_rank if profile else True
         })
     
-    # Sort donors
-    if sort_by == 'amount':
-        donor_data.sort(key=lambda x: x['total_donated'], reverse=True)
-    elif sort_by == 'date':
-        # Get latest donation date for each donor
-        for data in donor_data:
-            latest = data['user'].donations_made.filter(
-                payment_status='completed'
-            ).order_by('-created_at').first()
-            data['latest_donation'] = latest.created_at if latest else timezone.now()
-        donor_data.sort(key=lambda x: x['latest_donation'], reverse=True)
-    elif sort_by == 'name':
+    if sort_by == 'name':
         donor_data.sort(key=lambda x: x['display_name'].lower())
     
     # Calculate statistics
@@ -7930,14 +8204,7 @@ def super_admin_donations(request):
     total_donations_amount = sum(d['total_donated'] for d in donor_data)
     
     # Rank distribution
-    rank_distribution = {}
-    for tier in RANK_TIERS:
-        rank_distribution[tier['icon']] = {
-            'name': tier['name'],
-            'color': tier['color'],
-            'count': 0,
-            'total_amount': 0
-        }
+    rank_distribution = empty_rank_distribution()
     
     for data in donor_data:
         if data['rank']:
@@ -7948,27 +8215,24 @@ def super_admin_donations(request):
     # Top donors (top 10)
     top_donors = donor_data[:10]
     
-    # Serialize data for JavaScript charts
-    import json
-    from decimal import Decimal
-    
-    # Convert rank_distribution to JSON-safe format
+    # Serialize data for JavaScript charts; orjson_dumps encodes the
+    # Decimal amounts as numbers, so they are passed through as-is
     rank_distribution_json = {}
     for icon, data in rank_distribution.items():
         rank_distribution_json[icon] = {
             'name': data['name'],
             'color': data['color'],
             'count': data['count'],
-            'total_amount': float(data['total_amount']) if data['total_amount'] else 0
+            'total_amount': data['total_amount']
         }
     
-    # Convert donor_data to JSON-safe format
+    # Only the fields the charts read
     donor_data_json = []
     for data in donor_data:
         donor_data_json.append({
             'display_name': data['display_name'],
             'email': data['email'],
-            'total_donated': float(data['total_donated']) if data['total_donated'] else 0,
+            'total_donated': data['total_donated'],
             'donation_count': data['donation_count'],
             'rank': {
                 'name': data['rank']['name'],
@@ -7978,15 +8242,6 @@ def super_admin_donations(request):
             'show_rank': data['show_rank']
         })
     
-    # Convert rank_tiers to JSON-safe format
-    rank_tiers_json = []
-    for tier in RANK_TIERS:
-        rank_tiers_json.append({
-            'name': tier['name'],
-            'color': tier['color'],
-            'icon': tier['icon']
-        })
-    
     context = {
         'donor_data': donor_data,
         'total_donors': total_donors,
@@ -8000,9 +8255,9 @@ def super_admin_donations(request):
         'sort_by': sort_by,
         'active': 'super_admin_donations',
         # JSON data for charts
-        'rank_distribution_json': json.dumps(rank_distribution_json),
-        'donor_data_json': json.dumps(donor_data_json),
-        'rank_tiers_json': json.dumps(rank_tiers_json),
+        'rank_distribution_json': orjson_dumps(rank_distribution_json),
+        'donor_data_json': orjson_dumps(donor_data_json),
+        'rank_tiers_json': RANK_TIERS_JSON,
     }
     context.update(_app_context(request))
     
@@ -8017,7 +8272,7 @@ def super_admin_donations_filter_data(request):
     
     from django.db.models import Sum, Count, Q
     from django.contrib.auth.models import User
-    from accounts.donation_utils import RANK_TIERS, get_user_donation_rank
+    from accounts.donation_utils import RANK_TIERS, empty_rank_distribution
     from datetime import timedelta
     import json
     
@@ -8048,25 +8303,27 @@ def super_admin_donations_filter_data(request):
     donors = donors_query.annotate(
         total_donated=Sum('donations_made__amount', filter=donation_filter),
         donation_count=Count('donations_made', filter=donation_filter)
-    ).filter(total_donated__gte=50).select_related('profile')
+    ).filter(total_donated__gte=50).select_related('profile').only(*DONOR_ONLY_FIELDS)
     
-    # Build donor data with ranks
+    # Build donor data with ranks; donors are streamed in chunks and ranks
+    # (based on each donor's all-time total) are looked up per chunk
     donor_data = []
-    for donor in donors:
-        rank = get_user_donation_rank(donor)
-        
-        display_name = donor.username
-        if hasattr(donor, 'profile') and donor.profile and donor.profile.display_name:
-            display_name = donor.profile.display_name
-        elif donor.get_full_name():
-            display_name = donor.get_full_name()
-        
-        donor_data.append({
-            'display_name': display_name,
-            'total_donated': float(donor.total_donated or 0),
-            'donation_count': donor.donation_count or 0,
-            'rank': rank
-        })
+    for donor_chunk, rank_map in _donor_chunks(donors):
+        for donor in donor_chunk:
+            rank = rank_map[donor.id]
+            
+            profile = getattr(donor, 'profile', None)
+            if profile and profile.display_name:
+                display_name = profile.display_name
+            else:
+                display_name = donor.get_full_name() or donor.username
+            
+            donor_data.append({
+                'display_name': display_name,
+                'total_donated': float(donor.total_donated or 0),
+                'donation_count': donor.donation_count or 0,
+                'rank': rank
+            })
     
     # Sort by amount
     donor_data.sort(key=lambda x: x['total_donated'], reverse=True)
@@ -8077,14 +8334,7 @@ def super_admin_donations_filter_data(request):
     avg_donation = total_donations / total_donors if total_donors > 0 else 0
     
     # Rank distribution
-    rank_distribution = {}
-    for tier in RANK_TIERS:
-        rank_distribution[tier['icon']] = {
-            'name': tier['name'],
-            'color': tier['color'],
-            'count': 0,
-            'total_amount': 0
-        }
+    rank_distribution = empty_rank_distribution()
     
     for data in donor_data:
         if data['rank']:
@@ -8157,12 +8407,24 @@ def super_admin_parish_donations(request):
         payment_status='completed'
     ).select_related('post', 'post__church', 'donor')
     
-    # Calculate overall statistics
+    # Calculate overall and recent (last 30 days) statistics in one aggregate
+    thirty_days_ago = timezone.now() - timedelta(days=30)
+    recent = Q(created_at__gte=thirty_days_ago)
+    totals = donations.aggregate(
+        total=Sum('amount'),
+        count=Count('id'),
+        avg=Avg('amount'),
+        parishes=Count('post__church', distinct=True),
+        recent_total=Sum('amount', filter=recent),
+        recent_count=Count('id', filter=recent),
+    )
     stats = {
-        'total_donations': donations.aggregate(total=Sum('amount'))['total'] or 0,
-        'total_count': donations.count(),
-        'avg_donation': donations.aggregate(avg=Avg('amount'))['avg'] or 0,
-        'total_parishes': donations.values('post__church').distinct().count(),
+        'total_donations': totals['total'] or 0,
+        'total_count': totals['count'],
+        'avg_donation': totals['avg'] or 0,
+        'total_parishes': totals['parishes'],
+        'recent_donations': totals['recent_total'] or 0,
+        'recent_count': totals['recent_count'] or 0,
     }
     
     # Get donations by parish
@@ -8176,24 +8438,22 @@ def super_admin_parish_donations(request):
         avg_amount=Avg('amount')
     ).order_by('-total_amount')[:10]
     
-    # Get recent donations (last 30 days)
-    thirty_days_ago = timezone.now() - timedelta(days=30)
-    recent_stats = donations.filter(created_at__gte=thirty_days_ago).aggregate(
-        total=Sum('amount'),
-        count=Count('id')
+    # Get donation trends (last 7 days) from one grouped query
+    from django.db.models.functions import TruncDate
+    now = timezone.now()
+    trend_rows = (
+        donations.filter(created_at__date__gte=(now - timedelta(days=6)).date())
+        .annotate(day=TruncDate('created_at'))
+        .values('day')
+        .annotate(total=Sum('amount'))
+        .order_by()
     )
-    stats['recent_donations'] = recent_stats['total'] or 0
-    stats['recent_count'] = recent_stats['count'] or 0
-    
-    # Get donation trends (last 7 days)
+    totals_by_day = {row['day']: row['total'] for row in trend_rows}
     trend_data = []
     trend_labels = []
     for i in range(6, -1, -1):
-        date = timezone.now() - timedelta(days=i)
-        day_donations = donations.filter(
-            created_at__date=date.date()
-        ).aggregate(total=Sum('amount'))
-        trend_data.append(float(day_donations['total'] or 0))
+        date = now - timedelta(days=i)
+        trend_data.append(float(totals_by_day.get(date.date()) or 0))
         trend_labels.append(date.strftime('%b %d'))
     
     # Get payment method distribution
@@ -8227,6 +8487,27 @@ def super_admin_parish_donations(request):
     return render(request, 'core/super_admin_parish_donations.html', context)
 
 
+MODERATION_STATS_CACHE_KEY = 'super_admin_moderation_stats'
+MODERATION_STATS_CACHE_TIMEOUT = 60
+
+
+def invalidate_moderation_stats():
+    """Drop the cached moderation statistics (e.g. after a report is resolved)."""
+    cache.delete(MODERATION_STATS_CACHE_KEY)
+
+
+# Display names for report reason codes on the moderation chart
+REPORT_REASON_LABELS = {
+    'spam': 'Spam',
+    'inappropriate': 'Inappropriate Content',
+    'harassment': 'Harassment',
+    'violence': 'Violence',
+    'false_info': 'Misinformation',
+    'offensive': 'Suspicious Activity',
+    'other': 'Other'
+}
+
+
 # Super Admin - Moderation Management
 @login_required
 def super_admin_moderation(request):
@@ -8255,149 +8536,125 @@ def super_admin_moderation(request):
         status=ChurchVerificationRequest.STATUS_PENDING
     ).order_by('created_at')[:20]
     
-    # Calculate statistics
-    pending_post_reports = PostReport.objects.filter(status='pending').count()
-    pending_comment_reports = CommentReport.objects.filter(status='pending').count()
-    pending_reports = pending_post_reports + pending_comment_reports
-    
-    high_severity_reports = pending_reports  # You can add severity field later
-    
-    church_verifications = ChurchVerificationRequest.objects.filter(
-        status=ChurchVerificationRequest.STATUS_PENDING
-    ).count()
+    # Statistics and charts are site-wide, so they are shared by every admin
+    # and cached briefly; report and verification changes drop the entry
+    def compute_stats():
+        # Calculate statistics: every report figure, including the weekly chart
+        # buckets, comes from one conditional aggregate per report model
+        from django.db.models import Count, Q
     
-    # Resolved this week
-    seven_days_ago = timezone.now() - timedelta(days=7)
-    resolved_post_reports = PostReport.objects.filter(
-        status__in=['reviewed', 'dismissed', 'action_taken'],
-        reviewed_at__isnull=False,
-        reviewed_at__gte=seven_days_ago
-    ).count()
-    resolved_comment_reports = CommentReport.objects.filter(
-        status__in=['reviewed', 'dismissed', 'action_taken'],
-        reviewed_at__isnull=False,
-        reviewed_at__gte=seven_days_ago
-    ).count()
-    resolved_this_week = resolved_post_reports + resolved_comment_reports
+        now = timezone.now()
+        seven_days_ago = now - timedelta(days=7)
+        resolved_statuses = ['reviewed', 'dismissed', 'action_taken']
+        # Rolling 7-day windows for the last 4 weeks, oldest first
+        week_windows = [
+            (now - timedelta(days=(i + 1) * 7), now - timedelta(days=i * 7))
+            for i in range(3, -1, -1)
+        ]
+    
+        report_aggregates = {
+            'pending_count': Count('id', filter=Q(status='pending')),
+            'resolved_week_count': Count('id', filter=Q(
+                status__in=resolved_statuses,
+                reviewed_at__isnull=False,
+                reviewed_at__gte=seven_days_ago
+            )),
+            'total_count': Count('id'),
+            'resolved_count': Count('id', filter=Q(status__in=resolved_statuses)),
+        }
+        for n, (week_start, week_end) in enumerate(week_windows):
+            report_aggregates[f'new_{n}'] = Count('id', filter=Q(
+                created_at__gte=week_start,
+                created_at__lt=week_end
+            ))
+            report_aggregates[f'resolved_{n}'] = Count('id', filter=Q(
+                reviewed_at__gte=week_start,
+                reviewed_at__lt=week_end,
+                status__in=['reviewed', 'action_taken']
+            ))
+            report_aggregates[f'dismissed_{n}'] = Count('id', filter=Q(
+                reviewed_at__gte=week_start,
+                reviewed_at__lt=week_end,
+                status='dismissed'
+            ))
+    
+        post_report_stats = PostReport.objects.aggregate(**report_aggregates)
+        comment_report_stats = CommentReport.objects.aggregate(**report_aggregates)
+    
+        def combined(key):
+            return post_report_stats[key] + comment_report_stats[key]
+    
+        pending_post_reports = post_report_stats['pending_count']
+        pending_comment_reports = comment_report_stats['pending_count']
+        pending_reports = pending_post_reports + pending_comment_reports
+    
+        high_severity_reports = pending_reports  # You can add severity field later
+    
+        church_verifications = ChurchVerificationRequest.objects.filter(
+            status=ChurchVerificationRequest.STATUS_PENDING
+        ).count()
     
-    # Calculate resolution rate
-    total_post_reports = PostReport.objects.count()
-    total_comment_reports = CommentReport.objects.count()
-    total_reports = total_post_reports + total_comment_reports
+        # Resolved this week
+        resolved_this_week = combined('resolved_week_count')
     
-    resolved_post_reports_all = PostReport.objects.filter(
-        status__in=['reviewed', 'dismissed', 'action_taken']
-    ).count()
-    resolved_comment_reports_all = CommentReport.objects.filter(
-        status__in=['reviewed', 'dismissed', 'action_taken']
-    ).count()
-    resolved_reports = resolved_post_reports_all + resolved_comment_reports_all
+        # Calculate resolution rate
+        total_reports = combined('total_count')
+        resolved_reports = combined('resolved_count')
     
-    resolution_rate = int((resolved_reports / total_reports * 100)) if total_reports > 0 else 0
+        resolution_rate = int((resolved_reports / total_reports * 100)) if total_reports > 0 else 0
     
-    # Calculate weekly activity data for chart (last 4 weeks)
-    from django.db.models import Count, Q
-    from django.db.models.functions import TruncWeek
+        # Weekly activity data for chart (last 4 weeks)
+        weekly_activity = [
+            {
+                'new': combined(f'new_{n}'),
+                'resolved': combined(f'resolved_{n}'),
+                'dismissed': combined(f'dismissed_{n}'),
+            }
+            for n in range(len(week_windows))
+        ]
+    
+        # Calculate report reasons distribution; both tables are grouped and
+        # fetched together in a single UNION ALL query
+        post_reasons = PostReport.objects.values('reason').annotate(count=Count('id')).order_by()
+        comment_reasons = CommentReport.objects.values('reason').annotate(count=Count('id')).order_by()
+    
+        # Combine and aggregate reasons
+        reason_counts = {}
+        for report in post_reasons.union(comment_reasons, all=True):
+            reason = report['reason']
+            reason_counts[reason] = reason_counts.get(reason, 0) + report['count']
+    
+        report_reasons = {
+            'labels': [REPORT_REASON_LABELS.get(k, k.title()) for k in reason_counts.keys()],
+            'data': list(reason_counts.values())
+        }
     
-    weekly_activity = []
-    for i in range(3, -1, -1):  # Last 4 weeks
-        week_start = timezone.now() - timedelta(days=(i+1)*7)
-        week_end = timezone.now() - timedelta(days=i*7)
-        
-        # New reports this week
-        new_post_reports = PostReport.objects.filter(
-            created_at__gte=week_start,
-            created_at__lt=week_end
-        ).count()
-        new_comment_reports = CommentReport.objects.filter(
-            created_at__gte=week_start,
-            created_at__lt=week_end
-        ).count()
-        new_reports = new_post_reports + new_comment_reports
-        
-        # Resolved this week
-        resolved_post = PostReport.objects.filter(
-            reviewed_at__gte=week_start,
-            reviewed_at__lt=week_end,
-            status__in=['reviewed', 'action_taken']
-        ).count()
-        resolved_comment = CommentReport.objects.filter(
-            reviewed_at__gte=week_start,
-            reviewed_at__lt=week_end,
-            status__in=['reviewed', 'action_taken']
-        ).count()
-        resolved = resolved_post + resolved_comment
-        
-        # Dismissed this week
-        dismissed_post = PostReport.objects.filter(
-            reviewed_at__gte=week_start,
-            reviewed_at__lt=week_end,
-            status='dismissed'
-        ).count()
-        dismissed_comment = CommentReport.objects.filter(
-            reviewed_at__gte=week_start,
-            reviewed_at__lt=week_end,
-            status='dismissed'
-        ).count()
-        dismissed = dismissed_post + dismissed_comment
+        stats = {
+            'pending_reports': pending_reports,
+            'pending_post_reports': pending_post_reports,
+            'pending_comment_reports': pending_comment_reports,
+            'high_severity_reports': high_severity_reports,
+            'church_verifications': church_verifications,
+            'resolved_this_week': resolved_this_week,
+            'resolution_rate': resolution_rate,
+            'avg_response_time': '2.3',  # You can calculate this based on your data
+        }
         
-        weekly_activity.append({
-            'new': new_reports,
-            'resolved': resolved,
-            'dismissed': dismissed
-        })
-    
-    # Calculate report reasons distribution
-    post_reasons = PostReport.objects.values('reason').annotate(count=Count('id'))
-    comment_reasons = CommentReport.objects.values('reason').annotate(count=Count('id'))
-    
-    # Combine and aggregate reasons
-    reason_counts = {}
-    for report in post_reasons:
-        reason = report['reason']
-        reason_counts[reason] = reason_counts.get(reason, 0) + report['count']
-    
-    for report in comment_reasons:
-        reason = report['reason']
-        reason_counts[reason] = reason_counts.get(reason, 0) + report['count']
-    
-    # Map reason codes to display names
-    reason_labels = {
-        'spam': 'Spam',
-        'inappropriate': 'Inappropriate Content',
-        'harassment': 'Harassment',
-        'violence': 'Violence',
-        'false_info': 'Misinformation',
-        'offensive': 'Suspicious Activity',
-        'other': 'Other'
-    }
+        return {
+            'stats': stats,
+            'weekly_activity_json': orjson_dumps(weekly_activity),
+            'report_reasons_json': orjson_dumps(report_reasons),
+        }
     
-    report_reasons = {
-        'labels': [reason_labels.get(k, k.title()) for k in reason_counts.keys()],
-        'data': list(reason_counts.values())
-    }
+    summary = cache.get_or_set(MODERATION_STATS_CACHE_KEY, compute_stats, MODERATION_STATS_CACHE_TIMEOUT)
     
-    stats = {
-        'pending_reports': pending_reports,
-        'pending_post_reports': pending_post_reports,
-        'pending_comment_reports': pending_comment_reports,
-        'high_severity_reports': high_severity_reports,
-        'church_verifications': church_verifications,
-        'resolved_this_week': resolved_this_week,
-        'resolution_rate': resolution_rate,
-        'avg_response_time': '2.3',  # You can calculate this based on your data
-    }
-    
-    import json
     ctx = {
         'active': 'super_admin_moderation',
         'page_title': 'Moderation',
         'post_reports': post_reports,
         'comment_reports': comment_reports,
         'verifications': verifications,
-        'stats': stats,
-        'weekly_activity_json': json.dumps(weekly_activity),
-        'report_reasons_json': json.dumps(report_reasons),
+        **summary,
     }
     ctx.update(_app_context(request))
     return render(request, 'core/super_admin_moderation.html', ctx)
@@ -8417,7 +8674,24 @@ def super_admin_post_detail(request, post_id):
     views_count = getattr(post, 'view_count', 0)
 
     from datetime import timedelta
+    from django.db.models.functions import TruncDate
     today = timezone.now().date()
+    start_day = today - timedelta(days=13)
+
+    def counts_by_day(queryset, date_field):
+        rows = (
+            queryset.filter(**{f'{date_field}__date__gte': start_day})
+            .annotate(day=TruncDate(date_field))
+            .values('day')
+            .annotate(c=Count('id'))
+            .order_by()
+        )
+        return {row['day']: row['c'] for row in rows}
+
+    views_by_day = counts_by_day(PostView.objects.filter(post=post), 'viewed_at')
+    likes_by_day = counts_by_day(PostLike.objects.filter(post=post), 'created_at')
+    comments_by_day = counts_by_day(PostComment.objects.filter(post=post, is_active=True), 'created_at')
+
     daily_labels = []
     daily_views = []
     daily_likes = []
@@ -8425,37 +8699,37 @@ def super_admin_post_detail(request, post_id):
     for i in range(13, -1, -1):
         day = today - timedelta(days=i)
         daily_labels.append(day.strftime('%b %d'))
-        daily_views.append(PostView.objects.filter(post=post, viewed_at__date=day).count())
-        daily_likes.append(PostLike.objects.filter(post=post, created_at__date=day).count())
-        daily_comments.append(PostComment.objects.filter(post=post, is_active=True, created_at__date=day).count())
+        daily_views.append(views_by_day.get(day, 0))
+        daily_likes.append(likes_by_day.get(day, 0))
+        daily_comments.append(comments_by_day.get(day, 0))
 
-    donations = Donation.objects.filter(post=post, payment_status='completed').select_related('donor', 'donor__profile')
+    donations = Donation.objects.filter(post=post, payment_status='completed')
     from decimal import Decimal
-    from django.db.models import Sum
-    donations_total_amount = donations.aggregate(total=Sum('amount'))['total'] or Decimal('0.00')
-    donations_total_count = donations.count()
-    top_donors_data = {}
-    for d in donations:
-        if d.donor_id:
-            top_donors_data.setdefault(d.donor_id, Decimal('0.00'))
-            top_donors_data[d.donor_id] += d.amount
-    top_donor_ids = sorted(top_donors_data, key=top_donors_data.get, reverse=True)[:5]
+    donation_summary = donations.aggregate(total=Sum('amount'), count=Count('id'))
+    donations_total_amount = donation_summary['total'] or Decimal('0.00')
+    donations_total_count = donation_summary['count']
+    top_donor_rows = list(
+        donations.filter(donor__isnull=False)
+        .values('donor_id')
+        .annotate(total_donated=Sum('amount'))
+        .order_by('-total_donated', 'donor_id')[:5]
+    )
     top_donors = []
-    if top_donor_ids:
-        users = {u.id: u for u in User.objects.select_related('profile').filter(id__in=top_donor_ids)}
-        for uid in top_donor_ids:
-            u = users.get(uid)
+    if top_donor_rows:
+        users = User.objects.select_related('profile').in_bulk([row['donor_id'] for row in top_donor_rows])
+        for row in top_donor_rows:
+            u = users.get(row['donor_id'])
             if u:
-                setattr(u, 'total_donated', top_donors_data.get(uid))
+                setattr(u, 'total_donated', row['total_donated'])
                 top_donors.append(u)
 
     reports = list(PostReport.objects.filter(post=post).select_related('user').order_by('-created_at')[:20])
-    reports_status_counts = {
-        'pending': PostReport.objects.filter(post=post, status='pending').count(),
-        'reviewed': PostReport.objects.filter(post=post, status='reviewed').count(),
-        'dismissed': PostReport.objects.filter(post=post, status='dismissed').count(),
-        'action_taken': PostReport.objects.filter(post=post, status='action_taken').count(),
-    }
+    reports_status_counts = PostReport.objects.filter(post=post).aggregate(
+        pending=Count('id', filter=Q(status='pending')),
+        reviewed=Count('id', filter=Q(status='reviewed')),
+        dismissed=Count('id', filter=Q(status='dismissed')),
+        action_taken=Count('id', filter=Q(status='action_taken')),
+    )
     reasons_dist_qs = PostReport.objects.filter(post=post).values('reason').annotate(c=Count('id')).order_by('-c')
     reasons_distribution = list(reasons_dist_qs[:5])
 
@@ -8498,8 +8772,9 @@ def super_admin_post_detail(request, post_id):
 @login_required
 @require_POST
 def super_admin_toggle_post_active(request, post_id):
+    is_ajax = request.headers.get('X-Requested-With') == 'XMLHttpRequest'
     if not request.user.is_superuser:
-        if request.headers.get('X-Requested-With') == 'XMLHttpRequest':
+        if is_ajax:
             return JsonResponse({'success': False, 'message': 'Forbidden'}, status=403)
         messages.error(request, 'You do not have permission to perform this action.')
         return redirect('core:super_admin_posts')
@@ -8509,12 +8784,12 @@ def super_admin_toggle_post_active(request, post_id):
         post.is_active = not post.is_active
         post.save(update_fields=['is_active', 'updated_at'])
         msg = 'Post activated.' if post.is_active else 'Post deactivated.'
-        if request.headers.get('X-Requested-With') == 'XMLHttpRequest':
+        if is_ajax:
             return JsonResponse({'success': True, 'message': msg, 'is_active': post.is_active})
         messages.success(request, msg)
         return redirect(request.META.get('HTTP_REFERER') or 'core:super_admin_posts')
     except Exception:
-        if request.headers.get('X-Requested-With') == 'XMLHttpRequest':
+        if is_ajax:
             return JsonResponse({'success': False, 'message': 'Failed to toggle post.'}, status=500)
         messages.error(request, 'Failed to toggle post.')
         return redirect('core:super_admin_posts')
@@ -8523,8 +8798,9 @@ def super_admin_toggle_post_active(request, post_id):
 @login_required
 @require_POST
 def super_admin_delete_post(request, post_id):
+    is_ajax = request.headers.get('X-Requested-With') == 'XMLHttpRequest'
     if not request.user.is_superuser:
-        if request.headers.get('X-Requested-With') == 'XMLHttpRequest':
+        if is_ajax:
             return JsonResponse({'success': False, 'message': 'Forbidden'}, status=403)
         messages.error(request, 'You do not have permission to perform this action.')
         return redirect('core:super_admin_posts')
@@ -8534,12 +8810,12 @@ def super_admin_delete_post(request, post_id):
         post_type = post.post_type
         post.delete()
         msg = f'{"Event" if post_type == "event" else "Post"} deleted successfully.'
-        if request.headers.get('X-Requested-With') == 'XMLHttpRequest':
+        if is_ajax:
             return JsonResponse({'success': True, 'message': msg})
         messages.success(request, msg)
         return redirect(request.META.get('HTTP_REFERER') or 'core:super_admin_posts')
     except Exception:
-        if request.headers.get('X-Requested-With') == 'XMLHttpRequest':
+        if is_ajax:
             return JsonResponse({'success': False, 'message': 'Failed to delete post.'}, status=500)
         messages.error(request, 'Failed to delete post.')
         return redirect('core:super_admin_posts')
@@ -8550,21 +8826,18 @@ def super_admin_delete_post(request, post_id):
 @login_required
 def create_service_review(request, service_id):
     """Create a review for a service (only available to users with completed bookings)."""
-    from .models import ServiceReview, BookableService, UserInteraction, Booking
-    from django.http import JsonResponse
-    
+    is_ajax = request.headers.get('X-Requested-With') == 'XMLHttpRequest'
     service = get_object_or_404(BookableService, id=service_id, is_active=True)
     church = service.church
     
-    # Check if user has any completed bookings for this service
-    completed_bookings = Booking.objects.filter(
-        user=request.user,
-        service=service,
-        status=Booking.STATUS_COMPLETED
-    ).order_by('-updated_at')
+    # Check if user has any completed bookings for this service; the list is
+    # reused below to pick the booking the review is attached to
+    completed_bookings = list(
+        service.get_user_completed_bookings(request.user).only('id', 'updated_at')
+    )
     
-    if not completed_bookings.exists():
-        if request.headers.get('X-Requested-With') == 'XMLHttpRequest':
+    if not completed_bookings:
+        if is_ajax:
             return JsonResponse({
                 'success': False,
                 'message': 'You can only review services after completing a booking.'
@@ -8572,16 +8845,6 @@ def create_service_review(request, service_id):
         messages.error(request, 'You can only review services after completing a booking.')
         return redirect('core:church_detail', slug=church.slug)
     
-    # Check if user has already reviewed this service
-    if service.has_user_reviewed(request.user):
-        if request.headers.get('X-Requested-With') == 'XMLHttpRequest':
-            return JsonResponse({
-                'success': False,
-                'message': 'You have already reviewed this service.'
-            })
-        messages.warning(request, 'You have already reviewed this service.')
-        return redirect('core:church_detail', slug=church.slug)
-    
     if request.method == 'POST':
         try:
             # Get form data
@@ -8599,27 +8862,27 @@ def create_service_review(request, service_id):
             # Basic validation
             if not rating or rating < 1 or rating > 5:
                 error_msg = 'Please provide a rating between 1 and 5 stars.'
-                if request.headers.get('X-Requested-With') == 'XMLHttpRequest':
+                if is_ajax:
                     return JsonResponse({'success': False, 'message': error_msg})
                 messages.error(request, error_msg)
                 return redirect('core:church_detail', slug=church.slug)
             
             if not title or len(title) < 5:
                 error_msg = 'Please provide a review title with at least 5 characters.'
-                if request.headers.get('X-Requested-With') == 'XMLHttpRequest':
+                if is_ajax:
                     return JsonResponse({'success': False, 'message': error_msg})
                 messages.error(request, error_msg)
                 return redirect('core:church_detail', slug=church.slug)
             
             if not comment or len(comment) < 10:
                 error_msg = 'Please provide a review comment with at least 10 characters.'
-                if request.headers.get('X-Requested-With') == 'XMLHttpRequest':
+                if is_ajax:
                     return JsonResponse({'success': False, 'message': error_msg})
                 messages.error(request, error_msg)
                 return redirect('core:church_detail', slug=church.slug)
             
             # Use the most recent completed booking for this review
-            booking = completed_bookings.first()
+            booking = completed_bookings[0]
             
             # Create review
             review_data = {
@@ -8652,7 +8915,18 @@ def create_service_review(request, service_id):
                 except ValueError:
                     pass
             
-            review = ServiceReview.objects.create(**review_data)
+            # unique_together on (user, service) rejects a second review
+            try:
+                with transaction.atomic():
+                    review = ServiceReview.objects.create(**review_data)
+            except IntegrityError:
+                if is_ajax:
+                    return JsonResponse({
+                        'success': False,
+                        'message': 'You have already reviewed this service.'
+                    })
+                messages.warning(request, 'You have already reviewed this service.')
+                return redirect('core:church_detail', slug=church.slug)
             
             # Log activity
             UserInteraction.log_activity(
@@ -8669,7 +8943,7 @@ def create_service_review(request, service_id):
             )
             
             # Handle AJAX request
-            if request.headers.get('X-Requested-With') == 'XMLHttpRequest' or request.content_type == 'application/json':
+            if is_ajax or request.content_type == 'application/json':
                 return JsonResponse({
                     'success': True,
                     'message': f'Thank you for your review of {service.name}!'
@@ -8680,7 +8954,7 @@ def create_service_review(request, service_id):
             
         except Exception as e:
             error_message = f'Error creating review: {str(e)}'
-            if request.headers.get('X-Requested-With') == 'XMLHttpRequest':
+            if is_ajax:
                 return JsonResponse({
                     'success': False,
                     'message': error_message
@@ -8694,14 +8968,18 @@ def create_service_review(request, service_id):
 @login_required
 def service_reviews(request, service_id):
     """View all reviews for a specific service."""
-    from .models import ServiceReview, BookableService
-    
     service = get_object_or_404(BookableService, id=service_id, is_active=True)
     church = service.church
     
-    # Get all reviews for this service
+    # Get all reviews for this service, with helpful-vote counts joined in
     reviews = service.reviews.filter(is_active=True).select_related(
         'user', 'booking'
+    ).only(
+        'id', 'rating', 'title', 'comment', 'is_anonymous', 'helpful_votes', 'created_at',
+        'user__id', 'user__first_name', 'user__last_name', 'user__username',
+        'booking__id', 'booking__status', 'booking__updated_at',
+    ).annotate(
+        helpful_count=Count('helpful_votes_records')
     ).order_by('-created_at')
     
     # Check if current user has reviewed this service and can review
@@ -8711,16 +8989,21 @@ def service_reviews(request, service_id):
     if request.user.is_authenticated:
         try:
             user_review = reviews.filter(user=request.user).first()
-            can_review = service.can_user_review(request.user)
-            if can_review:
-                completed_bookings = service.get_user_completed_bookings(request.user)
+            # Users who already reviewed can't review again, so only look up
+            # bookings otherwise; the one query backs the flag and the list
+            if user_review is None:
+                completed_bookings = list(
+                    service.get_user_completed_bookings(request.user).only('id', 'updated_at')
+                ) or None
+                can_review = completed_bookings is not None
         except:
             pass
     
-    # Rating statistics
-    total_reviews = reviews.count()
-    average_rating = service.average_rating
-    rating_distribution = service.rating_distribution
+    # Rating statistics: count, average and per-star distribution in one query
+    rating_stats = service.rating_stats
+    total_reviews = rating_stats['count']
+    average_rating = rating_stats['avg']
+    rating_distribution = rating_stats['distribution']
     
     ctx = {
         'page_title': f'{service.name} Reviews',
@@ -8741,39 +9024,48 @@ def service_reviews(request, service_id):
 @login_required
 def toggle_review_helpful(request, review_id):
     """Toggle helpful vote for a review (AJAX)."""
-    from .models import ServiceReview, ServiceReviewHelpful
-    from django.http import JsonResponse
-    
     if request.method != 'POST':
         return JsonResponse({'success': False, 'error': 'POST required'})
     
     try:
         review = get_object_or_404(ServiceReview, id=review_id, is_active=True)
         
-        # Check if user has already voted
-        helpful_vote, created = ServiceReviewHelpful.objects.get_or_create(
-            user=request.user,
-            review=review
-        )
-        
-        if not created:
-            # Remove vote
-            helpful_vote.delete()
-            is_helpful = False
-            action = 'removed'
-        else:
-            # Add vote
-            is_helpful = True
-            action = 'added'
-        
-        # Update helpful votes count
-        review.helpful_votes = review.helpful_votes_records.count()
-        review.save(update_fields=['helpful_votes'])
+        with transaction.atomic():
+            # Lock this user's vote row; a concurrent toggle that holds it is
+            # skipped rather than waited on
+            existing = ServiceReviewHelpful.objects.select_for_update(skip_locked=True).filter(
+                user=request.user,
+                review=review
+            ).first()
+            
+            if existing:
+                # Remove vote
+                existing.delete()
+                delta = -1
+                is_helpful = False
+                action = 'removed'
+            else:
+                # Add vote; unique_together rejects a vote that a concurrent
+                # request is inserting, in which case the counter is left alone
+                try:
+                    with transaction.atomic():
+                        ServiceReviewHelpful.objects.create(user=request.user, review=review)
+                    delta = 1
+                except IntegrityError:
+                    delta = 0
+                is_helpful = True
+                action = 'added'
+            
+            # Adjust the denormalized counter in place instead of recounting
+            if delta:
+                ServiceReview.objects.filter(pk=review.pk).update(
+                    helpful_votes=F('helpful_votes') + delta
+                )
         
         return JsonResponse({
             'success': True,
             'is_helpful': is_helpful,
-            'helpful_count': review.helpful_votes,
+            'helpful_count': max(review.helpful_votes + delta, 0),
             'action': action,
         })
         
@@ -8786,20 +9078,24 @@ def service_images_api(request, service_id):
     try:
         service = get_object_or_404(BookableService, id=service_id)
         
-        # Get all images for the service
+        # Get all images for the service in one query; the primary is picked
+        # from the same list (same ordering as get_primary_image())
+        service_images = list(service.service_images.all().order_by('order', 'created_at'))
+        primary = next((si for si in service_images if si.is_primary), None)
+        
         images = []
         
         # Add primary image if exists
-        if service.get_primary_image():
+        if primary:
             images.append({
-                'url': service.get_primary_image().image.url,
+                'url': primary.image.url,
                 'is_primary': True
             })
         
         # Add all other service images
-        for service_image in service.service_images.all().order_by('order', 'created_at'):
+        for service_image in service_images:
             # Skip if this is already the primary image
-            if service.get_primary_image() and service_image == service.get_primary_image():
+            if primary and service_image.pk == primary.pk:
                 continue
                 
             images.append({
@@ -8830,8 +9126,6 @@ def service_images_api(request, service_id):
 
 def api_get_church_availability(request, church_id):
     """API endpoint to fetch church availability (closed dates) for booking modal."""
-    from django.http import JsonResponse
-    
     try:
         # Check if user is authenticated
         if not request.user.is_authenticated:
@@ -8844,28 +9138,29 @@ def api_get_church_availability(request, church_id):
         
         # Get all availability entries for the church
         # Only get future dates (today and onwards)
-        from datetime import date
         today = date.today()
-        availability_entries = church.availability.filter(date__gte=today).order_by('date')
+        availability_entries = church.availability.filter(date__gte=today).order_by('date').values(
+            'date', 'reason', 'notes', 'is_closed', 'start_time', 'end_time'
+        )
         
         # Prepare availability data
         closed_dates = []
         special_hours = []
         
         for entry in availability_entries:
-            date_str = entry.date.strftime('%Y-%m-%d')
+            date_str = entry['date'].isoformat()
             entry_data = {
                 'date': date_str,
-                'reason': entry.reason or '',
-                'notes': entry.notes or ''
+                'reason': entry['reason'] or '',
+                'notes': entry['notes'] or ''
             }
             
-            if entry.is_closed:
+            if entry['is_closed']:
                 closed_dates.append(entry_data)
             else:
                 entry_data.update({
-                    'start_time': entry.start_time.strftime('%H:%M') if entry.start_time else '',
-                    'end_time': entry.end_time.strftime('%H:%M') if entry.end_time else ''
+                    'start_time': entry['start_time'].isoformat(timespec='minutes') if entry['start_time'] else '',
+                    'end_time': entry['end_time'].isoformat(timespec='minutes') if entry['end_time'] else ''
                 })
                 special_hours.append(entry_data)
         
@@ -8893,9 +9188,6 @@ def api_get_church_availability(request, church_id):
 
 def api_get_pending_booking_dates(request, church_id):
     """API endpoint to fetch dates with pending bookings for the current user at a specific church."""
-    from django.http import JsonResponse
-    from datetime import date, timedelta
-    
     try:
         # Check if user is authenticated
         if not request.user.is_authenticated:
@@ -8918,10 +9210,10 @@ def api_get_pending_booking_dates(request, church_id):
             status__in=['pending', 'requested'],  # Handle both status values
             date__gte=today,
             date__lte=future_date
-        ).values_list('date', flat=True).distinct()
+        ).values_list('date', flat=True).order_by('date').distinct()
         
         # Convert dates to string format
-        pending_dates = [d.strftime('%Y-%m-%d') for d in pending_bookings]
+        pending_dates = [d.isoformat() for d in pending_bookings]
         
         return JsonResponse({
             'success': True,
@@ -8949,8 +9241,6 @@ def api_get_pending_booking_dates(request, church_id):
 @require_POST
 def dashboard_create_post(request):
     """Create a new post from the dashboard for one of user's owned churches."""
-    import json
-    
     try:
         # Get form data
         church_id = request.POST.get('church_id')
@@ -9039,25 +9329,29 @@ def dashboard_create_post(request):
             except (ValueError, TypeError):
                 pass
         
-        post = Post.objects.create(**post_data)
-        
-        # Handle multiple images
-        if images:
-            from .models import PostImage
-            for index, image_file in enumerate(images):
-                # Validate each image
-                if image_file.size > 10 * 1024 * 1024:  # 10MB limit per image
-                    continue  # Skip large images
-                
-                # Create PostImage record
-                PostImage.objects.create(
-                    post=post,
-                    image=image_file,
-                    order=index
-                )
+        # Drop oversized images up front so they are never opened or stored
+        valid_images = [
+            (index, image_file) for index, image_file in enumerate(images)
+            if image_file.size <= 10 * 1024 * 1024  # 10MB limit per image
+        ]
+        
+        with transaction.atomic():
+            post = Post.objects.create(**post_data)
+            
+            # Handle multiple images
+            if valid_images:
+                # bulk_create skips PostImage.save(), so optimize here the
+                # same way the model would before inserting in one batch
+                PostImage.objects.bulk_create([
+                    PostImage(
+                        post=post,
+                        image=PostImage.optimized_upload(image_file),
+                        order=index
+                    )
+                    for index, image_file in valid_images
+                ])
         
         # Log staff activity for post creation
-        from .models import StaffActivityLog
         log_staff_activity(
             user=request.user,
             church=church,
@@ -9084,8 +9378,6 @@ def dashboard_create_post(request):
         })
         
     except Exception as e:
-        import logging
-        logger = logging.getLogger(__name__)
         logger.error(f'Dashboard post creation error: {str(e)}')
         return JsonResponse({'success': False, 'message': 'An error occurred while creating the post.'}, status=500)
 
@@ -9094,17 +9386,8 @@ def dashboard_create_post(request):
 @require_POST
 def report_post(request, post_id):
     """Report a post for inappropriate content."""
-    from .models import PostReport
-    
     try:
-        post = get_object_or_404(Post, id=post_id)
-        
-        # Check if user already reported this post
-        if PostReport.objects.filter(user=request.user, post=post).exists():
-            return JsonResponse({
-                'success': False,
-                'message': 'You have already reported this post.'
-            }, status=400)
+        post = get_object_or_404(Post.objects.only('id'), id=post_id)
         
         # Get report data
         reason = request.POST.get('reason')
@@ -9122,13 +9405,21 @@ def report_post(request, post_id):
                 'message': 'Please provide additional details.'
             }, status=400)
         
-        # Create the report
-        report = PostReport.objects.create(
-            user=request.user,
-            post=post,
-            reason=reason,
-            description=description
-        )
+        # Create the report; unique_together on (user, post) rejects a second
+        # report from the same user
+        try:
+            with transaction.atomic():
+                PostReport.objects.create(
+                    user=request.user,
+                    post=post,
+                    reason=reason,
+                    description=description
+                )
+        except IntegrityError:
+            return JsonResponse({
+                'success': False,
+                'message': 'You have already reported this post.'
+            }, status=400)
         
         return JsonResponse({
             'success': True,
@@ -9136,8 +9427,6 @@ def report_post(request, post_id):
         })
         
     except Exception as e:
-        import logging
-        logger = logging.getLogger(__name__)
         logger.error(f'Post report error: {str(e)}')
         return JsonResponse({
             'success': False,
@@ -9150,7 +9439,7 @@ def report_post(request, post_id):
 def delete_post(request, post_id):
     """Delete a post."""
     try:
-        post = get_object_or_404(Post, id=post_id)
+        post = get_object_or_404(Post.objects.select_related('church__owner'), id=post_id)
         
         # Check if user can manage content (Owner or Ministry Leader)
         can_manage, role = user_can_manage_church(request.user, post.church, ['content'])
@@ -9172,8 +9461,6 @@ def delete_post(request, post_id):
         })
         
     except Exception as e:
-        import logging
-        logger = logging.getLogger(__name__)
         logger.error(f'Post deletion error: {str(e)}')
         return JsonResponse({
             'success': False,
@@ -9185,7 +9472,7 @@ def delete_post(request, post_id):
 def get_post_data(request, post_id):
     """Get post data for editing."""
     try:
-        post = get_object_or_404(Post, id=post_id)
+        post = get_object_or_404(Post.objects.select_related('church__owner'), id=post_id)
         
         # Check if user can manage content (Owner or Ministry Leader)
         can_manage, role = user_can_manage_church(request.user, post.church, ['content'])
@@ -9213,8 +9500,6 @@ def get_post_data(request, post_id):
         })
         
     except Exception as e:
-        import logging
-        logger = logging.getLogger(__name__)
         logger.error(f'Get post data error: {str(e)}')
         return JsonResponse({
             'success': False,
@@ -9227,7 +9512,7 @@ def get_post_data(request, post_id):
 def update_post(request, post_id):
     """Update an existing post."""
     try:
-        post = get_object_or_404(Post, id=post_id)
+        post = get_object_or_404(Post.objects.select_related('church__owner'), id=post_id)
         
         # Check if user can manage content (Owner or Ministry Leader)
         can_manage, role = user_can_manage_church(request.user, post.church, ['content'])
@@ -9299,7 +9584,6 @@ def update_post(request, post_id):
         post.save()
         
         # Log staff activity for post update
-        from .models import StaffActivityLog
         log_staff_activity(
             user=request.user,
             church=post.church,
@@ -9317,8 +9601,6 @@ def update_post(request, post_id):
         })
         
     except Exception as e:
-        import logging
-        logger = logging.getLogger(__name__)
         logger.error(f'Post update error: {str(e)}')
         return JsonResponse({
             'success': False,
@@ -9456,12 +9738,7 @@ def get_post_analytics(request, post_id):
                 initials = "U"
             
             # Get profile picture safely
-            profile_picture = None
-            try:
-                if hasattr(comment.user, 'profile') and comment.user.profile and comment.user.profile.profile_image:
-                    profile_picture = comment.user.profile.profile_image.url
-            except Exception:
-                profile_picture = None
+            profile_picture = _profile_pic_url(getattr(comment.user, 'profile', None))
             
             top_comments.append({
                 'user': {
@@ -9570,11 +9847,7 @@ def get_post_analytics(request, post_id):
                     else:
                         donor_name = donation.donor.get_full_name() or donation.donor.username
                         # Get profile image safely
-                        try:
-                            if hasattr(donation.donor, 'profile') and donation.donor.profile and donation.donor.profile.profile_image:
-                                profile_picture = donation.donor.profile.profile_image.url
-                        except Exception:
-                            profile_picture = None
+                        profile_picture = _profile_pic_url(getattr(donation.donor, 'profile', None))
                         # Generate initials
                         if donation.donor.first_name and donation.donor.last_name and len(donation.donor.first_name) > 0 and len(donation.donor.last_name) > 0:
                             initials = f"{donation.donor.first_name[0]}{donation.donor.last_name[0]}".upper()
@@ -9676,9 +9949,7 @@ def get_post_analytics(request, post_id):
         })
         
     except Exception as e:
-        import logging
         import traceback
-        logger = logging.getLogger(__name__)
         logger.error(f'Get post analytics error: {str(e)}')
         logger.error(f'Traceback: {traceback.format_exc()}')
         
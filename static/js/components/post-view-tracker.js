@@ -11,12 +11,15 @@ if (typeof window.PostViewTracker === 'undefined') {
             this.options = {
                 threshold: 0.5, // 50% of post must be visible
                 debounceTime: 1000, // Wait 1 second before tracking
+                batchDelay: 500, // Collect visible posts for 0.5s and send them together
                 ...options
             };
             
             this.trackedPosts = new Set();
             this.observer = null;
             this.debounceTimers = new Map();
+            this.pendingViews = new Map();
+            this.flushTimer = null;
             
             this.init();
         }
@@ -82,13 +85,79 @@ if (typeof window.PostViewTracker === 'undefined') {
             
             // Set debounce timer
             const timer = setTimeout(() => {
-                this.trackPostView(postId, postElement);
+                this.queuePostView(postId, postElement);
                 this.debounceTimers.delete(postId);
             }, this.options.debounceTime);
             
             this.debounceTimers.set(postId, timer);
         }
         
+        queuePostView(postId, postElement) {
+            // Mark as tracked immediately to prevent duplicates
+            this.trackedPosts.add(postId);
+            this.pendingViews.set(postId, postElement);
+            
+            if (!this.flushTimer) {
+                this.flushTimer = setTimeout(() => this.flushPendingViews(), this.options.batchDelay);
+            }
+        }
+        
+        async flushPendingViews() {
+            const batch = this.pendingViews;
+            this.pendingViews = new Map();
+            this.flushTimer = null;
+            
+            if (batch.size === 0) return;
+            
+            try {
+                const url = (window.djangoUrls && window.djangoUrls.trackPostViews)
+                  ? window.djangoUrls.trackPostViews
+                  : '/app/posts/views/';
+                
+                const response = await fetch(url, {
+                    method: 'POST',
+                    headers: {
+                        'Content-Type': 'application/json',
+                        'X-CSRFToken': this.getCSRFToken()
+                    },
+                    credentials: 'same-origin',
+                    body: JSON.stringify({ post_ids: Array.from(batch.keys()) })
+                });
+                
+                if (!response.ok) {
+                    const errorText = await response.text();
+                    throw new Error(`HTTP ${response.status}: ${errorText}`);
+                }
+                
+                const data = await response.json();
+                if (!data.success) {
+                    throw new Error(data.message);
+                }
+                
+                batch.forEach((postElement, postId) => {
+                    const view = data.views[postId];
+                    if (view) {
+                        this.updateViewCountUI(postElement, view.view_count);
+                    }
+                });
+                
+                if (window.DEBUG_POST_VIEW_TRACKER) {
+                    console.log(`[PostViewTracker] Tracked views for ${batch.size} posts:`, data.views);
+                }
+            } catch (error) {
+                // Remove from tracked set if tracking failed
+                batch.forEach((postElement, postId) => this.trackedPosts.delete(postId));
+                if (window.DEBUG_POST_VIEW_TRACKER) {
+                    console.error('[PostViewTracker] ❌ Error tracking batched views:', error);
+                }
+            }
+            
+            // Stop observing these posts either way to avoid repeated requests
+            if (this.observer) {
+                batch.forEach(postElement => this.observer.unobserve(postElement));
+            }
+        }
+        
         async trackPostView(postId, postElement) {
             try {
                 // Mark as tracked immediately to prevent duplicates
@@ -223,6 +292,12 @@ if (typeof window.PostViewTracker === 'undefined') {
             this.debounceTimers.forEach(timer => clearTimeout(timer));
             this.debounceTimers.clear();
             
+            // Send any views still waiting for the batch timer
+            if (this.flushTimer) {
+                clearTimeout(this.flushTimer);
+                this.flushPendingViews();
+            }
+            
             console.log('[PostViewTracker] Destroyed');
         }
     }